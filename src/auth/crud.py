@@ -1,9 +1,18 @@
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.models import TokenBlocklist
+from src.auth.revocation import revocation_cache
+from src.core.config import settings
+
+# 워터마크보다 조금 앞선 행부터 다시 읽어, 늦게 커밋된 행이나 같은 초에 추가된 행을 놓치지 않습니다.
+_SYNC_OVERLAP = timedelta(seconds=5)
 
 
 async def add_token_to_blocklist(
@@ -20,14 +29,156 @@ async def add_token_to_blocklist(
     db.add(blocklist_entry)
     await db.commit()
 
+    if settings.TOKEN_REVOCATION_CACHE_ENABLED:
+        revocation_cache.add(jti)
+
+
+async def add_tokens_to_blocklist(
+    db: AsyncSession,
+    entries: Sequence[tuple[str, datetime]],
+    skip_revoked: bool = False,
+) -> None:
+    """
+    여러 jti를 하나의 다중 행 INSERT와 한 번의 커밋으로 블락리스트에 추가합니다.
+    같은 토큰으로 동시에 들어온 요청이 먼저 폐기했다면 jti 기본 키 충돌이 발생합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param entries: (jti, 만료 시간) 목록
+    :param skip_revoked: True이면 이미 폐기된 jti는 건너뛰고 나머지만 추가 (로그아웃)
+    :raises HTTPException: skip_revoked가 False이고 이미 폐기된 jti가 있으면 401 에러 발생
+    """
+    if not entries:
+        return
+
+    values = [{"jti": jti, "expires_at": expires_at} for jti, expires_at in entries]
+    try:
+        await db.execute(insert(TokenBlocklist), values)
+        await db.commit()
+    except IntegrityError as err:
+        await db.rollback()
+        if not skip_revoked:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="이미 폐기된 토큰입니다.",
+            ) from err
+        # 행 단위로 다시 넣어 이미 폐기된 jti만 건너뜁니다.
+        for value in values:
+            try:
+                await db.execute(insert(TokenBlocklist), [value])
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()
+    finally:
+        # 충돌한 jti도 DB에는 폐기되어 있으므로 필터에 반영합니다.
+        if settings.TOKEN_REVOCATION_CACHE_ENABLED:
+            for jti, _ in entries:
+                revocation_cache.add(jti)
+
 
 async def is_token_blocked(db: AsyncSession, jti: str) -> bool:
     """
     jti가 블락리스트에 있는지 확인합니다.
+    폐기 캐시가 켜져 있으면 블룸 필터에 걸린 경우에만 DB를 조회합니다.
+    필터에 없더라도 다른 워커가 방금 폐기했을 수 있으므로, 필터를 먼저 DB와 동기화한 뒤 판단합니다.
 
     :param db: 비동기 데이터베이스 세션
     :param jti: 토큰의 고유 식별자 (jti)
     :return: 블락리스트에 있으면 True, 아니면 False
     """
-    result = await db.execute(select(TokenBlocklist).where(TokenBlocklist.jti == jti))
-    return result.scalars().first() is not None
+    if not settings.TOKEN_REVOCATION_CACHE_ENABLED:
+        result = await db.execute(
+            select(TokenBlocklist.jti).where(TokenBlocklist.jti == jti)
+        )
+        return result.first() is not None
+
+    started_at = time.perf_counter()
+    filter_hit = revocation_cache.might_contain(jti)
+    if not filter_hit:
+        await sync_revocation_cache(db, requested_at=started_at)
+        filter_hit = revocation_cache.might_contain(jti)
+    blocked = False
+    if filter_hit:
+        result = await db.execute(
+            select(TokenBlocklist.jti).where(TokenBlocklist.jti == jti)
+        )
+        blocked = result.first() is not None
+
+    revocation_cache.observe_lookup(
+        time.perf_counter() - started_at, filter_hit=filter_hit, blocked=blocked
+    )
+    return blocked
+
+
+async def sync_revocation_cache(db: AsyncSession, requested_at: float) -> None:
+    """
+    폐기 캐시의 워터마크 이후 블락리스트에 추가된 jti를 필터에 반영합니다.
+    requested_at 이후에 시작한 동기화가 이미 있으면 (설정한 허용 지연 이내이면) 조회하지 않으며,
+    동시에 호출한 요청들은 잠금을 기다렸다가 앞선 요청의 동기화 결과를 함께 사용합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param requested_at: 호출한 요청이 폐기 여부를 확인하기 시작한 시각 (time.perf_counter)
+    """
+    max_lag = settings.TOKEN_REVOCATION_CACHE_SYNC_SECONDS
+    if revocation_cache.is_synced_since(requested_at, max_lag):
+        return
+    async with revocation_cache.sync_lock:
+        if revocation_cache.is_synced_since(requested_at, max_lag):
+            return
+        synced_at = time.perf_counter()
+        entries = await get_blocked_jtis_since(db, since=revocation_cache.watermark)
+        revocation_cache.merge(entries, synced_at=synced_at)
+
+
+async def get_blocked_jtis_since(
+    db: AsyncSession, since: datetime | None = None
+) -> Sequence[tuple[str, datetime]]:
+    """
+    아직 만료되지 않은 블락리스트 항목의 (jti, created_at) 목록을 조회합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param since: 이 시각 무렵 이후에 추가된 항목만 조회 (None이면 전체)
+    :return: (jti, created_at) 목록
+    """
+    query = select(TokenBlocklist.jti, TokenBlocklist.created_at).where(
+        TokenBlocklist.expires_at > datetime.now(timezone.utc)
+    )
+    if since is not None:
+        query = query.where(TokenBlocklist.created_at >= since - _SYNC_OVERLAP)
+
+    result = await db.execute(query)
+    return [(row.jti, row.created_at) for row in result]
+
+
+async def purge_expired_tokens(
+    db: AsyncSession, before: datetime, chunk_size: int = 1000
+) -> tuple[int, int]:
+    """
+    만료 시간이 지난 블락리스트 항목을 chunk_size 단위로 나누어 삭제합니다.
+    청크마다 커밋해 긴 트랜잭션과 잠금을 피합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param before: 이 시각 이전에 만료된 항목을 삭제
+    :param chunk_size: 한 번에 삭제할 최대 행 수
+    :return: (삭제된 행 수, 실행한 청크 수)
+    """
+    purged = 0
+    chunks = 0
+    while True:
+        result = await db.execute(
+            select(TokenBlocklist.jti)
+            .where(TokenBlocklist.expires_at < before)
+            .limit(chunk_size)
+        )
+        jtis = result.scalars().all()
+        if not jtis:
+            break
+
+        await db.execute(delete(TokenBlocklist).where(TokenBlocklist.jti.in_(jtis)))
+        await db.commit()
+        purged += len(jtis)
+        chunks += 1
+
+        if len(jtis) < chunk_size:
+            break
+
+    return purged, chunks
@@ -1,17 +1,22 @@
-from typing import Annotated
+from typing import Annotated, Any, Literal
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, Path, Request, status
 from fastapi.openapi.models import APIKey, APIKeyIn
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.security.base import SecurityBase
 from jose import JWTError, jwt
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth import crud as auth_crud
-from src.auth.schemas import TokenData
+from src.auth.schemas import TokenClaims
+from src.auth.token_cache import claims_cache
 from src.core.config import settings
+from src.db import routing as db_routing
+from src.db.ids import canonical_uuid
 from src.db.session import get_async_db
-from src.users import crud, models
+from src.users import models
+from src.users.dependencies import UserLoader, get_user_loader
 
 
 class RefreshTokenBearer(SecurityBase):
@@ -52,49 +57,162 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 refreshTokenBearer = RefreshTokenBearer()
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_async_db)],
-) -> models.User:
+def decode_token(
+    token: str, kind: Literal["access", "refresh"], verify_exp: bool = True
+) -> dict[str, Any]:
     """
-    JWT 토큰을 디코딩하여 현재 인증된 사용자를 반환합니다.
+    JWT 토큰의 서명과 만료 시간을 검증하고 클레임을 반환합니다.
+    검증된 클레임은 캐시에 보관되어 같은 토큰의 반복 요청 시 재사용됩니다.
 
-    :param token: OAuth2PasswordBearer에서 추출한 JWT 액세스 토큰
-    :param db: 비동기 데이터베이스 세션
-    :return: 인증된 사용자 모델
-    :raises HTTPException: 인증 실패 시 401 에러 발생
+    :param token: JWT 문자열
+    :param kind: 토큰 종류 ("access" 또는 "refresh")
+    :param verify_exp: 만료 시간 검증 여부 (로그아웃 시 False)
+    :return: 검증된 클레임
+    :raises JWTError: 토큰이 유효하지 않은 경우
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="유효하지 않은 인증 정보입니다.",
-        headers={"WWW-Authenticate": "Bearer"},
+    if settings.TOKEN_CLAIMS_CACHE_ENABLED:
+        cached = claims_cache.get(token, kind)
+        if cached is not None:
+            return cached
+
+    secret_key = (
+        settings.SECRET_KEY if kind == "access" else settings.REFRESH_SECRET_KEY
     )
+    payload = jwt.decode(
+        token,
+        secret_key,
+        algorithms=[settings.ALGORITHM],
+        options={"verify_exp": verify_exp},
+    )
+
+    # 만료 검증을 생략한 결과는 캐시에 넣지 않습니다.
+    if settings.TOKEN_CLAIMS_CACHE_ENABLED and verify_exp:
+        claims_cache.set(token, kind, payload)
+    return payload
+
 
+def _parse_claims(
+    token: str, kind: Literal["access", "refresh"], verify_exp: bool = True
+) -> TokenClaims | None:
+    """
+    토큰을 디코딩해 TokenClaims로 변환합니다. 유효하지 않으면 None을 반환합니다.
+    """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        return TokenClaims.model_validate(decode_token(token, kind, verify_exp))
+    except (JWTError, ValidationError):
+        return None
+
+
+async def get_access_token_claims(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> TokenClaims:
+    """
+    액세스 토큰을 한 번 디코딩해 클레임을 반환합니다.
+    같은 요청 안에서는 FastAPI 의존성 캐시로 결과가 공유됩니다.
+
+    :param token: OAuth2PasswordBearer에서 추출한 JWT 액세스 토큰
+    :return: 검증된 토큰 클레임
+    :raises HTTPException: 토큰이 유효하지 않은 경우 401 에러 발생
+    """
+    claims = _parse_claims(token, "access")
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 정보입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
         )
+    return claims
 
-        user_id: str | None = payload.get("sub")
-        jti: str | None = payload.get("jti")
-        if user_id is None or jti is None:
-            raise credentials_exception
 
-        if await auth_crud.is_token_blocked(db, jti=jti):
-            raise credentials_exception
+async def get_refresh_token_claims(
+    token: Annotated[str, Depends(refreshTokenBearer)],
+) -> TokenClaims:
+    """
+    리프레시 토큰을 한 번 디코딩해 클레임을 반환합니다.
+    같은 요청 안에서는 FastAPI 의존성 캐시로 결과가 공유됩니다.
+
+    :param token: X-Refresh-Token 헤더에서 추출한 JWT 리프레시 토큰
+    :return: 검증된 토큰 클레임
+    :raises HTTPException: 토큰이 유효하지 않은 경우 401 에러 발생
+    """
+    claims = _parse_claims(token, "refresh")
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 정보입니다.",
+        )
+    return claims
 
-        token_data = TokenData(user_id=user_id, roles=payload.get("roles"))
 
-    except JWTError:
-        raise credentials_exception from None
+async def get_optional_access_token_claims(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> TokenClaims | None:
+    """
+    만료 여부와 관계없이 액세스 토큰의 클레임을 반환합니다. 로그아웃에 사용됩니다.
 
-    user = await crud.get_user(db=db, user_id=token_data.user_id)
-    if user is None:
+    :param token: OAuth2PasswordBearer에서 추출한 JWT 액세스 토큰
+    :return: 토큰 클레임 또는 유효하지 않은 경우 None
+    """
+    return _parse_claims(token, "access", verify_exp=False)
+
+
+async def get_optional_refresh_token_claims(
+    token: Annotated[str, Depends(refreshTokenBearer)],
+) -> TokenClaims | None:
+    """
+    만료 여부와 관계없이 리프레시 토큰의 클레임을 반환합니다. 로그아웃에 사용됩니다.
+
+    :param token: X-Refresh-Token 헤더에서 추출한 JWT 리프레시 토큰
+    :return: 토큰 클레임 또는 유효하지 않은 경우 None
+    """
+    return _parse_claims(token, "refresh", verify_exp=False)
+
+
+async def _get_user_for_claims(
+    db: AsyncSession,
+    loader: UserLoader,
+    claims: TokenClaims,
+    credentials_exception: HTTPException,
+) -> models.User:
+    """
+    토큰 클레임으로 사용자를 조회하고 폐기 여부와 토큰 버전을 확인합니다.
+    복제 지연으로 폐기된 토큰이 통과하지 않도록 조회 전용 라우트에서도 주 DB에서 조회합니다.
+    """
+    with db_routing.primary_reads():
+        if await auth_crud.is_token_blocked(db, jti=claims.jti):
+            raise credentials_exception
+
+        user = await loader.get(claims.sub)
+    # 토큰 버전이 다르면 비밀번호 변경 등으로 일괄 폐기된 토큰입니다.
+    if user is None or user.token_version != claims.ver:
         raise credentials_exception
 
+    db_routing.identify_user(user.id, user.last_write_at)
     return user
 
 
+async def get_current_user(
+    claims: Annotated[TokenClaims, Depends(get_access_token_claims)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    loader: Annotated[UserLoader, Depends(get_user_loader)],
+) -> models.User:
+    """
+    액세스 토큰 클레임으로 현재 인증된 사용자를 반환합니다.
+
+    :param claims: 검증된 액세스 토큰 클레임
+    :param db: 비동기 데이터베이스 세션
+    :param loader: 요청 단위 사용자 로더
+    :return: 인증된 사용자 모델
+    :raises HTTPException: 인증 실패 시 401 에러 발생
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="유효하지 않은 인증 정보입니다.",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    return await _get_user_for_claims(db, loader, claims, credentials_exception)
+
+
 async def get_current_active_user(
     current_user: Annotated[models.User, Depends(get_current_user)],
 ) -> models.User:
@@ -113,15 +231,58 @@ async def get_current_active_user(
     return current_user
 
 
+async def require_admin(
+    current_user: Annotated[models.User, Depends(get_current_active_user)],
+) -> models.User:
+    """
+    관리자만 접근할 수 있는 라우트의 권한 의존성입니다.
+    대상 사용자를 조회하는 의존성보다 앞에 선언해, 권한이 없으면 DB 조회 없이 거절합니다.
+
+    :param current_user: 활성화된 현재 사용자 모델
+    :return: 관리자인 현재 사용자 모델
+    :raises HTTPException: 관리자가 아닌 경우 403 에러 발생
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
+    return current_user
+
+
+async def require_self_or_admin(
+    current_user: Annotated[models.User, Depends(get_current_active_user)],
+    user_id: str = Path(),
+) -> models.User:
+    """
+    본인 또는 관리자만 접근할 수 있는 라우트의 권한 의존성입니다.
+    경로의 user_id만으로 판단하므로 대상 사용자를 조회하기 전에 거절할 수 있습니다.
+
+    :param current_user: 활성화된 현재 사용자 모델
+    :param user_id: 경로 매개변수의 대상 사용자 ID
+    :return: 현재 사용자 모델
+    :raises HTTPException: 본인도 관리자도 아닌 경우 403 에러 발생
+    """
+    # 저장된 ID는 표준 형식이므로 대소문자/표기만 다른 본인 ID도 본인으로 판단합니다.
+    if current_user.id != canonical_uuid(user_id) and not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="요청한 사용자에 대한 권한이 없습니다.",
+        )
+    return current_user
+
+
 async def get_current_user_from_refresh_token(
-    token: Annotated[str, Depends(refreshTokenBearer)],
+    claims: Annotated[TokenClaims, Depends(get_refresh_token_claims)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
+    loader: Annotated[UserLoader, Depends(get_user_loader)],
 ) -> models.User:
     """
-    리프레시 토큰을 디코딩하여 현재 인증된 사용자를 반환합니다.
+    리프레시 토큰 클레임으로 현재 인증된 사용자를 반환합니다.
 
-    :param token: OAuth2PasswordBearer에서 추출한 JWT 리프레시 토큰
+    :param claims: 검증된 리프레시 토큰 클레임
     :param db: 비동기 데이터베이스 세션
+    :param loader: 요청 단위 사용자 로더
     :return: 인증된 사용자 모델
     :raises HTTPException: 인증 실패 시 401 에러 발생
     """
@@ -129,25 +290,4 @@ async def get_current_user_from_refresh_token(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="유효하지 않은 인증 정보입니다.",
     )
-
-    try:
-        payload = jwt.decode(
-            token, settings.REFRESH_SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id: str | None = payload.get("sub")
-        jti: str | None = payload.get("jti")
-        if user_id is None or jti is None:
-            raise credentials_exception
-
-        if await auth_crud.is_token_blocked(db, jti=jti):
-            raise credentials_exception
-
-        token_data = TokenData(user_id=user_id, roles=payload.get("roles"))
-    except JWTError:
-        raise credentials_exception from None
-
-    user = await crud.get_user(db=db, user_id=token_data.user_id)
-    if user is None:
-        raise credentials_exception
-
-    return user
+    return await _get_user_for_claims(db, loader, claims, credentials_exception)
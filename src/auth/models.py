@@ -1,9 +1,11 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from src.db.base import Base
+from src.db.types import BinaryUUID, SecondsDateTime
 
 
 class TokenBlocklist(Base):
@@ -14,9 +16,14 @@ class TokenBlocklist(Base):
 
     __tablename__ = "token_blocklist"
 
-    jti: Mapped[str] = mapped_column(
-        String(36), primary_key=True, index=True, nullable=False
-    )
+    # 기본 키 자체가 인덱스이므로 별도 인덱스를 두지 않고, 16바이트로 저장합니다.
+    jti: Mapped[str] = mapped_column(BinaryUUID(), primary_key=True)
+    # 만료된 항목 정리 시 범위 조회에 사용됩니다.
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False
+        DateTime(timezone=True), index=True, nullable=False
+    )
+    # 다른 워커가 추가한 jti만 골라 폐기 캐시에 반영할 때 범위 조회에 사용합니다.
+    # 워커마다 시계가 다를 수 있으므로 DB 시각으로 채웁니다.
+    created_at: Mapped[datetime] = mapped_column(
+        SecondsDateTime, server_default=func.now(), index=True, nullable=False
     )
@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import math
+from datetime import datetime
+from typing import Iterable
+
+from src.core.config import settings
+
+
+class BloomFilter:
+    """
+    문자열 집합의 포함 여부를 근사적으로 판별하는 블룸 필터입니다.
+    False는 확실히 없음을, True는 있을 수도 있음을 의미합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(1, capacity)
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # 더블 해싱: 하나의 다이제스트에서 k개의 비트 위치를 만듭니다.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+class RevocationCache:
+    """
+    폐기된 토큰 jti의 인메모리 캐시입니다.
+    블룸 필터에 없는 jti는 DB 조회 없이 유효한 토큰으로 판단하고,
+    필터에 걸린 경우에만 DB에서 실제 폐기 여부를 확인합니다.
+
+    만료된 jti는 주기적으로 DB에서 필터를 다시 만들 때 제거됩니다.
+
+    필터는 워커 프로세스마다 따로 있으므로, 다른 워커가 폐기한 jti는 DB의 created_at 기준
+    워터마크 이후 행을 가져와(merge) 반영합니다. 필터에 없다는 판단은 요청 시작 이후
+    (또는 TOKEN_REVOCATION_CACHE_SYNC_SECONDS 이내)에 동기화한 필터에서만 믿습니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._size = 0
+        self._pending: list[str] | None = None
+        self.loaded = False
+        # 필터에 반영한 가장 최근 행의 created_at (DB 시각)과 마지막 동기화 시작 시각 (perf_counter)
+        self.watermark: datetime | None = None
+        self.synced_at = float("-inf")
+        # 동시에 들어온 요청들이 동기화 조회 하나를 함께 기다리도록 합니다.
+        self.sync_lock = asyncio.Lock()
+        self.syncs = 0
+
+        self.lookups = 0
+        self.filter_hits = 0
+        self.filter_misses = 0
+        self.false_positives = 0
+        self.lookup_seconds_total = 0.0
+        self.lookup_seconds_max = 0.0
+
+    def begin_reload(self) -> None:
+        """
+        DB에서 필터를 다시 읽기 시작합니다.
+        읽는 동안 추가된 jti는 rebuild 시 새 필터에도 반영됩니다.
+        """
+        self._pending = []
+
+    def rebuild(
+        self, entries: Iterable[tuple[str, datetime]], synced_at: float
+    ) -> None:
+        """
+        주어진 jti 목록으로 필터를 새로 만들어 교체합니다.
+
+        :param entries: 아직 만료되지 않은 폐기 토큰의 (jti, created_at) 목록
+        :param synced_at: DB를 읽기 시작한 시각 (time.perf_counter)
+        """
+        entries = list(entries)
+        items = [jti for jti, _ in entries]
+        items.extend(self._pending or [])
+        new_filter = BloomFilter(max(self.capacity, len(items) * 2), self.error_rate)
+        for jti in items:
+            new_filter.add(jti)
+
+        self._filter = new_filter
+        self._size = len(items)
+        self._pending = None
+        self.watermark = max((created_at for _, created_at in entries), default=None)
+        self.synced_at = synced_at
+        self.loaded = True
+
+    def merge(self, entries: Iterable[tuple[str, datetime]], synced_at: float) -> None:
+        """
+        마지막 동기화 이후 DB에 추가된 jti(다른 워커가 폐기한 토큰 포함)를 필터에 더합니다.
+
+        :param entries: 워터마크 이후 추가된 (jti, created_at) 목록
+        :param synced_at: DB를 읽기 시작한 시각 (time.perf_counter)
+        """
+        for jti, created_at in entries:
+            if jti not in self._filter:
+                self.add(jti)
+            if self.watermark is None or created_at > self.watermark:
+                self.watermark = created_at
+        self.synced_at = max(self.synced_at, synced_at)
+        self.syncs += 1
+
+    def is_synced_since(self, requested_at: float, max_lag_seconds: float) -> bool:
+        """
+        requested_at(에서 max_lag_seconds를 뺀 시각) 이후에 시작한 동기화가 반영되었는지 반환합니다.
+        """
+        return self.synced_at >= requested_at - max_lag_seconds
+
+    def add(self, jti: str) -> None:
+        """
+        새로 폐기된 jti를 필터에 추가합니다.
+        """
+        self._filter.add(jti)
+        self._size += 1
+        if self._pending is not None:
+            self._pending.append(jti)
+
+    def might_contain(self, jti: str) -> bool:
+        """
+        jti가 폐기되었을 가능성이 있는지 반환합니다.
+        필터가 아직 로드되지 않았다면 항상 True를 반환해 DB를 조회하게 합니다.
+        """
+        if not self.loaded:
+            return True
+        return jti in self._filter
+
+    def observe_lookup(self, seconds: float, filter_hit: bool, blocked: bool) -> None:
+        """
+        블락리스트 조회 결과와 소요 시간을 기록합니다.
+        """
+        self.lookups += 1
+        self.lookup_seconds_total += seconds
+        self.lookup_seconds_max = max(self.lookup_seconds_max, seconds)
+        if filter_hit:
+            self.filter_hits += 1
+            if not blocked:
+                self.false_positives += 1
+        else:
+            self.filter_misses += 1
+
+    def metrics(self) -> dict[str, float | int | bool | str | None]:
+        """
+        캐시 적중/미적중 횟수와 조회 지연 시간 지표를 반환합니다.
+        """
+        return {
+            "loaded": self.loaded,
+            "size": self._size,
+            "syncs": self.syncs,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "num_bits": self._filter.num_bits,
+            "lookups": self.lookups,
+            "filter_hits": self.filter_hits,
+            "filter_misses": self.filter_misses,
+            "false_positives": self.false_positives,
+            "lookup_seconds_avg": (
+                self.lookup_seconds_total / self.lookups if self.lookups else 0.0
+            ),
+            "lookup_seconds_max": self.lookup_seconds_max,
+        }
+
+
+revocation_cache = RevocationCache(
+    capacity=settings.TOKEN_REVOCATION_CACHE_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_CACHE_ERROR_RATE,
+)
@@ -1,12 +1,12 @@
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth import dependencies, schemas, service
+from src.auth.token_cache import claims_cache
 from src.core.config import settings
 from src.db.session import get_async_db
 from src.users import models
@@ -47,10 +47,7 @@ async def login_for_access_token(
     access_token_expiry = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expiry = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
 
-    token_data = {
-        "sub": str(user.id),
-        "roles": "admin" if user.is_admin else "user",
-    }
+    token_data = service.build_token_data(user)
     access_token = service.create_access_token(
         data=token_data, expires_delta=access_token_expiry
     )
@@ -76,42 +73,30 @@ async def refresh_token(
     current_user: Annotated[
         models.User, Depends(dependencies.get_current_user_from_refresh_token)
     ],
+    claims: Annotated[
+        schemas.TokenClaims, Depends(dependencies.get_refresh_token_claims)
+    ],
     old_refresh_token: Annotated[str, Depends(dependencies.refreshTokenBearer)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     리프레시 토큰으로 새로운 리프레시 토큰과 액세스 토큰을 발급하는 엔드포인트입니다.
+    리프레시 토큰은 요청당 한 번만 디코딩되며, 클레임은 의존성 간에 공유됩니다.
+    같은 리프레시 토큰으로 동시에 요청하면 먼저 폐기한 요청만 새 토큰을 받고 나머지는 401을 받습니다.
 
     :param current_user: 현재 인증된 사용자 모델
+    :param claims: 기존 리프레시 토큰의 클레임
     :param old_refresh_token: 기존 리프레시 토큰
     :param db: 비동기 데이터베이스 세션
     :return: 새로운 JWT 액세스 토큰과 리프레시 토큰
     """
-    try:
-        payload = jwt.decode(
-            old_refresh_token,
-            settings.REFRESH_SECRET_KEY,
-            algorithms=settings.ALGORITHM,
-        )
-        old_jti = payload.get("jti")
-        old_exp = payload.get("exp")
-        if old_jti and old_exp:
-            expires_at = datetime.fromtimestamp(old_exp, tz=timezone.utc)
-            await service.logout_user(db=db, jti=old_jti, expires_at=expires_at)
-    except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유효하지 않은 리프레시 토큰입니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from None
+    await service.revoke_tokens(db=db, claims=[claims])
+    claims_cache.invalidate(old_refresh_token)
 
     access_token_expiry = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expiry = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
 
-    token_data = {
-        "sub": str(current_user.id),
-        "roles": "admin" if current_user.is_admin else "user",
-    }
+    token_data = service.build_token_data(current_user)
     new_access_token = service.create_access_token(
         data=token_data, expires_delta=access_token_expiry
     )
@@ -136,48 +121,34 @@ async def logout(
     db: Annotated[AsyncSession, Depends(get_async_db)],
     access_token: Annotated[str, Depends(dependencies.oauth2_scheme)],
     refresh_token: Annotated[str, Depends(dependencies.refreshTokenBearer)],
+    access_claims: Annotated[
+        schemas.TokenClaims | None,
+        Depends(dependencies.get_optional_access_token_claims),
+    ],
+    refresh_claims: Annotated[
+        schemas.TokenClaims | None,
+        Depends(dependencies.get_optional_refresh_token_claims),
+    ],
 ):
     """
     현재 사용자의 액세스 토큰을 블락리스트에 추가하여 로그아웃 처리하는 엔드포인트입니다.
+    토큰이 유효하지 않은 경우, 이미 인증 불가능이므로 예외를 발생시키지 않습니다.
 
     :param db: 비동기 데이터베이스 세션
     :param access_token: OAuth2 액세스 토큰
     :param refresh_token: OAuth2 리프레시 토큰
-    :raises HTTPException: 유효하지 않은 토큰인 경우 401 에러 발생
+    :param access_claims: 액세스 토큰 클레임 (유효하지 않으면 None)
+    :param refresh_claims: 리프레시 토큰 클레임 (유효하지 않으면 None)
     """
-    try:
-        payload = jwt.decode(
-            access_token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False},
-        )
-        jti = payload.get("jti")
-        exp = payload.get("exp")
-
-        if jti and exp:
-            expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
-            await service.logout_user(db=db, jti=jti, expires_at=expires_at)
-
-    except JWTError:
-        # 토큰이 유효하지 않은 경우, 이미 인증 불가능이므로 예외를 발생시키지 않습니다.
-        pass
-
-    try:
-        payload = jwt.decode(
-            refresh_token,
-            settings.REFRESH_SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False},
-        )
-        jti = payload.get("jti")
-        exp = payload.get("exp")
-
-        if jti and exp:
-            expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
-            await service.logout_user(db=db, jti=jti, expires_at=expires_at)
+    # 두 토큰을 하나의 INSERT와 한 번의 커밋으로 폐기합니다.
+    # 이미 로그아웃한 토큰으로 다시 요청해도 실패하지 않도록 폐기된 토큰은 건너뜁니다.
+    await service.revoke_tokens(
+        db=db,
+        claims=[c for c in (access_claims, refresh_claims) if c is not None],
+        skip_revoked=True,
+    )
 
-    except JWTError:
-        pass
+    claims_cache.invalidate(access_token)
+    claims_cache.invalidate(refresh_token)
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
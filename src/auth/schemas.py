@@ -1,4 +1,7 @@
-from pydantic import BaseModel, ConfigDict, Field
+import uuid
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Token(BaseModel):
@@ -24,24 +27,54 @@ class Token(BaseModel):
     )
 
 
-class TokenData(BaseModel):
+class TokenClaims(BaseModel):
     """
-    JWT 토큰에서 사용자 정보를 추출하기 위한 모델
+    검증된 JWT 토큰의 클레임을 표현하는 모델
     """
 
-    user_id: str = Field(
+    sub: str = Field(
         ...,
         description="사용자 고유 ID",
         examples=["123e4567-e89b-12d3-a456-426614174000"],
     )
-
+    jti: str = Field(
+        ...,
+        description="토큰 고유 식별자",
+        examples=["0b6f4a8e-5c1d-4f7a-9a47-2f1f0c3d9e21"],
+    )
+    exp: int = Field(..., description="만료 시각 (Unix 타임스탬프)")
     roles: str | None = Field(
         None,
         description="사용자 역할 (예: 'user', 'admin')",
         examples=["user", "admin"],
     )
+    ver: int = Field(0, description="토큰 발급 시점의 사용자 토큰 버전")
 
     model_config = ConfigDict(
-        validate_assignment=True,  # 할당 시 유효성 검사
-        extra="forbid",  # 정의되지 않은 필드는 허용하지 않음
+        frozen=True,  # 여러 의존성이 공유하므로 변경 불가
+        extra="ignore",  # iat 등 나머지 클레임은 무시
     )
+
+    @field_validator("jti")
+    @classmethod
+    def validate_jti(cls, value: str) -> str:
+        # 블락리스트는 jti를 16바이트 UUID로 저장하므로, UUID가 아닌 jti는 유효하지 않은 토큰으로 봅니다.
+        # 표준 형식으로 맞춰 블락리스트/폐기 캐시의 키가 표기와 관계없이 같도록 합니다.
+        try:
+            return str(uuid.UUID(value))
+        except ValueError as err:
+            raise ValueError("jti는 UUID 형식이어야 합니다.") from err
+
+    @property
+    def expires_at(self) -> datetime:
+        return datetime.fromtimestamp(self.exp, tz=timezone.utc)
+
+
+class BlocklistPurgeReport(BaseModel):
+    """
+    만료된 블락리스트 항목 정리 결과를 표현하는 모델
+    """
+
+    purged: int = Field(..., description="삭제된 행 수", examples=[1200])
+    chunks: int = Field(..., description="삭제를 나누어 실행한 횟수", examples=[2])
+    elapsed_seconds: float = Field(..., description="소요 시간 (초)", examples=[0.42])
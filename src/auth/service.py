@@ -1,14 +1,17 @@
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import cast
+from typing import Sequence, cast
 
 from fastapi import HTTPException, status
 from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth import crud as auth_crud
+from src.auth import schemas
+from src.auth.revocation import revocation_cache
 from src.core.config import settings
-from src.core.security import verify_password
+from src.core.security import verify_password_async
 from src.users import crud, models
 
 
@@ -56,12 +59,27 @@ async def authenticate_user(
             detail="사용자가 비활성화되었습니다.",
         )
 
-    if not verify_password(password, cast(str, db_user.hashed_password)):
+    if not await verify_password_async(password, cast(str, db_user.hashed_password)):
         return None
 
     return db_user
 
 
+def build_token_data(user: models.User) -> dict:
+    """
+    사용자 정보로 JWT 페이로드에 포함될 데이터를 만듭니다.
+    ver 클레임은 사용자의 토큰 버전으로, 버전이 바뀌면 해당 토큰은 무효가 됩니다.
+
+    :param user: 토큰을 발급할 사용자 모델
+    :return: JWT 페이로드 데이터
+    """
+    return {
+        "sub": str(user.id),
+        "roles": "admin" if user.is_admin else "user",
+        "ver": user.token_version or 0,
+    }
+
+
 def create_access_token(
     data: dict,
     expires_delta: timedelta | None = None,
@@ -113,3 +131,59 @@ async def logout_user(db: AsyncSession, jti: str, expires_at: datetime) -> None:
     :param expires_at: 토큰의 만료 시간
     """
     await auth_crud.add_token_to_blocklist(db=db, jti=jti, expires_at=expires_at)
+
+
+async def revoke_tokens(
+    db: AsyncSession,
+    claims: Sequence[schemas.TokenClaims],
+    skip_revoked: bool = False,
+) -> None:
+    """
+    여러 토큰을 한 번의 DB 왕복으로 블락리스트에 추가합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param claims: 폐기할 토큰들의 클레임
+    :param skip_revoked: True이면 이미 폐기된 토큰은 건너뜀 (로그아웃)
+    :raises HTTPException: skip_revoked가 False이고 이미 폐기된 토큰이 있으면 401 에러 발생
+    """
+    await auth_crud.add_tokens_to_blocklist(
+        db=db,
+        entries=[(c.jti, c.expires_at) for c in claims],
+        skip_revoked=skip_revoked,
+    )
+
+
+async def refresh_revocation_cache(db: AsyncSession) -> None:
+    """
+    DB의 블락리스트로 토큰 폐기 캐시를 다시 만듭니다.
+    만료된 jti는 이 과정에서 필터에서 제거됩니다.
+
+    :param db: 비동기 데이터베이스 세션
+    """
+    revocation_cache.begin_reload()
+    synced_at = time.perf_counter()
+    entries = await auth_crud.get_blocked_jtis_since(db=db)
+    revocation_cache.rebuild(entries, synced_at=synced_at)
+
+
+async def purge_expired_blocklist(
+    db: AsyncSession, chunk_size: int | None = None
+) -> schemas.BlocklistPurgeReport:
+    """
+    만료된 블락리스트 항목을 정리하고 결과를 반환합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param chunk_size: 한 번에 삭제할 최대 행 수 (기본값: 설정값)
+    :return: 삭제된 행 수와 소요 시간
+    """
+    started_at = time.perf_counter()
+    purged, chunks = await auth_crud.purge_expired_tokens(
+        db=db,
+        before=datetime.now(timezone.utc),
+        chunk_size=chunk_size or settings.TOKEN_BLOCKLIST_PURGE_CHUNK_SIZE,
+    )
+    return schemas.BlocklistPurgeReport(
+        purged=purged,
+        chunks=chunks,
+        elapsed_seconds=time.perf_counter() - started_at,
+    )
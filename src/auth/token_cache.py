@@ -0,0 +1,92 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.core.config import settings
+
+
+class VerifiedClaimsCache:
+    """
+    서명 검증을 마친 JWT 클레임을 보관하는 LRU/TTL 캐시입니다.
+    같은 토큰이 반복해서 들어오면 jwt.decode를 다시 수행하지 않습니다.
+
+    키는 토큰 종류와 토큰 문자열의 SHA-256 다이제스트이며,
+    각 항목은 토큰의 exp 또는 TTL 중 더 이른 시각에 만료됩니다.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str, kind: str) -> bytes:
+        return hashlib.sha256(f"{kind}:{token}".encode()).digest()
+
+    def get(self, token: str, kind: str) -> dict[str, Any] | None:
+        """
+        캐시된 클레임을 반환합니다. 없거나 만료되었다면 None을 반환합니다.
+
+        :param token: JWT 문자열
+        :param kind: 토큰 종류 ("access" 또는 "refresh")
+        :return: 검증된 클레임 또는 None
+        """
+        key = self._key(token, kind)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, token: str, kind: str, claims: dict[str, Any]) -> None:
+        """
+        검증된 클레임을 저장합니다. exp가 없는 토큰은 TTL까지만 보관합니다.
+
+        :param token: JWT 문자열
+        :param kind: 토큰 종류 ("access" 또는 "refresh")
+        :param claims: jwt.decode로 검증된 클레임
+        """
+        expires_at = time.time() + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        key = self._key(token, kind)
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """
+        토큰의 캐시 항목을 모든 종류에 대해 제거합니다. 로그아웃 시 호출됩니다.
+        """
+        for kind in ("access", "refresh"):
+            self._entries.pop(self._key(token, kind), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def metrics(self) -> dict[str, int]:
+        """
+        캐시 크기와 적중/미적중 횟수를 반환합니다.
+        """
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+claims_cache = VerifiedClaimsCache(
+    max_size=settings.TOKEN_CLAIMS_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TOKEN_CLAIMS_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,32 @@
+import base64
+import json
+from typing import Any
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """
+    정렬 키 값을 클라이언트에 전달할 불투명한 커서 문자열로 인코딩합니다.
+
+    :param values: 마지막 항목의 정렬 키 값 (JSON 직렬화 가능해야 함)
+    :return: URL-safe base64 커서 문자열
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    encode_cursor로 만든 커서 문자열을 정렬 키 값으로 디코딩합니다.
+
+    :param cursor: 커서 문자열
+    :return: 정렬 키 값 목록
+    :raises ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as err:
+        raise ValueError("유효하지 않은 커서입니다.") from err
+    if not isinstance(values, list):
+        raise ValueError("유효하지 않은 커서입니다.")
+    return values
@@ -1,5 +1,9 @@
+from typing import Generic, TypeVar
+
 from pydantic import BaseModel, ConfigDict
 
+T = TypeVar("T")
+
 
 class AppBaseModel(BaseModel):
     """
@@ -16,8 +20,12 @@ class AppBaseModel(BaseModel):
     )
 
 
-# 만약 페이지네이션 응답과 같이 다른 곳에서도 공통으로 쓰일 스키마가 있다면
-# 이곳에 추가할 수 있습니다.
-# class PaginatedResponse(BaseModel):
-#     total: int
-#     items: list
+class PaginatedResponse(BaseModel, Generic[T]):
+    """
+    커서 기반 페이지네이션 응답의 공통 스키마입니다.
+    next_cursor를 다음 요청의 cursor로 전달하면 이어지는 페이지를 조회합니다.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    total: int | None = None  # 전체 항목 수 (캐시된 값일 수 있음)
@@ -1,5 +1,15 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from src.core.config import settings
+
 # 암호화 해싱 알고리즘과 정책 정의
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -28,3 +38,197 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return pwd_context.verify(plain_password, hashed_password)
     except Exception:
         return False
+
+
+# bcrypt 연산은 수백 ms 동안 CPU를 점유하므로 이벤트 루프 밖의 워커 풀에서 실행합니다.
+# 프로세스 풀은 이벤트 루프와 스레드가 실행 중인 서버를 fork하지 않도록 spawn으로 만듭니다.
+_executor: Executor | None = None
+_bulk_executor: Executor | None = None
+_lock = threading.Lock()
+
+
+class _HashingMetrics:
+    """
+    비밀번호 해싱 워커 풀의 상태를 집계하는 클래스입니다.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def snapshot(self) -> dict[str, float | int]:
+        workers = settings.PASSWORD_HASH_MAX_WORKERS
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": max(0, self.in_flight - workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "wait_seconds_avg": (
+                self.wait_seconds_total / self.completed if self.completed else 0.0
+            ),
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+
+_metrics = _HashingMetrics()
+
+
+def _get_executor() -> Executor:
+    """
+    설정에 따라 스레드 풀 또는 프로세스 풀을 생성해 반환합니다.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+                    mp_context=get_context("spawn"),
+                )
+            else:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+                    thread_name_prefix="password-hash",
+                )
+        return _executor
+
+
+def get_bulk_hashing_executor() -> Executor:
+    """
+    일괄 가입용 해싱 프로세스 풀을 반환합니다. 처음 호출할 때 만들고 이후에는 재사용합니다.
+    요청 처리용 해싱 풀과 분리해 대량 해싱이 로그인/가입 요청의 대기열을 차지하지 않게 합니다.
+    """
+    global _bulk_executor
+    with _lock:
+        if _bulk_executor is None:
+            _bulk_executor = ProcessPoolExecutor(
+                max_workers=settings.BULK_IMPORT_HASH_WORKERS,
+                mp_context=get_context("spawn"),
+            )
+        return _bulk_executor
+
+
+def shutdown_hashing_executor() -> None:
+    """
+    해싱 워커 풀(일괄 가입용 포함)을 종료합니다. 애플리케이션 종료 시 호출됩니다.
+    """
+    global _executor, _bulk_executor
+    with _lock:
+        for executor in (_executor, _bulk_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        _executor = _bulk_executor = None
+
+
+def get_hashing_metrics() -> dict[str, float | int]:
+    """
+    해싱 워커 풀의 대기열 깊이, 대기 시간 등 지표를 반환합니다.
+    """
+    with _lock:
+        return _metrics.snapshot()
+
+
+def _run_timed(func: Callable[..., Any], *args: Any) -> tuple[Any, float]:
+    # 워커에서 실제 실행이 시작된 시각을 함께 반환해 대기 시간을 계산합니다.
+    started_at = time.monotonic()
+    return func(*args), started_at
+
+
+def _on_done(_: Future) -> None:
+    with _lock:
+        _metrics.in_flight -= 1
+
+
+async def _run_in_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    주어진 함수를 해싱 워커 풀에서 실행하고 결과를 기다립니다.
+
+    :param func: 워커에서 실행할 함수
+    :param args: 함수 인자
+    :return: 함수 실행 결과
+    :raises HTTPException: 대기열이 가득 찼거나 제한 시간을 초과한 경우 503 에러 발생
+    """
+    capacity = settings.PASSWORD_HASH_MAX_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+    with _lock:
+        if _metrics.in_flight >= capacity:
+            _metrics.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+            )
+        _metrics.in_flight += 1
+
+    submitted_at = time.monotonic()
+    try:
+        future = _get_executor().submit(_run_timed, func, *args)
+    except Exception:
+        with _lock:
+            _metrics.in_flight -= 1
+        raise
+    future.add_done_callback(_on_done)
+
+    try:
+        result, started_at = await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        future.cancel()
+        with _lock:
+            _metrics.timeouts += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="비밀번호 처리 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요.",
+        ) from None
+
+    wait_seconds = max(0.0, started_at - submitted_at)
+    with _lock:
+        _metrics.completed += 1
+        _metrics.wait_seconds_total += wait_seconds
+        _metrics.wait_seconds_max = max(_metrics.wait_seconds_max, wait_seconds)
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    비밀번호를 워커 풀에서 해싱합니다. 비동기 코드에서는 이 함수를 사용합니다.
+
+    :param password: 해싱할 비밀번호
+    :return: 해싱된 비밀번호
+    """
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 일치 여부를 워커 풀에서 검증합니다. 비동기 코드에서는 이 함수를 사용합니다.
+
+    :param plain_password: 평문 비밀번호
+    :param hashed_password: 해싱된 비밀번호
+    :return: 비밀번호가 일치하면 True, 그렇지 않으면 False
+    """
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+async def hash_passwords_bulk(
+    passwords: Sequence[str], executor: Executor
+) -> list[str]:
+    """
+    여러 비밀번호를 주어진 워커 풀에서 병렬로 해싱합니다. 대량 가입에 사용됩니다.
+    요청 처리용 해싱 풀의 대기열을 차지하지 않도록 호출자가 별도의 풀을 전달합니다.
+
+    :param passwords: 해싱할 비밀번호 목록
+    :param executor: 해싱을 실행할 워커 풀 (보통 ProcessPoolExecutor)
+    :return: 입력 순서와 같은 순서의 해싱된 비밀번호 목록
+    """
+    loop = asyncio.get_running_loop()
+    return list(
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, hash_password, p) for p in passwords)
+        )
+    )
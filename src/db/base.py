@@ -1,11 +1,82 @@
+from typing import Any
+
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from src.core.config import settings
+from src.db.pool import InstrumentedAsyncQueuePool, instrument_pool
+from src.db.routing import RoutingSession
+from src.db.slow_queries import instrument_slow_queries
+
+# create_async_engine에서 사용할 수 있는 MySQL 드라이버 (poetry install -E asyncmy 또는 -E aiomysql)
+ASYNC_MYSQL_DRIVERS = ("asyncmy", "aiomysql")
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """
+    DB URL에 맞는 엔진/커넥션 풀 옵션을 반환합니다.
+    SQLite 인메모리 DB는 커넥션마다 DB가 새로 만들어지므로 기본 풀을 그대로 사용합니다.
+
+    :param database_url: 데이터베이스 URL
+    :return: create_async_engine에 전달할 옵션
+    :raises ValueError: 비동기 엔진에 사용할 수 없는 MySQL 드라이버인 경우
+    """
+    url = make_url(database_url)
+    # MySQL 비동기 드라이버는 서버 측 prepared statement를 쓰지 않으므로
+    # 컴파일된 SQL을 재사용하는 SQLAlchemy 문장 캐시 크기로 조정합니다.
+    options: dict[str, Any] = {"query_cache_size": settings.DB_QUERY_CACHE_SIZE}
+
+    if url.get_backend_name() == "mysql":
+        if url.get_driver_name() not in ASYNC_MYSQL_DRIVERS:
+            raise ValueError(
+                f"MySQL 드라이버 '{url.get_driver_name()}'는 비동기 엔진에 사용할 수 없습니다. "
+                f"{' 또는 '.join(f'mysql+{driver}' for driver in ASYNC_MYSQL_DRIVERS)} "
+                "URL을 사용하세요."
+            )
+        # URL에 charset이 없으면 4바이트 문자(이모지 등)까지 저장할 수 있도록 지정합니다.
+        if "charset" not in url.query:
+            options["connect_args"] = {"charset": settings.DB_MYSQL_CHARSET}
+
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL)
+)
+instrument_pool(engine)
+instrument_slow_queries(engine)
+
+# 읽기 전용 세션의 쿼리를 받을 복제본 엔진 (설정하지 않으면 주 DB만 사용)
+replica_engine = (
+    create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        **_engine_options(settings.DATABASE_REPLICA_URL),
+    )
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+if replica_engine is not None:
+    instrument_slow_queries(replica_engine)
 
-engine = create_async_engine(settings.DATABASE_URL)
 AsyncSessionLocal = async_sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=replica_engine.sync_engine if replica_engine is not None else None,
+    expire_on_commit=False,
+    autoflush=False,
 )
 
 Base = declarative_base()
@@ -0,0 +1,86 @@
+import os
+import threading
+import time
+import uuid
+from typing import Literal
+
+IdStrategy = Literal["uuid4", "uuid7"]
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+_COUNTER_BITS = 12  # UUIDv7의 rand_a 영역을 같은 밀리초 안의 순번으로 사용
+
+
+def uuid7(unix_ms: int | None = None) -> uuid.UUID:
+    """
+    시간 순으로 정렬되는 UUIDv7(RFC 9562)을 생성합니다.
+
+    앞 48비트가 밀리초 단위 Unix 시각이므로 문자열/바이너리 어느 쪽으로 저장해도
+    생성 순서대로 정렬되어, 인덱스 끝에 이어 붙는 형태로 INSERT됩니다.
+    같은 밀리초 안에서는 rand_a 12비트를 순번으로 사용해 프로세스 안에서 단조 증가를 보장합니다.
+
+    :param unix_ms: 사용할 시각 (밀리초). 생략하면 현재 시각을 사용합니다.
+        지정하면 순번 대신 난수를 채우므로 과거 데이터의 ID를 만들 때 사용합니다.
+    :return: UUIDv7
+    """
+    global _last_ms, _counter
+
+    if unix_ms is None:
+        with _lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > _last_ms:
+                _last_ms = now_ms
+                # 순번은 절반 아래에서 시작해 같은 밀리초에 충분히 여러 번 증가할 수 있게 합니다.
+                _counter = int.from_bytes(os.urandom(2)) >> (16 - _COUNTER_BITS + 1)
+            else:
+                _counter += 1
+                if _counter >= 1 << _COUNTER_BITS:
+                    # 순번이 넘치면 다음 밀리초를 앞당겨 사용합니다.
+                    _last_ms += 1
+                    _counter = 0
+            unix_ms, rand_a = _last_ms, _counter
+    else:
+        rand_a = int.from_bytes(os.urandom(2)) >> (16 - _COUNTER_BITS)
+
+    rand_b = int.from_bytes(os.urandom(8)) >> 2
+    value = (
+        (unix_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def generate_id(strategy: IdStrategy) -> str:
+    """
+    전략에 맞는 새 ID를 36자 UUID 문자열로 반환합니다.
+
+    :param strategy: "uuid4" (무작위) 또는 "uuid7" (시간 순)
+    :return: UUID 문자열
+    """
+    return str(uuid7() if strategy == "uuid7" else uuid.uuid4())
+
+
+def is_uuid(value: str) -> bool:
+    """
+    값이 UUID 문자열인지 확인합니다.
+    """
+    try:
+        uuid.UUID(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def canonical_uuid(value: str) -> str:
+    """
+    UUID 문자열을 소문자 36자 표준 형식으로 바꿉니다. UUID가 아니면 그대로 반환합니다.
+    대문자나 중괄호/하이픈 없는 형식으로 받은 ID도 저장된 ID와 같은 값으로 비교하기 위함입니다.
+    """
+    try:
+        return str(uuid.UUID(value))
+    except (TypeError, ValueError):
+        return value
@@ -0,0 +1,107 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import Engine, event
+
+# before_cursor_execute에서 기록한 시작 시각을 담는 실행 컨텍스트 속성
+_STARTED_AT = "_query_started_at"
+
+
+class QueryStats:
+    """
+    요청 하나(또는 track_queries 블록 하나)에서 실행한 SQL 문을 집계합니다.
+    바깥 집계가 있으면 같은 기록을 바깥에도 더해, 테스트에서 요청 전체를 감쌀 수 있습니다.
+    """
+
+    def __init__(
+        self, parent: "QueryStats | None" = None, route: str | None = None
+    ) -> None:
+        self.parent = parent
+        self.route = route or (parent.route if parent is not None else None)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: str | None = None
+        self.statements: list[str] = []
+
+    def record(self, statement: str, elapsed_seconds: float) -> None:
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.total_seconds += elapsed_seconds
+            stats.statements.append(statement)
+            if elapsed_seconds >= stats.slowest_seconds:
+                stats.slowest_seconds = elapsed_seconds
+                stats.slowest_statement = statement
+            stats = stats.parent
+
+    def summary(self) -> str:
+        """
+        로그에 남길 한 줄 요약을 반환합니다.
+        """
+        slowest = " ".join((self.slowest_statement or "").split())
+        return (
+            f"queries={self.count} db_ms={self.total_seconds * 1e3:.2f} "
+            f"slowest_ms={self.slowest_seconds * 1e3:.2f} slowest={slowest[:200]!r}"
+        )
+
+
+_stats: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+
+
+@contextmanager
+def track_request(route: str | None = None) -> Iterator[QueryStats]:
+    """
+    요청 하나의 쿼리 집계를 현재 컨텍스트에 등록하고, 요청이 끝나면 이전 상태로 되돌립니다.
+    되돌리지 않으면 같은 컨텍스트에서 처리되는 다음 요청(ASGITransport 등)이 이 집계를 바깥 집계로 삼습니다.
+
+    :param route: 요청 경로 (예: "GET /api/v1/users/me")
+    :return: 요청의 쿼리 집계
+    """
+    stats = QueryStats(parent=_stats.get(), route=route)
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+def current_route() -> str | None:
+    """
+    현재 컨텍스트에서 처리 중인 요청 경로를 반환합니다 (요청 밖이면 None).
+    """
+    stats = _stats.get()
+    return stats.route if stats is not None else None
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행한 SQL 문을 집계합니다. 스크립트나 테스트에서 사용합니다.
+    """
+    stats = QueryStats(parent=_stats.get())
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    if _stats.get() is not None and context is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = _stats.get()
+    started_at = getattr(context, _STARTED_AT, None)
+    if stats is not None and started_at is not None:
+        stats.record(statement, time.perf_counter() - started_at)
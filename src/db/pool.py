@@ -0,0 +1,119 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# 커넥션 체크아웃 대기 시간 히스토그램의 버킷 상한 (초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class _PoolMetrics:
+    """
+    커넥션 풀 이벤트를 집계하는 클래스입니다.
+    """
+
+    def __init__(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.wait_counts = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        self.wait_counts[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        waits = sum(self.wait_counts)
+        labels = [f"le_{bound}" for bound in WAIT_BUCKETS] + ["le_inf"]
+        return {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_seconds_avg": self.wait_seconds_total / waits if waits else 0.0,
+            "wait_seconds_max": self.wait_seconds_max,
+            "wait_histogram": dict(zip(labels, self.wait_counts, strict=True)),
+        }
+
+
+_lock = threading.Lock()
+_metrics = _PoolMetrics()
+_pool: Pool | None = None
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 얻기까지 기다린 시간을 측정하는 비동기 큐 풀입니다.
+    풀 이벤트에는 체크아웃 대기 시간이 없으므로 _do_get을 감싸 측정합니다.
+    """
+
+    def _do_get(self) -> Any:
+        started_at = time.monotonic()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with _lock:
+                _metrics.timeouts += 1
+            raise
+        with _lock:
+            _metrics.observe_wait(time.monotonic() - started_at)
+        return connection
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """
+    엔진의 커넥션 풀에 이벤트 리스너를 등록해 지표를 수집합니다.
+
+    :param engine: 지표를 수집할 비동기 엔진
+    """
+    global _pool
+    _pool = engine.sync_engine.pool
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        with _lock:
+            _metrics.connects += 1
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        with _lock:
+            _metrics.checkouts += 1
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        with _lock:
+            _metrics.checkins += 1
+
+    @event.listens_for(engine.sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        with _lock:
+            _metrics.invalidations += 1
+
+
+def get_pool_metrics() -> dict[str, Any]:
+    """
+    커넥션 풀의 현재 상태(사용 중 커넥션 수, 오버플로 등)와 누적 지표를 반환합니다.
+    """
+    with _lock:
+        snapshot = _metrics.snapshot()
+
+    snapshot["pool_class"] = type(_pool).__name__ if _pool is not None else None
+    if isinstance(_pool, QueuePool):
+        snapshot.update(
+            size=_pool.size(),
+            checked_out=_pool.checkedout(),
+            checked_in=_pool.checkedin(),
+            overflow=_pool.overflow(),
+        )
+    return snapshot
@@ -0,0 +1,174 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+
+# 조회 전용 세션을 표시하는 session.info 키
+READ_ONLY = "read_only"
+
+
+class RoutingState:
+    """
+    요청 하나의 DB 라우팅 상태입니다.
+    미들웨어가 요청마다 만들어 컨텍스트 변수에 보관합니다.
+    """
+
+    def __init__(self) -> None:
+        self.primary_until = 0.0
+        self.user_id: str | None = None  # 인증된 사용자 (쓰기 시각 기록 대상)
+        self.last_write_at: float | None = (
+            None  # 인증 시 읽은 사용자의 마지막 쓰기 시각
+        )
+        self.wrote = False
+        self.routes: list[str] = []
+
+    def write_recorded_within(self, seconds: float) -> bool:
+        """
+        인증 시 읽은 마지막 쓰기 시각이 seconds 이내인지 반환합니다.
+        이미 최근에 기록되었다면 다시 기록하지 않아도 유지 시간이 크게 줄지 않습니다.
+        """
+        return (
+            self.last_write_at is not None
+            and time.time() - self.last_write_at < seconds
+        )
+
+    @property
+    def sticky(self) -> bool:
+        # 이 요청에서 썼거나, 최근 요청에서 쓴 뒤 유지 시간이 남아있으면 주 DB를 사용
+        return self.wrote or self.primary_until > time.time()
+
+
+_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+_primary_reads: ContextVar[bool] = ContextVar("db_primary_reads", default=False)
+
+
+class _RoutingMetrics:
+    """
+    읽기 라우팅 결정을 집계하는 클래스입니다.
+    """
+
+    def __init__(self) -> None:
+        self.primary = 0
+        self.replica = 0
+        self.sticky = 0  # 복제본을 쓸 수 있었지만 쓰기 직후라 주 DB로 보낸 횟수
+
+    def snapshot(self) -> dict[str, int]:
+        return {"primary": self.primary, "replica": self.replica, "sticky": self.sticky}
+
+
+_lock = threading.Lock()
+_metrics = _RoutingMetrics()
+
+
+@contextmanager
+def request_context() -> Iterator[RoutingState]:
+    """
+    요청의 라우팅 상태를 만들어 블록 안에서만 현재 컨텍스트에 등록합니다.
+
+    :return: 요청의 라우팅 상태
+    """
+    state = RoutingState()
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+def current_state() -> RoutingState | None:
+    """
+    현재 요청의 라우팅 상태를 반환합니다. 요청 밖에서는 None을 반환합니다.
+    """
+    return _state.get()
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """
+    블록 안의 조회는 읽기 전용 세션이라도 주 DB에서 수행합니다.
+    토큰 폐기 여부, 토큰 버전처럼 복제 지연으로 인증 결과가 달라지면 안 되는 조회에 사용합니다.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def identify_user(user_id: str, last_write_at: datetime | None) -> None:
+    """
+    현재 요청의 인증된 사용자를 등록합니다.
+    주 DB에서 읽은 사용자의 마지막 쓰기 시각이 유지 시간 안이면 이 요청의 조회를 주 DB로 보냅니다.
+
+    :param user_id: 인증된 사용자 ID
+    :param last_write_at: 사용자가 마지막으로 쓰기를 수행한 시각 (users.last_write_at)
+    """
+    state = _state.get()
+    if state is None:
+        return
+    state.user_id = user_id
+    if last_write_at is not None:
+        if last_write_at.tzinfo is None:  # SQLite는 시간대 없이 반환하므로 UTC로 간주
+            last_write_at = last_write_at.replace(tzinfo=timezone.utc)
+        state.last_write_at = last_write_at.timestamp()
+        state.primary_until = max(
+            state.primary_until,
+            state.last_write_at + settings.DB_READ_YOUR_WRITES_SECONDS,
+        )
+
+
+def _record(route: str) -> None:
+    with _lock:
+        setattr(_metrics, route, getattr(_metrics, route) + 1)
+    state = _state.get()
+    if state is not None:
+        state.routes.append(route)
+
+
+def get_routing_metrics() -> dict[str, int]:
+    """
+    주 DB/복제본으로 보낸 조회 횟수를 반환합니다.
+    """
+    with _lock:
+        return _metrics.snapshot()
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_write(session: Session, flush_context) -> None:
+    state = _state.get()
+    if state is not None:
+        state.wrote = True
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 세션의 쿼리를 복제본으로 보내는 세션입니다.
+    복제본이 없거나, 인증 조회 중이거나, 쓰기 직후 유지 시간 안의 요청이면 주 DB를 사용합니다.
+    """
+
+    def __init__(self, *args: Any, replica_bind: Engine | None = None, **kw: Any):
+        super().__init__(*args, **kw)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.replica_bind is not None
+            and self.info.get(READ_ONLY)
+            and not _primary_reads.get()
+        ):
+            state = _state.get()
+            if state is None or not state.sticky:
+                _record("replica")
+                return self.replica_bind
+            with _lock:
+                _metrics.sticky += 1
+
+        _record("primary")
+        return super().get_bind(mapper, clause=clause, **kw)
@@ -1,21 +1,85 @@
-from typing import AsyncGenerator
+from typing import Annotated, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from src.db.base import AsyncSessionLocal
+from src.db.routing import READ_ONLY
+
+# 커밋되지 않은 flush 여부를 표시하는 session.info 키
+_FLUSHED = "flushed"
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    if session.info.get(READ_ONLY):
+        raise InvalidRequestError(
+            "읽기 전용 세션에서는 변경 사항을 기록할 수 없습니다."
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[_FLUSHED] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_flushed(session: Session) -> None:
+    session.info.pop(_FLUSHED, None)
+
+
+def _has_pending_writes(session: AsyncSession) -> bool:
+    """
+    커밋되지 않은 변경 사항이 세션에 남아있는지 확인합니다.
+    """
+    return bool(
+        session.new or session.dirty or session.deleted or session.info.get(_FLUSHED)
+    )
 
 
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     비동기 데이터베이스 세션을 생성하고 변환하는 제너레이터 함수입니다.
-    사용 후 세션을 닫습니다.
+    세션은 첫 쿼리를 실행할 때 커넥션을 가져오며, 사용 후 세션을 닫습니다.
+    대부분의 CRUD 함수가 직접 커밋하므로 남은 변경 사항이 있을 때만 커밋합니다.
     """
     session = AsyncSessionLocal()
     try:
         yield session
-        await session.commit()
+        if _has_pending_writes(session):
+            await session.commit()
     except Exception:
-        await session.rollback()
+        if session.in_transaction():
+            await session.rollback()
         raise
     finally:
         await session.close()
+
+
+async def get_async_read_db(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    조회 전용 라우트를 위한 읽기 전용 세션입니다.
+    인증 의존성과 같은 세션을 공유하며, 요청 처리 중 flush가 일어나면 예외를 발생시킵니다.
+    복제본이 설정되어 있으면 이 세션의 쿼리는 복제본으로 전달됩니다.
+    첫 쿼리보다 먼저 표시되어야 하므로 라우트의 dependencies에 선언합니다.
+    """
+    db.info[READ_ONLY] = True
+    try:
+        yield db
+    finally:
+        db.info.pop(READ_ONLY, None)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    세션 팩토리를 반환합니다.
+    StreamingResponse는 의존성 정리 이후에 본문을 보내므로, 스트리밍 라우트는
+    요청 세션 대신 이 팩토리로 응답 생성기 안에서 직접 세션을 엽니다.
+    """
+    return AsyncSessionLocal
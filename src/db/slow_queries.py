@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.db.instrumentation import current_route
+
+logger = logging.getLogger(__name__)
+
+# before_cursor_execute에서 기록한 시작 시각을 담는 실행 컨텍스트 속성
+_STARTED_AT = "_slow_query_started_at"
+# EXPLAIN을 실행하는 커넥션에 붙이는 실행 옵션 (EXPLAIN 자체는 기록하지 않음)
+_EXPLAINING = "slow_query_explaining"
+# 동시에 실행할 수 있는 EXPLAIN 작업 수 (느린 쿼리가 몰릴 때 커넥션을 과하게 쓰지 않도록)
+MAX_PENDING_EXPLAINS = 4
+
+_EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "mysql": "EXPLAIN ",
+    "postgresql": "EXPLAIN ",
+}
+
+_lock = threading.Lock()
+_records: deque[dict[str, Any]] = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+_engines: dict[Engine, AsyncEngine] = {}
+_pending_explains: set[asyncio.Task] = set()
+
+
+def _value_shape(value: Any) -> str:
+    return type(value).__name__
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    바인딩 값 대신 값의 타입만 남긴 형태를 반환합니다. 개인 정보를 로그에 남기지 않기 위함입니다.
+
+    :param parameters: DBAPI에 전달된 바인딩 값 (dict, 튜플 또는 executemany의 목록)
+    :param executemany: executemany 실행 여부
+    :return: JSON으로 직렬화할 수 있는 타입 정보
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {
+            "rows": len(parameters),
+            "row": parameter_shape(parameters[0]) if parameters else None,
+        }
+    if isinstance(parameters, dict):
+        return {key: _value_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return None
+
+
+def _is_explainable(statement: str) -> bool:
+    return statement.lstrip().split(None, 1)[0].upper() in ("SELECT", "WITH")
+
+
+async def _explain(
+    engine: AsyncEngine, record: dict[str, Any], statement: str, parameters: Any
+) -> None:
+    """
+    느린 SELECT 문의 실행 계획을 새 커넥션에서 조회해 기록에 추가합니다.
+    """
+    prefix = _EXPLAIN_PREFIXES[engine.dialect.name]
+    # 실행 계획 조회에 실패해도 서비스에 영향을 주지 않도록 기록만 남깁니다.
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(**{_EXPLAINING: True})
+            result = await conn.exec_driver_sql(prefix + statement, parameters)
+            record["plan"] = [[str(value) for value in row] for row in result]
+    except Exception as err:
+        record["plan_error"] = repr(err)
+        return
+    logger.info(
+        "느린 쿼리 실행 계획 (%s): %s",
+        record["route"],
+        " | ".join(" ".join(row) for row in record["plan"]),
+    )
+
+
+def _schedule_explain(
+    engine: AsyncEngine, record: dict[str, Any], statement: str, parameters: Any
+) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:  # 이벤트 루프 밖(동기 스크립트 등)에서는 건너뜁니다.
+        return
+    if len(_pending_explains) >= MAX_PENDING_EXPLAINS:
+        record["plan_error"] = "실행 중인 EXPLAIN이 많아 건너뛰었습니다."
+        return
+    task = loop.create_task(_explain(engine, record, statement, parameters))
+    _pending_explains.add(task)
+    task.add_done_callback(_pending_explains.discard)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    if context is not None:
+        setattr(context, _STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    started_at = getattr(context, _STARTED_AT, None)
+    threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+    if started_at is None or threshold_ms <= 0:
+        return
+    duration_ms = (time.perf_counter() - started_at) * 1e3
+    if duration_ms < threshold_ms or context.execution_options.get(_EXPLAINING):
+        return
+
+    record: dict[str, Any] = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 3),
+        "route": current_route(),
+        "statement": statement,
+        "parameters": parameter_shape(parameters, executemany),
+        "plan": None,
+    }
+    with _lock:
+        _records.append(record)
+    logger.warning(
+        "느린 쿼리 %.1fms (%s): %s 파라미터=%s",
+        duration_ms,
+        record["route"],
+        " ".join(statement.split()),
+        record["parameters"],
+    )
+
+    async_engine = _engines.get(conn.engine)
+    if (
+        settings.SLOW_QUERY_EXPLAIN
+        and async_engine is not None
+        and not executemany
+        and conn.dialect.name in _EXPLAIN_PREFIXES
+        and _is_explainable(statement)
+    ):
+        _schedule_explain(async_engine, record, statement, parameters)
+
+
+def instrument_slow_queries(engine: AsyncEngine) -> None:
+    """
+    엔진에 느린 쿼리 기록 리스너를 등록합니다. 같은 엔진에 여러 번 호출해도 한 번만 등록됩니다.
+
+    :param engine: 느린 쿼리를 기록할 비동기 엔진
+    """
+    sync_engine = engine.sync_engine
+    _engines[sync_engine] = engine
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(sync_engine, name, listener):
+            event.listen(sync_engine, name, listener)
+
+
+def get_slow_queries() -> list[dict[str, Any]]:
+    """
+    최근 느린 쿼리 기록을 최신 순으로 반환합니다.
+    """
+    with _lock:
+        return [dict(record) for record in reversed(_records)]
+
+
+def clear_slow_queries() -> None:
+    """
+    보관 중인 느린 쿼리 기록을 비웁니다.
+    """
+    with _lock:
+        _records.clear()
+
+
+async def wait_for_explains() -> None:
+    """
+    실행 중인 EXPLAIN 작업이 끝날 때까지 기다립니다 (종료 시와 테스트에서 사용).
+    """
+    if _pending_explains:
+        await asyncio.gather(*_pending_explains, return_exceptions=True)
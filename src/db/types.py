@@ -0,0 +1,38 @@
+import uuid
+
+from sqlalchemy import BINARY, DateTime
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID 문자열을 16바이트 바이너리로 저장하는 컬럼 타입입니다.
+    파이썬/API 쪽에서는 기존과 같이 36자 문자열로 다룹니다.
+    """
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: str | uuid.UUID | None, dialect: Dialect
+    ) -> bytes | None:
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        return uuid.UUID(value).bytes
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+# SQLite의 CURRENT_TIMESTAMP는 초 단위 문자열("YYYY-MM-DD HH:MM:SS")로 저장되므로,
+# 바인딩 값도 같은 형식이어야 =, < 문자열 비교가 시간 비교와 일치합니다.
+# 서버 기본값으로 채워지는 시각 컬럼을 비교(커서 페이지네이션 등)할 때 사용합니다.
+SecondsDateTime = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(truncate_microseconds=True), "sqlite"
+)
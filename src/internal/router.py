@@ -0,0 +1,64 @@
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, status
+
+from src.auth.dependencies import require_admin
+from src.auth.revocation import revocation_cache
+from src.auth.token_cache import claims_cache
+from src.core.config import settings
+from src.core.security import get_hashing_metrics
+from src.db.pool import get_pool_metrics
+from src.db.routing import get_routing_metrics
+from src.db.slow_queries import get_slow_queries
+from src.users import models
+from src.users.cache import user_cache
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="내부 지표 조회",
+    description="커넥션 풀, 비밀번호 해싱 워커 풀, 각종 캐시의 지표를 반환합니다. 관리자만 조회할 수 있습니다.",
+)
+async def get_internal_metrics(
+    current_user: Annotated[models.User, Depends(require_admin)],
+) -> dict[str, Any]:
+    """
+    운영 중인 인스턴스의 내부 지표를 반환합니다.
+
+    :param current_user: 관리자인 현재 사용자 모델
+    :return: 구성 요소별 지표
+    """
+    return {
+        "db_pool": get_pool_metrics(),
+        "db_routing": get_routing_metrics(),
+        "password_hashing": get_hashing_metrics(),
+        "token_revocation_cache": revocation_cache.metrics(),
+        "token_claims_cache": claims_cache.metrics(),
+        "user_cache": user_cache.metrics(),
+    }
+
+
+@router.get(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    summary="느린 쿼리 기록 조회",
+    description="임계값을 넘은 최근 SQL 문과 실행 계획을 최신 순으로 반환합니다. 관리자만 조회할 수 있습니다.",
+)
+async def get_internal_slow_queries(
+    current_user: Annotated[models.User, Depends(require_admin)],
+) -> dict[str, Any]:
+    """
+    이 인스턴스에서 기록한 최근 느린 쿼리를 반환합니다.
+    바인딩 값은 남기지 않고 타입만 기록합니다.
+
+    :param current_user: 관리자인 현재 사용자 모델
+    :return: 임계값과 느린 쿼리 기록 목록
+    """
+    return {
+        "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+        "explain": settings.SLOW_QUERY_EXPLAIN,
+        "records": get_slow_queries(),
+    }
@@ -1,17 +1,107 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import Awaitable, Callable
 
+from fastapi import FastAPI, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import service as auth_service
 from src.auth.router import router as auth_router
 
 # from fastapi.middleware.cors import CORSMiddleware
 from src.core.config import settings
+from src.core.security import shutdown_hashing_executor
+from src.db import instrumentation as db_instrumentation
+from src.db import routing as db_routing
+from src.db.base import AsyncSessionLocal
+from src.db.slow_queries import wait_for_explains
+from src.internal.router import router as internal_router
+from src.users import crud as users_crud
 from src.users.router import router as users_router
 
+logger = logging.getLogger(__name__)
+
+
+async def _run_periodically(
+    interval_seconds: int, job: Callable[[AsyncSession], Awaitable[object]]
+) -> None:
+    """
+    설정된 주기마다 새 세션으로 유지보수 작업을 실행합니다.
+    작업이 실패해도 다음 주기에 다시 시도합니다.
+
+    :param interval_seconds: 실행 주기 (초)
+    :param job: 세션을 받아 실행할 비동기 작업
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                await job(db)
+        except Exception:
+            logger.exception("주기 작업 %s 실행에 실패했습니다.", job.__name__)
+
+
+async def _purge_expired_blocklist(db: AsyncSession) -> None:
+    report = await auth_service.purge_expired_blocklist(db=db)
+    logger.info(
+        "만료된 블락리스트 %d건을 %.3f초 동안 정리했습니다.",
+        report.purged,
+        report.elapsed_seconds,
+    )
+
+
+async def _refresh_revocation_cache(db: AsyncSession) -> None:
+    await auth_service.refresh_revocation_cache(db=db)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 시작/종료 시 필요한 자원을 초기화하고 정리합니다.
+    """
+    background_tasks: list[asyncio.Task] = []
+
+    if settings.TOKEN_REVOCATION_CACHE_ENABLED:
+        async with AsyncSessionLocal() as db:
+            await _refresh_revocation_cache(db)
+        if settings.TOKEN_REVOCATION_CACHE_REFRESH_SECONDS > 0:
+            background_tasks.append(
+                asyncio.create_task(
+                    _run_periodically(
+                        settings.TOKEN_REVOCATION_CACHE_REFRESH_SECONDS,
+                        _refresh_revocation_cache,
+                    )
+                )
+            )
+
+    if settings.TOKEN_BLOCKLIST_PURGE_INTERVAL_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                _run_periodically(
+                    settings.TOKEN_BLOCKLIST_PURGE_INTERVAL_SECONDS,
+                    _purge_expired_blocklist,
+                )
+            )
+        )
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await wait_for_explains()
+    shutdown_hashing_executor()
+
+
 # FastAPI 애플리케이션 생성
 app = FastAPI(
     title=settings.APP_NAME,
     description="낯가리는 사람들 API",
     version="0.1.0",
     debug=settings.DEBUG_MODE,
+    lifespan=lifespan,
 )
 
 # origins = [
@@ -26,11 +116,78 @@ app = FastAPI(
 #     allow_headers=["*"],  # 모든 HTTP 헤더 허용
 # )
 
+
+@app.middleware("http")
+async def add_debug_headers(request: Request, call_next):
+    """
+    디버그 모드에서 요청 처리 중 발생한 사용자 조회 횟수를 응답 헤더로 노출합니다.
+    """
+    response = await call_next(request)
+    if settings.DEBUG_MODE:
+        loader = getattr(request.state, "user_loader", None)
+        if loader is not None:
+            response.headers["X-User-Selects"] = str(loader.select_count)
+    return response
+
+
+@app.middleware("http")
+async def route_reads_after_writes(request: Request, call_next):
+    """
+    요청마다 DB 라우팅 상태를 만들고, 인증된 사용자가 쓰기를 수행하면 그 시각을 기록해
+    이후 요청이 설정된 시간 동안 복제본 대신 주 DB에서 읽도록 합니다.
+    기록은 서버(users.last_write_at)에 남기므로 쿠키를 보내지 않는 클라이언트나 다른 워커에서도 적용됩니다.
+    쓰기 요청마다 기록하지 않도록, 인증 시 읽은 마지막 쓰기 시각이 유지 시간의 절반 이내이면 생략합니다.
+    """
+    window = settings.DB_READ_YOUR_WRITES_SECONDS
+    with db_routing.request_context() as state:
+        response = await call_next(request)
+
+        if (
+            state.wrote
+            and state.user_id is not None
+            and settings.DATABASE_REPLICA_URL
+            and window > 0
+            and not state.write_recorded_within(window / 2)
+        ):
+            async with AsyncSessionLocal() as db:
+                await users_crud.record_write(db, state.user_id)
+
+    if settings.DEBUG_MODE and state.routes:
+        response.headers["X-DB-Routes"] = ",".join(state.routes)
+    return response
+
+
+@app.middleware("http")
+async def instrument_queries(request: Request, call_next):
+    """
+    요청 처리 중 실행한 SQL 문 수, 총 DB 시간, 가장 느린 문을 집계해 로그로 남기고,
+    디버그 모드에서는 응답 헤더로 노출합니다.
+    스트리밍 응답의 본문을 보내는 동안 실행한 쿼리는 헤더를 보낸 뒤이므로 포함되지 않습니다.
+    """
+    with db_instrumentation.track_request(
+        f"{request.method} {request.url.path}"
+    ) as stats:
+        response = await call_next(request)
+
+    if settings.DEBUG_MODE:
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.total_seconds * 1e3:.2f}"
+    if stats.count:
+        logger.log(
+            logging.INFO if settings.DEBUG_MODE else logging.DEBUG,
+            "%s %s",
+            stats.route,
+            stats.summary(),
+        )
+    return response
+
+
 # 라우터 등록
 API_V1_PREFIX = "/api/v1"
 
 app.include_router(users_router, prefix=f"{API_V1_PREFIX}", tags=["Users"])
 app.include_router(auth_router, prefix=f"{API_V1_PREFIX}", tags=["Auth"])
+app.include_router(internal_router)
 
 
 @app.get("/")
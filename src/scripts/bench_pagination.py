@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.auth.models import TokenBlocklist  # noqa: F401 (테이블 등록)
+from src.db.base import Base
+from src.scripts.seed_db import seed_users
+from src.users import crud
+from src.users.models import User
+
+PAGE_SIZE = 100
+
+
+async def _time(coro_factory, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+async def bench_pagination(database_url: str, rows: int, repeat: int):
+    """페이지 깊이에 따른 OFFSET/커서 페이지네이션 지연 시간을 비교합니다."""
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_factory() as db:
+        existing = await db.scalar(select(func.count()).select_from(User))
+        if existing < rows:
+            print(f"사용자 {rows - existing}건을 추가합니다...")
+            # 세 명 중 한 명꼴로 가입 시각(초)이 겹치도록 기간을 좁혀 동률 처리까지 확인합니다.
+            await seed_users(
+                db,
+                start=existing,
+                stop=rows,
+                hashed_password="x",
+                days=rows / 3 / 86_400,
+                skew=1.0,
+            )
+
+        print(f"{'페이지 깊이':>12} | {'OFFSET (ms)':>12} | {'커서 (ms)':>10}")
+        for depth in (0, rows // 100, rows // 10, rows // 2, rows - PAGE_SIZE):
+            # 커서 방식은 이전 페이지의 마지막 키만 알면 되므로 미리 구해둡니다.
+            after = None
+            if depth > 0:
+                row = (
+                    await db.execute(
+                        select(User.created_at, User.id)
+                        .order_by(User.created_at.desc(), User.id.desc())
+                        .offset(depth - 1)
+                        .limit(1)
+                    )
+                ).one()
+                after = (row.created_at, row.id)
+
+            offset_seconds = await _time(
+                lambda depth=depth: crud.get_users(db=db, skip=depth, limit=PAGE_SIZE),
+                repeat,
+            )
+            cursor_seconds = await _time(
+                lambda after=after: crud.get_users_by_cursor(
+                    db=db, after=after, limit=PAGE_SIZE
+                ),
+                repeat,
+            )
+            db.expunge_all()
+            print(
+                f"{depth:>12,} | {offset_seconds * 1e3:>12.2f} | "
+                f"{cursor_seconds * 1e3:>10.2f}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 목록 페이지네이션 벤치마크")
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench_pagination.db"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(
+        bench_pagination(
+            database_url=args.database_url, rows=args.rows, repeat=args.repeat
+        )
+    )
+
+# poetry run python -m src.scripts.bench_pagination --rows 1000000
+# 위 명령어로 페이지 깊이별 OFFSET/커서 페이지네이션 지연 시간을 비교할 수 있습니다.
@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import MetaData, String, Table, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.db.ids import IdStrategy, generate_id
+from src.db.types import BinaryUUID
+from src.users.models import User
+
+LAYOUTS: list[tuple[IdStrategy, str]] = [
+    ("uuid4", "string"),
+    ("uuid7", "string"),
+    ("uuid4", "binary"),
+    ("uuid7", "binary"),
+]
+
+
+def _users_table(storage: str) -> Table:
+    """id 컬럼 타입만 바꾼 users 테이블 정의를 만듭니다 (인덱스는 모델과 동일)."""
+    table = User.__table__.to_metadata(MetaData())
+    table.c.id.type = BinaryUUID() if storage == "binary" else String(36)
+    return table
+
+
+async def _table_size(conn: AsyncConnection) -> int | None:
+    """users 테이블과 인덱스가 차지하는 바이트 수를 반환합니다 (SQLite/MySQL만 지원)."""
+    if conn.dialect.name == "sqlite":
+        page_size = await conn.scalar(text("PRAGMA page_size"))
+        page_count = await conn.scalar(text("PRAGMA page_count"))
+        freelist = await conn.scalar(text("PRAGMA freelist_count"))
+        return page_size * (page_count - freelist)
+    if conn.dialect.name == "mysql":
+        await conn.execute(text("ANALYZE TABLE users"))
+        return await conn.scalar(
+            text(
+                "SELECT data_length + index_length FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = 'users'"
+            )
+        )
+    return None
+
+
+async def bench_layout(
+    database_url: str,
+    strategy: IdStrategy,
+    storage: str,
+    rows: int,
+    batch_size: int,
+    lookups: int,
+) -> tuple[float, float, int | None]:
+    """
+    한 가지 ID 방식으로 users 테이블을 새로 만들어 INSERT/기본 키 조회 시간을 잰 뒤 삭제합니다.
+
+    :return: (초당 INSERT 행 수, 조회 1건당 평균 ms, 테이블 크기)
+    """
+    engine = create_async_engine(database_url)
+    table = _users_table(storage)
+    now = datetime.now(timezone.utc)
+    ids: list[str] = []
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table.metadata.drop_all)
+        await conn.run_sync(table.metadata.create_all)
+
+    started_at = time.perf_counter()
+    for offset in range(0, rows, batch_size):
+        batch = []
+        for i in range(offset, min(offset + batch_size, rows)):
+            user_id = generate_id(strategy)
+            ids.append(user_id)
+            batch.append(
+                {
+                    "id": user_id,
+                    "email": f"idbench{i}@example.com",
+                    "username": f"idbench{i}",
+                    "username_normalized": f"idbench{i}",
+                    "hashed_password": "x",
+                    "is_active": True,
+                    "is_admin": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        # 배치마다 커밋해 요청 단위 가입과 비슷하게 인덱스가 계속 커지도록 합니다.
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), batch)
+    insert_rate = rows / (time.perf_counter() - started_at)
+
+    sample = random.sample(ids, min(lookups, len(ids)))
+    async with engine.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            await conn.execute(text("VACUUM"))
+        size = await _table_size(conn)
+
+        started_at = time.perf_counter()
+        for user_id in sample:
+            (await conn.execute(select(table).where(table.c.id == user_id))).one()
+        lookup_ms = (time.perf_counter() - started_at) / len(sample) * 1e3
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table.metadata.drop_all)
+    await engine.dispose()
+    return insert_rate, lookup_ms, size
+
+
+async def bench_user_ids(database_url: str, rows: int, batch_size: int, lookups: int):
+    """사용자 ID 생성 전략과 저장 방식별 INSERT/조회 성능과 크기를 비교합니다."""
+    print(
+        f"{'ID 방식':>16} | {'INSERT (행/초)':>14} | {'조회 (ms)':>9} | {'크기 (MB)':>9}"
+    )
+    for strategy, storage in LAYOUTS:
+        insert_rate, lookup_ms, size = await bench_layout(
+            database_url=database_url,
+            strategy=strategy,
+            storage=storage,
+            rows=rows,
+            batch_size=batch_size,
+            lookups=lookups,
+        )
+        size_text = f"{size / 1e6:>9.1f}" if size is not None else f"{'-':>9}"
+        print(
+            f"{strategy + ' / ' + storage:>16} | {insert_rate:>14,.0f} | "
+            f"{lookup_ms:>9.3f} | {size_text}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 ID 방식 벤치마크")
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench_user_ids.db"
+    )
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(
+        bench_user_ids(
+            database_url=args.database_url,
+            rows=args.rows,
+            batch_size=args.batch_size,
+            lookups=args.lookups,
+        )
+    )
+
+# poetry run python -m src.scripts.bench_user_ids --rows 500000
+# 위 명령어로 ID 방식별 INSERT/조회 속도와 테이블 크기를 비교할 수 있습니다.
+# 주의: 대상 DB의 users 테이블을 지우고 다시 만드므로 벤치마크 전용 DB를 사용하세요.
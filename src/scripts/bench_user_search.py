@@ -0,0 +1,117 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.auth.models import TokenBlocklist  # noqa: F401 (테이블 등록)
+from src.db.base import Base
+from src.scripts.seed_db import seed_users
+from src.users import crud
+from src.users.models import User
+
+PREFIX_LENGTHS = (1, 2, 3, 5, 8)
+
+
+async def _scan_search(db: AsyncSession, prefix: str, limit: int):
+    """비교용: 인덱스를 쓰지 못하는 LIKE '%x%' 부분 일치 검색"""
+    result = await db.execute(
+        select(User)
+        .where(User.username.ilike(f"%{prefix}%"), User.is_active.is_(True))
+        .order_by(User.username)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def _latencies(search, db: AsyncSession, prefixes: list[str], limit: int):
+    latencies = []
+    for prefix in prefixes:
+        started_at = time.perf_counter()
+        await search(db, prefix, limit)
+        latencies.append(time.perf_counter() - started_at)
+        db.expunge_all()
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies) * 1e3, p99 * 1e3
+
+
+async def bench_user_search(
+    database_url: str, rows: int, lookups: int, scan_lookups: int, limit: int
+):
+    """접두사 길이별로 인덱스 범위 검색과 LIKE '%x%' 검색의 p50/p99 지연 시간을 비교합니다."""
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with session_factory() as db:
+        existing = await db.scalar(select(func.count()).select_from(User))
+        if existing < rows:
+            print(f"사용자 {rows - existing}건을 추가합니다...")
+            await seed_users(db, start=existing, stop=rows, hashed_password="x")
+
+        # 실제 사용자 이름의 앞부분을 접두사로 사용해 자동 완성 입력을 흉내 냅니다.
+        usernames = (
+            await db.scalars(
+                select(User.username_normalized)
+                .order_by(func.random())
+                .limit(max(lookups, scan_lookups))
+            )
+        ).all()
+
+        print(
+            f"{'접두사 길이':>10} | {'인덱스 p50':>10} | {'인덱스 p99':>10} | "
+            f"{'LIKE p50':>10} | {'LIKE p99':>10}  (ms)"
+        )
+        for length in PREFIX_LENGTHS:
+            prefixes = [username[:length] for username in usernames]
+            index_p50, index_p99 = await _latencies(
+                lambda db, prefix, limit: crud.search_users_by_prefix(
+                    db=db, prefix=prefix, limit=limit
+                ),
+                db,
+                prefixes[:lookups],
+                limit,
+            )
+            scan_p50, scan_p99 = await _latencies(
+                _scan_search, db, prefixes[:scan_lookups], limit
+            )
+            print(
+                f"{length:>10} | {index_p50:>10.3f} | {index_p99:>10.3f} | "
+                f"{scan_p50:>10.3f} | {scan_p99:>10.3f}"
+            )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 이름 접두사 검색 벤치마크")
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench_user_search.db"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument(
+        "--scan-lookups",
+        type=int,
+        default=20,
+        help="LIKE 검색 횟수 (전체 스캔이라 느리므로 적게 잡습니다)",
+    )
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(
+        bench_user_search(
+            database_url=args.database_url,
+            rows=args.rows,
+            lookups=args.lookups,
+            scan_lookups=args.scan_lookups,
+            limit=args.limit,
+        )
+    )
+
+# poetry run python -m src.scripts.bench_user_search --rows 1000000
+# 위 명령어로 백만 명 기준 접두사 길이별 검색 지연 시간(p50/p99)을 비교할 수 있습니다.
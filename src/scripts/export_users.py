@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import sys
+
+from src.db.base import AsyncSessionLocal
+from src.users import export
+
+
+async def export_users(
+    export_format: export.ExportFormat,
+    columns: str | None,
+    is_active: bool | None,
+    output: str | None,
+    batch_size: int,
+):
+    """사용자 목록을 NDJSON 또는 CSV 파일로 내보냅니다."""
+    selected = export.parse_export_columns(columns)
+    stream = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+    try:
+        async for chunk in export.export_users(
+            session_factory=AsyncSessionLocal,
+            export_format=export_format,
+            columns=selected,
+            is_active=is_active,
+            batch_size=batch_size,
+        ):
+            stream.write(chunk)
+    finally:
+        if output:
+            stream.close()
+
+    if output:
+        print(f"✅ 사용자 목록을 {output} 파일로 내보냈습니다.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 목록 내보내기")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument(
+        "--columns", help="쉼표로 구분한 컬럼 목록 (생략 시 전체)", default=None
+    )
+    active = parser.add_mutually_exclusive_group()
+    active.add_argument("--active", dest="is_active", action="store_true", default=None)
+    active.add_argument("--inactive", dest="is_active", action="store_false")
+    parser.add_argument("--output", "-o", help="출력 파일 (생략 시 표준 출력)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(
+        export_users(
+            export_format=args.format,
+            columns=args.columns,
+            is_active=args.is_active,
+            output=args.output,
+            batch_size=args.batch_size,
+        )
+    )
+
+# poetry run python -m src.scripts.export_users --format csv --active -o users.csv
+# 위 명령어로 사용자 목록을 파일로 내보낼 수 있습니다.
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.db.base import AsyncSessionLocal
+from src.users import bulk_import
+
+
+async def _read_lines(path: Path) -> AsyncIterator[str]:
+    with path.open(encoding="utf-8", newline="") as stream:
+        for line in stream:
+            yield line.rstrip("\r\n")
+
+
+async def import_users(
+    path: Path,
+    import_format: bulk_import.ImportFormat,
+    batch_size: int | None,
+    workers: int | None,
+    errors_output: str | None,
+):
+    """NDJSON 또는 CSV 파일의 사용자를 일괄 가입시킵니다."""
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn")
+    ) as executor:
+        async with AsyncSessionLocal() as db:
+            report = await bulk_import.import_users(
+                db=db,
+                lines=_read_lines(path),
+                import_format=import_format,
+                batch_size=batch_size,
+                executor=executor,
+            )
+
+    print(
+        f"✅ {report.total_rows}행 중 {report.imported}명 가입, {report.failed}행 실패 "
+        f"({report.batches}개 묶음, {report.elapsed_seconds:.2f}초, "
+        f"{report.rows_per_second:,.0f}행/초)",
+        file=sys.stderr,
+    )
+    if errors_output and report.errors:
+        with open(errors_output, "w", encoding="utf-8") as stream:
+            for error in report.errors:
+                stream.write(json.dumps(error.model_dump(), ensure_ascii=False) + "\n")
+        print(f"실패한 행은 {errors_output} 파일에 기록했습니다.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 일괄 가입")
+    parser.add_argument("path", type=Path, help="NDJSON 또는 CSV 파일")
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv"],
+        default=None,
+        help="입력 형식 (생략 시 파일 확장자로 판단)",
+    )
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="해싱 프로세스 수")
+    parser.add_argument("--errors-output", help="실패한 행을 NDJSON으로 기록할 파일")
+    args = parser.parse_args()
+    asyncio.run(
+        import_users(
+            path=args.path,
+            import_format=args.format
+            or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson"),
+            batch_size=args.batch_size,
+            workers=args.workers,
+            errors_output=args.errors_output,
+        )
+    )
+
+# poetry run python -m src.scripts.import_users users.csv --workers 8 --errors-output errors.ndjson
+# 위 명령어로 파일의 사용자를 일괄 가입시킬 수 있습니다.
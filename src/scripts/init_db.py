@@ -1,5 +1,6 @@
 import asyncio
 
+from src.auth.models import TokenBlocklist  # noqa: F401 (테이블 등록)
 from src.db.base import engine
 from src.users.models import Base
 
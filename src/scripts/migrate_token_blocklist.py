@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    MetaData,
+    Table,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.types import NullType
+
+from src.auth.models import TokenBlocklist
+from src.db.base import engine
+
+_OLD_TABLE = "token_blocklist_old"
+
+
+def _normalize_jti(value: str | bytes) -> str | None:
+    # 이전 테이블은 36자 문자열(String(36))로 저장했으므로 UUID로 읽어 16바이트 저장 형식에 맞춥니다.
+    # UUID가 아닌 jti는 이제 토큰 검증 단계에서 거부되므로 옮기지 않습니다.
+    try:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(uuid.UUID(bytes=bytes(value)))
+        return str(uuid.UUID(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _migrate(conn: Connection, batch_size: int) -> tuple[int, int]:
+    """
+    token_blocklist 테이블을 현재 모델(jti BINARY(16), created_at)의 스키마로 다시 만들고
+    아직 만료되지 않은 행을 옮깁니다.
+
+    1. 기존 테이블 이름을 token_blocklist_old로 바꾸고 인덱스를 삭제합니다 (SQLite는 인덱스 이름이 DB 전역).
+    2. 현재 모델로 token_blocklist 테이블을 만듭니다.
+    3. 기존 jti 순으로 batch_size개씩 읽어 jti를 변환해 넣습니다.
+       이미 만료된 행은 어차피 정리 대상이므로 옮기지 않습니다.
+       created_at 컬럼이 없던 테이블에서 옮긴 행은 옮긴 시각으로 채워집니다.
+    4. token_blocklist_old를 삭제합니다.
+
+    :return: (옮긴 행 수, 건너뛴 행 수)
+    """
+    tables = inspect(conn).get_table_names()
+    if _OLD_TABLE in tables:
+        raise RuntimeError(
+            f"{_OLD_TABLE} 테이블이 남아있습니다. 이전 마이그레이션 결과를 확인한 뒤 정리하세요."
+        )
+    if TokenBlocklist.__tablename__ not in tables:
+        return 0, 0
+
+    conn.execute(
+        text(f"ALTER TABLE {TokenBlocklist.__tablename__} RENAME TO {_OLD_TABLE}")
+    )
+    # 이전 저장 방식과 관계없이 jti는 변환 없이 읽도록 타입을 지정합니다.
+    old = Table(
+        _OLD_TABLE,
+        MetaData(),
+        Column("jti", NullType(), primary_key=True),
+        autoload_with=conn,
+    )
+    for index in list(old.indexes):
+        index.drop(conn)
+    TokenBlocklist.__table__.create(conn)
+
+    now = datetime.now(timezone.utc)
+    query = select(old.c.jti, old.c.expires_at).order_by(old.c.jti)
+    moved = skipped = 0
+    last_jti = None
+    while True:
+        # 같은 커넥션에서 INSERT와 번갈아 실행하므로 스트리밍 대신 기본 키 범위로 나눠 읽습니다.
+        page = query if last_jti is None else query.where(old.c.jti > last_jti)
+        rows = conn.execute(page.limit(batch_size)).all()
+        if not rows:
+            break
+        last_jti = rows[-1].jti
+
+        batch = []
+        for row in rows:
+            jti = _normalize_jti(row.jti)
+            expires_at = row.expires_at
+            if expires_at.tzinfo is None:  # naive 값은 UTC로 간주
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if jti is None or expires_at <= now:
+                skipped += 1
+                continue
+            batch.append({"jti": jti, "expires_at": expires_at})
+        if batch:
+            conn.execute(insert(TokenBlocklist.__table__), batch)
+        moved += len(batch)
+
+    old.drop(conn)
+    return moved, skipped
+
+
+async def migrate_token_blocklist(batch_size: int):
+    """token_blocklist 테이블을 jti 16바이트 저장 방식으로 옮깁니다."""
+    started_at = time.perf_counter()
+    # 하나의 트랜잭션으로 실행하지만 DDL은 DB/드라이버에 따라 자동 커밋되어
+    # 실패 시 되돌려지지 않을 수 있으므로 실행 전에 백업해 두세요.
+    async with engine.begin() as conn:
+        moved, skipped = await conn.run_sync(_migrate, batch_size)
+    await engine.dispose()
+
+    print(
+        f"✅ 블락리스트 {moved:,}건을 옮겼습니다 "
+        f"(만료되었거나 UUID가 아닌 {skipped:,}건 제외, "
+        f"{time.perf_counter() - started_at:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="토큰 블락리스트 jti 저장 방식 마이그레이션"
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(migrate_token_blocklist(batch_size=args.batch_size))
+
+# poetry run python -m src.scripts.migrate_token_blocklist
+# 위 명령어로 jti를 문자열로 저장하던 테이블이나 created_at 컬럼이 없는 기존 token_blocklist 테이블을
+# 현재 모델에 맞게 옮길 수 있습니다.
+# 서버를 멈춘 상태에서 실행하세요. 실행 중에 추가된 폐기 항목은 옮겨지지 않을 수 있습니다.
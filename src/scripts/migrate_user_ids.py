@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    MetaData,
+    Table,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.types import NullType
+
+from src.core.config import settings
+from src.db.base import engine
+from src.db.ids import uuid7
+from src.users.models import User
+from src.users.schemas import normalize_email, normalize_username
+
+_OLD_TABLE = "users_old"
+
+
+def _normalize_id(value: str | bytes) -> str:
+    # 이전 테이블이 어느 저장 방식이었든 36자 문자열로 맞춥니다.
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return str(uuid.UUID(bytes=bytes(value)))
+    return str(uuid.UUID(value))
+
+
+def _reassigned_id(created_at: datetime) -> str:
+    # 기존 가입 시각으로 만들어 ID 순서가 가입 순서와 일치하도록 합니다 (naive 값은 UTC로 간주).
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return str(uuid7(int(created_at.timestamp() * 1000)))
+
+
+def _migrate(conn: Connection, reassign: bool, batch_size: int) -> int:
+    """
+    users 테이블을 현재 모델(USER_ID_STORAGE 설정 포함)의 스키마로 다시 만들고 행을 옮깁니다.
+
+    1. 기존 테이블 이름을 users_old로 바꾸고 인덱스를 삭제합니다 (SQLite는 인덱스 이름이 DB 전역).
+    2. 현재 모델로 users 테이블을 만듭니다.
+       username_normalized의 바이너리 콜레이션(MySQL utf8mb4_bin)도 이때 적용됩니다.
+    3. 기존 기본 키 순으로 batch_size개씩 읽어 ID를 변환하고 이메일/사용자명을 정규화해 넣습니다.
+       대소문자만 다른 이메일/사용자명이 있으면 고유 인덱스 위반으로 중단됩니다.
+    4. users_old를 삭제합니다.
+
+    :return: 옮긴 행 수
+    """
+    tables = inspect(conn).get_table_names()
+    if _OLD_TABLE in tables:
+        raise RuntimeError(
+            f"{_OLD_TABLE} 테이블이 남아있습니다. 이전 마이그레이션 결과를 확인한 뒤 정리하세요."
+        )
+    if "users" not in tables:
+        return 0
+
+    conn.execute(text(f"ALTER TABLE users RENAME TO {_OLD_TABLE}"))
+    # SQLite는 BINARY(16)을 NUMERIC으로 반영하므로 ID는 변환 없이 읽도록 타입을 지정합니다.
+    old = Table(
+        _OLD_TABLE,
+        MetaData(),
+        Column("id", NullType(), primary_key=True),
+        autoload_with=conn,
+    )
+    for index in list(old.indexes):
+        index.drop(conn)
+    User.__table__.create(conn)
+
+    columns = [column.name for column in User.__table__.columns if column.name in old.c]
+    query = select(*(old.c[name] for name in columns)).order_by(old.c.id)
+    moved = 0
+    last_id = None
+    while True:
+        # 같은 커넥션에서 INSERT와 번갈아 실행하므로 스트리밍 대신 기본 키 범위로 나눠 읽습니다.
+        page = query if last_id is None else query.where(old.c.id > last_id)
+        rows = conn.execute(page.limit(batch_size)).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        batch = []
+        for row in rows:
+            values = dict(zip(columns, row, strict=True))
+            # 정규화 이전에 만든 테이블에서 옮기는 경우를 위해 다시 정규화합니다.
+            values["email"] = normalize_email(values["email"])
+            values["username_normalized"] = normalize_username(values["username"])
+            values["id"] = (
+                _reassigned_id(values["created_at"])
+                if reassign
+                else _normalize_id(values["id"])
+            )
+            batch.append(values)
+        conn.execute(insert(User.__table__), batch)
+        moved += len(batch)
+
+    old.drop(conn)
+    return moved
+
+
+async def migrate_user_ids(reassign: bool, batch_size: int):
+    """users 테이블의 ID 저장 방식을 현재 설정에 맞게 옮깁니다."""
+    started_at = time.perf_counter()
+    # 하나의 트랜잭션으로 실행하지만 DDL은 DB/드라이버에 따라 자동 커밋되어
+    # 실패 시 되돌려지지 않을 수 있으므로 실행 전에 백업해 두세요.
+    async with engine.begin() as conn:
+        moved = await conn.run_sync(_migrate, reassign, batch_size)
+    await engine.dispose()
+
+    print(
+        f"✅ 사용자 {moved:,}명을 옮겼습니다 "
+        f"(저장 방식: {settings.USER_ID_STORAGE}, "
+        f"ID: {'UUIDv7로 재발급' if reassign else '유지'}, "
+        f"{time.perf_counter() - started_at:.1f}초)"
+    )
+    if reassign:
+        print("⚠️  ID가 바뀌었으므로 기존에 발급된 토큰은 더 이상 사용할 수 없습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 ID 저장 방식 마이그레이션")
+    parser.add_argument(
+        "--reassign",
+        action="store_true",
+        help="기존 ID를 가입 시각 기준 UUIDv7로 다시 발급합니다 (기존 토큰 무효화)",
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(migrate_user_ids(reassign=args.reassign, batch_size=args.batch_size))
+
+# USER_ID_STORAGE=binary poetry run python -m src.scripts.migrate_user_ids
+# 위 명령어로 기존 users 테이블을 현재 ID 설정과 모델 스키마에 맞게 옮길 수 있습니다.
+# username_normalized 콜레이션이 바이너리가 아닌 MySQL 테이블(접두사 검색 결과 누락)도 같은 명령어로 다시 만들 수 있습니다.
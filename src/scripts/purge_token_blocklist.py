@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+
+from src.auth import service
+from src.core.config import settings
+from src.db.base import AsyncSessionLocal
+
+
+async def purge_token_blocklist(chunk_size: int):
+    """만료된 토큰 블락리스트 항목을 정리합니다."""
+    async with AsyncSessionLocal() as db:
+        report = await service.purge_expired_blocklist(db=db, chunk_size=chunk_size)
+
+    print(
+        f"✅ 만료된 블락리스트 {report.purged}건을 {report.chunks}번에 나누어 "
+        f"{report.elapsed_seconds:.3f}초 동안 정리했습니다."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="만료된 토큰 블락리스트 정리")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.TOKEN_BLOCKLIST_PURGE_CHUNK_SIZE,
+        help="한 번에 삭제할 최대 행 수",
+    )
+    args = parser.parse_args()
+    asyncio.run(purge_token_blocklist(chunk_size=args.chunk_size))
+
+# poetry run python -m src.scripts.purge_token_blocklist --chunk-size 1000
+# 위 명령어로 만료된 블락리스트 항목을 정리할 수 있습니다.
@@ -0,0 +1,255 @@
+import codecs
+import csv
+import json
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Literal
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.security import get_bulk_hashing_executor, hash_passwords_bulk
+from src.users.counts import user_counts
+from src.users.models import User
+from src.users.schemas import (
+    BulkImportError,
+    BulkImportReport,
+    UserCreate,
+    normalize_username,
+)
+
+ImportFormat = Literal["ndjson", "csv"]
+
+DUPLICATE_IN_FILE = "파일 안에서 중복된 이메일 또는 사용자 이름입니다."
+DUPLICATE_IN_DB = "이미 사용 중인 이메일 또는 사용자 이름입니다."
+
+
+async def iter_text_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    UTF-8 바이트 조각 스트림을 줄 단위 문자열로 나눕니다.
+
+    :param chunks: 요청 본문 등 바이트 조각 스트림
+    :return: 줄바꿈을 제거한 문자열 이터레이터
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _iter_records(
+    lines: AsyncIterator[str], import_format: ImportFormat
+) -> AsyncIterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """
+    줄 단위 입력을 (줄 번호, 레코드, 파싱 오류)로 변환합니다.
+    CSV는 첫 줄을 헤더로 사용하며, 한 행이 여러 줄에 걸친 값은 지원하지 않습니다.
+    """
+    header: list[str] | None = None
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+
+        if import_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_no, None, "JSON 형식이 올바르지 않습니다."
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "각 줄은 JSON 객체여야 합니다."
+                continue
+            yield line_no, record, None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+        if len(values) != len(header):
+            yield line_no, None, "CSV 컬럼 수가 헤더와 다릅니다."
+            continue
+        # CSV의 빈 값은 생략한 것으로 처리합니다 (profile_image_path 등)
+        yield (
+            line_no,
+            {key: value for key, value in zip(header, values, strict=True) if value},
+            None,
+        )
+
+
+def _describe(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in err.errors()
+    )
+
+
+async def _insert_batch(
+    db: AsyncSession,
+    batch: list[tuple[int, UserCreate]],
+    executor: Executor,
+    errors: list[BulkImportError],
+) -> int:
+    """
+    검증을 마친 행 묶음을 한 번의 다중 행 INSERT와 한 번의 커밋으로 가입시킵니다.
+
+    :return: 가입된 사용자 수
+    """
+    emails = [user_in.email for _, user_in in batch]
+    usernames = [normalize_username(user_in.username) for _, user_in in batch]
+    result = await db.execute(
+        select(User.email, User.username_normalized).where(
+            or_(User.email.in_(emails), User.username_normalized.in_(usernames))
+        )
+    )
+    taken = {value for row in result.all() for value in row}
+
+    rows = []
+    for line_no, user_in in batch:
+        if user_in.email in taken or normalize_username(user_in.username) in taken:
+            errors.append(
+                BulkImportError(
+                    line=line_no, email=user_in.email, error=DUPLICATE_IN_DB
+                )
+            )
+        else:
+            rows.append((line_no, user_in))
+    if not rows:
+        return 0
+
+    hashed_passwords = await hash_passwords_bulk(
+        [user_in.password for _, user_in in rows], executor
+    )
+    values = [
+        {
+            **user_in.model_dump(mode="json", exclude={"password"}),
+            "username_normalized": normalize_username(user_in.username),
+            "hashed_password": hashed_password,
+        }
+        for (_, user_in), hashed_password in zip(rows, hashed_passwords, strict=True)
+    ]
+
+    try:
+        await db.execute(insert(User), values)
+        await db.commit()
+        inserted = len(values)
+    except IntegrityError:
+        # 조회 이후 다른 요청이 같은 값으로 가입한 경우: 행 단위로 다시 넣어 실패한 행만 골라냅니다.
+        await db.rollback()
+        inserted = 0
+        for (line_no, user_in), value in zip(rows, values, strict=True):
+            try:
+                await db.execute(insert(User), [value])
+                await db.commit()
+                inserted += 1
+            except IntegrityError:
+                await db.rollback()
+                errors.append(
+                    BulkImportError(
+                        line=line_no, email=user_in.email, error=DUPLICATE_IN_DB
+                    )
+                )
+
+    user_counts.add((True, False), inserted)
+    return inserted
+
+
+async def import_users(
+    db: AsyncSession,
+    lines: AsyncIterator[str],
+    import_format: ImportFormat,
+    batch_size: int | None = None,
+    executor: Executor | None = None,
+    max_rows: int | None = None,
+) -> BulkImportReport:
+    """
+    NDJSON/CSV 입력을 스트리밍으로 읽어 사용자를 일괄 가입시킵니다.
+
+    각 행은 UserCreate로 검증하고, batch_size개씩 모아 비밀번호를 워커 풀에서 병렬로
+    해싱한 뒤 다중 행 INSERT 한 번으로 저장합니다. 검증 실패나 중복은 해당 행만
+    오류 리포트에 남기고 나머지 행은 계속 처리합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param lines: 줄 단위 입력
+    :param import_format: 입력 형식 ("ndjson" 또는 "csv")
+    :param batch_size: INSERT 한 번에 넣을 행 수 (기본값: 설정값)
+    :param executor: 해싱에 사용할 워커 풀 (None이면 공유 일괄 가입용 프로세스 풀 사용)
+    :param max_rows: 처리할 최대 행 수 (None이면 제한 없음). 넘으면 읽기를 멈추고
+        그때까지의 결과를 truncated, resume_line과 함께 반환합니다.
+    :return: 가입 결과 리포트
+    """
+    batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+    executor = executor or get_bulk_hashing_executor()
+
+    started_at = time.perf_counter()
+    errors: list[BulkImportError] = []
+    seen: set[str] = set()
+    batch: list[tuple[int, UserCreate]] = []
+    total_rows = imported = batches = 0
+    resume_line: int | None = None
+
+    async for line_no, record, parse_error in _iter_records(lines, import_format):
+        if max_rows is not None and total_rows >= max_rows:
+            # 이미 커밋된 묶음이 있으므로 오류로 끝내지 않고 여기까지의 결과를 반환합니다.
+            resume_line = line_no
+            break
+        total_rows += 1
+        if record is None:
+            errors.append(BulkImportError(line=line_no, error=parse_error))
+            continue
+
+        try:
+            user_in = UserCreate.model_validate(record)
+        except ValidationError as err:
+            errors.append(
+                BulkImportError(
+                    line=line_no,
+                    email=str(record.get("email")) if "email" in record else None,
+                    error=_describe(err),
+                )
+            )
+            continue
+
+        username = normalize_username(user_in.username)
+        if user_in.email in seen or username in seen:
+            errors.append(
+                BulkImportError(
+                    line=line_no, email=user_in.email, error=DUPLICATE_IN_FILE
+                )
+            )
+            continue
+        seen.update((user_in.email, username))
+
+        batch.append((line_no, user_in))
+        if len(batch) >= batch_size:
+            imported += await _insert_batch(db, batch, executor, errors)
+            batches += 1
+            batch = []
+
+    if batch:
+        imported += await _insert_batch(db, batch, executor, errors)
+        batches += 1
+
+    elapsed_seconds = time.perf_counter() - started_at
+    errors.sort(key=lambda error: error.line)
+    return BulkImportReport(
+        total_rows=total_rows,
+        imported=imported,
+        failed=len(errors),
+        batches=batches,
+        elapsed_seconds=elapsed_seconds,
+        rows_per_second=imported / elapsed_seconds if elapsed_seconds else 0.0,
+        errors=errors,
+        truncated=resume_line is not None,
+        resume_line=resume_line,
+    )
@@ -0,0 +1,211 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from src.core.config import settings
+from src.users.models import User
+
+
+class UserCacheBackend(ABC):
+    """
+    사용자 캐시 저장소 인터페이스입니다.
+    Redis 같은 공유 저장소를 사용하려면 이 클래스를 구현해 UserCache에 전달합니다.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+    @abstractmethod
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        """
+        정수 값을 1 올리고 올린 값을 반환합니다. 키가 없으면 0에서 시작합니다.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    def size(self) -> int:
+        """
+        저장된 항목 수를 반환합니다. 알 수 없는 저장소는 -1을 반환합니다.
+        """
+        return -1
+
+
+class InMemoryUserCacheBackend(UserCacheBackend):
+    """
+    프로세스 내부 LRU/TTL 저장소입니다. 기본 저장소로 사용됩니다.
+    무효화가 같은 프로세스에만 전달되므로 워커가 하나일 때만 사용해야 합니다.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        value = (await self.get(key) or 0) + 1
+        await self.set(key, value, ttl_seconds)
+        return value
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class UserCache:
+    """
+    users 행을 컬럼 값 스냅샷으로 보관하는 읽기 캐시입니다.
+    비밀번호 해시는 스냅샷에 넣지 않습니다 (캐시에서 불러온 사용자는 hashed_password가 로드되지 않은 상태).
+
+    사용자마다 버전 키를 두고 무효화할 때마다 저장소에서 올립니다. 조회 전에 읽어둔 버전이
+    저장할 때 바뀌어 있으면 조회 결과를 저장하지 않으므로, 조회와 수정이 겹쳐도 수정 전 행이
+    캐시에 남지 않습니다. 버전과 무효화 모두 저장소를 거치므로 Redis 같은 공유 저장소를 쓰면
+    모든 워커에 반영됩니다.
+    """
+
+    # 캐시에 보관하지 않는 컬럼
+    EXCLUDED_COLUMNS = frozenset({"hashed_password"})
+
+    def __init__(self, backend: UserCacheBackend, ttl_seconds: int) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _id_key(user_id: str) -> str:
+        return f"user:id:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: str) -> str:
+        return f"user:version:{user_id}"
+
+    @classmethod
+    def _snapshot(cls, user: User) -> dict[str, Any] | None:
+        state = inspect(user)
+        if (state.unloaded - cls.EXCLUDED_COLUMNS) or state.modified:
+            return None  # 만료되었거나 커밋되지 않은 변경이 있으면 캐시하지 않음
+        return {
+            attr.key: state.dict[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key not in cls.EXCLUDED_COLUMNS
+        }
+
+    @staticmethod
+    async def _attach(db: AsyncSession, snapshot: dict[str, Any]) -> User:
+        """
+        스냅샷으로 User 인스턴스를 만들어 SQL 없이 세션에 연결합니다.
+        세션에 이미 같은 사용자가 있다면 스냅샷으로 덮어쓰지 않고 그대로 반환합니다.
+        """
+        existing = db.identity_map.get(identity_key(User, snapshot["id"]))
+        if existing is not None:
+            return existing
+
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    async def get_by_id(self, db: AsyncSession, user_id: str) -> User | None:
+        """
+        캐시된 사용자를 세션에 연결해 반환합니다. 없으면 None을 반환합니다.
+
+        :param db: 비동기 데이터베이스 세션
+        :param user_id: 조회할 사용자 ID
+        :return: 사용자 모델 또는 None
+        """
+        snapshot = await self.backend.get(self._id_key(user_id))
+        if snapshot is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return await self._attach(db, snapshot)
+
+    async def version(self, user_id: str) -> int:
+        """
+        사용자의 현재 캐시 버전을 반환합니다. DB 조회 직전에 읽어 set에 전달합니다.
+        """
+        return await self.backend.get(self._version_key(user_id)) or 0
+
+    async def set(self, user: User, version: int) -> None:
+        """
+        조회한 사용자를 캐시에 저장합니다.
+
+        :param user: DB에서 조회한 사용자 모델
+        :param version: DB 조회 직전에 읽은 사용자의 캐시 버전
+        """
+        if await self.version(user.id) != version:
+            return  # 조회 도중 (다른 워커에서라도) 무효화가 일어났으므로 저장하지 않음
+
+        snapshot = self._snapshot(user)
+        if snapshot is None:
+            return
+
+        await self.backend.set(self._id_key(user.id), snapshot, self.ttl_seconds)
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        사용자의 캐시 항목을 제거합니다. 사용자 행을 수정한 뒤 호출합니다.
+
+        :param user_id: 사용자 ID
+        """
+        # 버전 키는 스냅샷보다 오래 남아야 조회 중 무효화를 감지할 수 있습니다.
+        await self.backend.incr(self._version_key(user_id), self.ttl_seconds * 2)
+        await self.backend.delete(self._id_key(user_id))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+
+    def metrics(self) -> dict[str, int | float]:
+        """
+        캐시 크기와 적중/미적중 횟수, 적중률을 반환합니다.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+user_cache = UserCache(
+    backend=InMemoryUserCacheBackend(max_size=settings.USER_CACHE_MAX_SIZE),
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,98 @@
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.users.models import User
+from src.users.schemas import UserCounts
+
+Bucket = tuple[bool, bool]  # (is_active, is_admin)
+
+
+class UserCountCache:
+    """
+    (is_active, is_admin) 구분별 사용자 수를 보관하는 카운터입니다.
+
+    사용자 생성/삭제/비활성화/관리자 변경 시 증감하고, TTL이 지나면 GROUP BY 한 번으로
+    다시 맞춥니다. 여러 워커가 각자 카운터를 가지므로 다른 워커의 변경은 다음 갱신 때
+    반영되며, 정확한 값이 필요하면 exact 모드로 바로 다시 셉니다.
+    """
+
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._buckets: dict[Bucket, int] = {}
+        self._loaded_at: float | None = None
+        self.refreshes = 0
+
+    @property
+    def fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """
+        구분별 사용자 수를 DB에서 다시 셉니다.
+
+        :param db: 비동기 데이터베이스 세션
+        """
+        result = await db.execute(
+            select(User.is_active, User.is_admin, func.count()).group_by(
+                User.is_active, User.is_admin
+            )
+        )
+        self._buckets = {
+            (bool(is_active), bool(is_admin)): count
+            for is_active, is_admin, count in result.all()
+        }
+        self._loaded_at = time.monotonic()
+        self.refreshes += 1
+
+    async def get(self, db: AsyncSession, exact: bool = False) -> UserCounts:
+        """
+        구분별 사용자 수를 반환합니다. TTL이 지났거나 exact이면 다시 셉니다.
+
+        :param db: 비동기 데이터베이스 세션
+        :param exact: True이면 캐시와 관계없이 DB에서 센 값을 반환
+        :return: 사용자 수
+        """
+        if exact or not self.fresh:
+            await self.refresh(db)
+
+        def count(predicate) -> int:
+            return sum(n for bucket, n in self._buckets.items() if predicate(*bucket))
+
+        return UserCounts(
+            total=count(lambda is_active, is_admin: True),
+            active=count(lambda is_active, is_admin: is_active),
+            inactive=count(lambda is_active, is_admin: not is_active),
+            admins=count(lambda is_active, is_admin: is_admin),
+        )
+
+    def add(self, bucket: Bucket, delta: int) -> None:
+        """
+        구분의 사용자 수를 증감합니다. 아직 센 적이 없다면 무시합니다.
+
+        :param bucket: (is_active, is_admin)
+        :param delta: 증감할 수
+        """
+        if self._loaded_at is None:
+            return
+        self._buckets[bucket] = max(0, self._buckets.get(bucket, 0) + delta)
+
+    def move(self, old: Bucket, new: Bucket) -> None:
+        """
+        사용자 한 명을 다른 구분으로 옮깁니다.
+        """
+        if old != new:
+            self.add(old, -1)
+            self.add(new, 1)
+
+    def clear(self) -> None:
+        self._buckets = {}
+        self._loaded_at = None
+
+
+user_counts = UserCountCache(ttl_seconds=settings.USER_COUNT_CACHE_TTL_SECONDS)
@@ -1,26 +1,38 @@
-from typing import Sequence
+from datetime import datetime, timezone
+from typing import AsyncIterator, Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import Row, select, tuple_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.db.ids import canonical_uuid, is_uuid
+from src.users.cache import user_cache
+from src.users.counts import user_counts
 from src.users.models import User
-from src.users.schemas import UserCreate, UserUpdate
+from src.users.schemas import (
+    UserCreate,
+    UserUpdate,
+    normalize_email,
+    normalize_username,
+)
 
 
-async def _commit_and_refresh(db: AsyncSession, instance: User) -> User:
+async def _commit(db: AsyncSession, instance: User) -> User:
     """
-    데이터베이스에 변경 사항을 커밋하고 인스턴스를 새로 고칩니다.
+    데이터베이스에 변경 사항을 커밋하고 커밋한 사용자의 캐시 항목을 무효화합니다.
+    서버에서 생성되는 컬럼(created_at, updated_at 등)은 User 매퍼의 eager_defaults 설정에 따라
+    INSERT/UPDATE ... RETURNING으로 함께 받아오므로 별도로 새로 고치지 않습니다.
 
     :param db: 비동기 데이터베이스 세션
-    :param instance: 새로 고칠 인스턴스
-    :return: 새로 고친 인스턴스
+    :param instance: 커밋할 인스턴스
+    :return: 커밋된 인스턴스
     :raises: DB 관련 예외를 그대로 전파
     """
     try:
         await db.commit()
-        await db.refresh(instance)
+        await user_cache.invalidate(instance.id)
         return instance
     except Exception:
         await db.rollback()
@@ -45,18 +57,23 @@ async def create_user(
     )  #  User 모델에 없는 'password' 필드를 딕셔너리에서 제거
     db_user = User(
         **create_data,
+        username_normalized=normalize_username(user_in.username),
         hashed_password=hashed_password,
+        last_write_at=None,  # 지정해 두어야 생성 직후 모든 컬럼이 로드된 상태로 캐시됨
     )
 
     db.add(db_user)
     try:
-        return await _commit_and_refresh(db, db_user)
+        await _commit(db, db_user)
     except IntegrityError as err:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="이미 사용 중인 이메일 또는 사용자 이름입니다.",
         ) from err
 
+    user_counts.add((db_user.is_active, db_user.is_admin), 1)
+    return db_user
+
 
 async def get_user(db: AsyncSession, user_id: str) -> User | None:
     """
@@ -66,33 +83,95 @@ async def get_user(db: AsyncSession, user_id: str) -> User | None:
     :param user_id: 조회할 사용자 ID
     :return: 사용자 모델 또는 None
     """
-    return await db.get(User, user_id)
+    # 경로 등에서 받은 ID가 UUID 형식이 아니면 바이너리 저장 시 바인딩할 수 없으므로 조회하지 않습니다.
+    if not is_uuid(user_id):
+        return None
+    user_id = canonical_uuid(user_id)
+
+    if settings.USER_CACHE_ENABLED:
+        cached = await user_cache.get_by_id(db, user_id)
+        if cached is not None:
+            return cached
+
+    if not settings.USER_CACHE_ENABLED:
+        return await db.get(User, user_id)
+
+    # 조회 도중 무효화가 일어나면 이 결과는 캐시에 저장되지 않습니다.
+    version = await user_cache.version(user_id)
+    db_user = await db.get(User, user_id)
+    if db_user is not None:
+        await user_cache.set(db_user, version)
+    return db_user
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     """
     이메일로 사용자를 조회합니다.
+    이메일은 소문자로 정규화해 저장하므로 입력도 같은 방식으로 정규화해 인덱스로 조회합니다.
+    로그인에서 비밀번호 해시와 최신 활성 상태가 필요하므로 사용자 캐시를 거치지 않습니다.
 
     :param db: 비동기 데이터베이스 세션
-    :param email: 조회할 사용자 이메일
+    :param email: 조회할 사용자 이메일 (대소문자 무관)
     :return: 사용자 모델 또는 None
     """
+    email = normalize_email(email)
     result = await db.execute(select(User).where(User.email == email))
     return result.scalars().first()
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     """
-    사용자 이름으로 사용자를 조회합니다.
+    사용자 이름으로 사용자를 조회합니다. 대소문자를 구분하지 않습니다.
 
     :param db: 비동기 데이터베이스 세션
     :param username: 조회할 사용자 이름
     :return: 사용자 모델 또는 None
     """
-    result = await db.execute(select(User).where(User.username == username))
+    result = await db.execute(
+        select(User).where(User.username_normalized == normalize_username(username))
+    )
     return result.scalars().first()
 
 
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """
+    prefix로 시작하는 모든 문자열보다 큰 가장 작은 문자열을 반환합니다 (마지막 글자 + 1).
+    코드 포인트 순 비교를 전제로 하므로 username_normalized 컬럼은 바이너리 콜레이션이어야 합니다.
+    """
+    if prefix[-1] == chr(0x10FFFF):
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+async def search_users_by_prefix(
+    db: AsyncSession, prefix: str, limit: int = 10
+) -> Sequence[User]:
+    """
+    사용자 이름이 prefix로 시작하는 활성 사용자를 사용자 이름 순으로 조회합니다. 대소문자를 구분하지 않습니다.
+    LIKE 'x%' 대신 username_normalized >= prefix AND < (prefix의 다음 값) 범위 조건을 사용하므로
+    ix_users_username_normalized 인덱스 범위 조회로 처리되고, limit개를 채우면 더 읽지 않습니다.
+    범위 조건은 코드 포인트 순 정렬을 전제로 하며, 컬럼은 MySQL에서 utf8mb4_bin 콜레이션을 사용합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param prefix: 사용자 이름 접두사 (1자 이상)
+    :param limit: 조회할 최대 사용자 수
+    :return: 사용자 모델 리스트
+    """
+    normalized = normalize_username(prefix)
+    query = (
+        select(User)
+        .where(User.username_normalized >= normalized, User.is_active.is_(True))
+        .order_by(User.username_normalized)
+        .limit(limit)
+    )
+    upper_bound = _prefix_upper_bound(normalized)
+    if upper_bound is not None:
+        query = query.where(User.username_normalized < upper_bound)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
 async def get_users(
     db: AsyncSession, skip: int = 0, limit: int = 100
 ) -> Sequence[User]:
@@ -111,6 +190,57 @@ async def get_users(
     return result.scalars().all()
 
 
+async def get_users_by_cursor(
+    db: AsyncSession, after: tuple[datetime, str] | None = None, limit: int = 100
+) -> Sequence[User]:
+    """
+    (created_at, id) 내림차순으로 사용자 목록을 키셋 페이지네이션으로 조회합니다.
+    OFFSET 대신 이전 페이지의 마지막 키 이후부터 읽으므로 페이지 깊이와 관계없이
+    ix_users_created_at_id 인덱스 범위 조회 한 번으로 끝납니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param after: 이전 페이지 마지막 사용자의 (created_at, id), 첫 페이지는 None
+    :param limit: 조회할 최대 사용자 수
+    :return: 사용자 모델 리스트
+    """
+    query = select(User).order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+    if after is not None:
+        # 행 값 비교는 (created_at, id) 인덱스의 범위 조회로 처리됩니다.
+        # OR로 풀어 쓰면 SQLite가 범위 조건을 created_at에만 적용해 깊이에 비례해 느려집니다.
+        query = query.where(tuple_(User.created_at, User.id) < after)
+
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def stream_users(
+    db: AsyncSession,
+    columns: Sequence[str],
+    is_active: bool | None = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    사용자 행을 서버 측 커서로 batch_size개씩 나누어 반환합니다.
+    ORM 객체를 만들지 않고 요청한 컬럼만 읽으므로, 테이블 크기와 관계없이
+    한 번에 batch_size개 행만 메모리에 올라갑니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param columns: 조회할 User 컬럼 이름 목록
+    :param is_active: 활성 상태로 필터링 (None이면 전체)
+    :param batch_size: 한 번에 가져올 행 수
+    :return: 행 묶음을 반환하는 비동기 이터레이터
+    """
+    query = select(*(getattr(User, column) for column in columns)).order_by(
+        User.created_at, User.id
+    )
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for rows in result.partitions():
+        yield rows
+
+
 async def update_user(db: AsyncSession, db_user: User, user_update: UserUpdate) -> User:
     """
     사용자의 정보를 업데이트합니다.
@@ -122,6 +252,8 @@ async def update_user(db: AsyncSession, db_user: User, user_update: UserUpdate)
     :raises HTTPException: 사용자 이름이 이미 존재하는 경우
     """
     update_data = user_update.model_dump(mode="json", exclude_unset=True)
+    if update_data.get("username") is not None:
+        update_data["username_normalized"] = normalize_username(update_data["username"])
     is_updated = False
 
     for key, value in update_data.items():
@@ -132,7 +264,7 @@ async def update_user(db: AsyncSession, db_user: User, user_update: UserUpdate)
     # 변경된 내용이 있는 경우에만 커밋
     if is_updated:
         try:
-            return await _commit_and_refresh(db, db_user)
+            return await _commit(db, db_user)
         except IntegrityError as err:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -153,13 +285,15 @@ async def deactivate_user(db: AsyncSession, db_user: User) -> User:
     """
     if db_user.is_active:
         db_user.is_active = False
+        db_user.token_version += 1  # 비활성화된 사용자의 토큰을 모두 무효화
         try:
-            return await _commit_and_refresh(db, db_user)
+            await _commit(db, db_user)
         except Exception as err:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="사용자 비활성화 중 오류가 발생했습니다.",
             ) from err
+        user_counts.move((True, db_user.is_admin), (False, db_user.is_admin))
     return db_user
 
 
@@ -175,6 +309,8 @@ async def delete_user(db: AsyncSession, db_user: User) -> bool:
     try:
         await db.delete(db_user)
         await db.commit()
+        await user_cache.invalidate(db_user.id)
+        user_counts.add((db_user.is_active, db_user.is_admin), -1)
         return True
     except IntegrityError as err:
         raise HTTPException(
@@ -196,12 +332,15 @@ async def update_admin_status(db: AsyncSession, db_user: User, is_admin: bool) -
     if db_user.is_admin != is_admin:
         db_user.is_admin = is_admin
         try:
-            return await _commit_and_refresh(db, db_user)
+            await _commit(db, db_user)
         except Exception as err:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="사용자 관리자 상태 업데이트 중 서버 오류가 발생했습니다.",
             ) from err
+        user_counts.move(
+            (db_user.is_active, not is_admin), (db_user.is_active, is_admin)
+        )
     return db_user
 
 
@@ -218,10 +357,53 @@ async def update_password(
     :raises HTTPException: 비밀번호 업데이트 중 오류가 발생한 경우
     """
     db_user.hashed_password = hashed_password
+    db_user.token_version += 1  # 비밀번호 변경 시 기존 토큰을 모두 무효화
     try:
-        return await _commit_and_refresh(db, db_user)
+        return await _commit(db, db_user)
     except Exception as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="사용자 비밀번호 업데이트 중 서버 오류가 발생했습니다.",
         ) from err
+
+
+async def bump_token_version(db: AsyncSession, db_user: User) -> User:
+    """
+    사용자의 토큰 버전을 올려 지금까지 발급된 모든 토큰을 무효화합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param db_user: 토큰을 무효화할 사용자 모델
+    :return: 업데이트된 사용자 모델
+    :raises HTTPException: 업데이트 중 오류가 발생한 경우
+    """
+    db_user.token_version += 1
+    try:
+        return await _commit(db, db_user)
+    except Exception as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="사용자 토큰 폐기 중 서버 오류가 발생했습니다.",
+        ) from err
+
+
+async def record_write(db: AsyncSession, user_id: str) -> bool:
+    """
+    사용자가 쓰기 요청을 수행한 시각을 기록합니다.
+    이후 요청의 인증 단계에서 이 값을 주 DB에서 읽어 복제 지연 동안 주 DB에서 조회하도록 합니다.
+    프로필 수정 시각(updated_at)은 바꾸지 않습니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param user_id: 쓰기를 수행한 사용자 ID
+    :return: 사용자 행을 갱신했으면 True (삭제된 사용자면 False)
+    """
+    result = await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(last_write_at=datetime.now(timezone.utc), updated_at=User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if not result.rowcount:
+        return False
+    await user_cache.invalidate(user_id)
+    return True
@@ -1,21 +1,58 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Path, status
+from fastapi import Depends, HTTPException, Path, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_async_db
 from src.users import crud, models
 
 
-async def get_user_by_id_or_404(
+class UserLoader:
+    """
+    요청 단위로 사용자를 조회하는 로더입니다.
+    같은 요청에서 이미 조회한 사용자는 다시 조회하지 않고 그대로 반환합니다.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self._users: dict[str, models.User | None] = {}
+        self.select_count = 0  # 디버그용: 실제로 DB 조회를 요청한 횟수
+
+    async def get(self, user_id: str) -> models.User | None:
+        """
+        사용자 ID로 사용자를 조회합니다.
+
+        :param user_id: 조회할 사용자 ID
+        :return: 사용자 모델 또는 None
+        """
+        if user_id not in self._users:
+            self.select_count += 1
+            self._users[user_id] = await crud.get_user(db=self.db, user_id=user_id)
+        return self._users[user_id]
+
+
+async def get_user_loader(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> UserLoader:
+    """
+    요청마다 하나의 UserLoader를 생성합니다.
+    FastAPI 의존성 캐시로 같은 요청의 모든 의존성이 같은 로더와 세션을 공유합니다.
+    """
+    loader = UserLoader(db)
+    request.state.user_loader = loader
+    return loader
+
+
+async def get_user_by_id_or_404(
+    loader: Annotated[UserLoader, Depends(get_user_loader)],
     user_id: str = Path(),
 ) -> models.User:
     """
     경로 매개변수에서 user_id를 받아 사용자를 조회하고,
     없으면 404 예외를 발생시키는 의존성 함수.
     """
-    user = await crud.get_user(db=db, user_id=user_id)
+    user = await loader.get(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
@@ -0,0 +1,109 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Literal, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.routing import READ_ONLY
+from src.users import crud
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# 내보낼 수 있는 컬럼 (비밀번호 해시와 토큰 버전은 제외)
+EXPORT_COLUMNS = (
+    "id",
+    "email",
+    "username",
+    "profile_image_path",
+    "is_active",
+    "is_admin",
+    "created_at",
+    "updated_at",
+)
+
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def parse_export_columns(columns: str | None) -> list[str]:
+    """
+    쉼표로 구분한 컬럼 목록을 검증합니다. 생략하면 내보낼 수 있는 모든 컬럼을 반환합니다.
+
+    :param columns: 쉼표로 구분한 컬럼 이름
+    :return: 컬럼 이름 목록
+    :raises HTTPException: 내보낼 수 없는 컬럼이 포함된 경우 400 에러 발생
+    """
+    if not columns:
+        return list(EXPORT_COLUMNS)
+
+    selected = [column.strip() for column in columns.split(",") if column.strip()]
+    unknown = [column for column in selected if column not in EXPORT_COLUMNS]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"내보낼 수 없는 컬럼입니다: {', '.join(unknown)}",
+        )
+    return selected
+
+
+def _to_text(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _encode_ndjson(columns: Sequence[str], rows: Sequence[Row]) -> str:
+    return "".join(
+        json.dumps(
+            {
+                column: _to_text(value)
+                for column, value in zip(columns, row, strict=True)
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows: Sequence[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_to_text(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+async def export_users(
+    session_factory: async_sessionmaker[AsyncSession],
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    is_active: bool | None = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[str]:
+    """
+    사용자 목록을 NDJSON 또는 CSV로 인코딩해 batch_size개 행씩 반환합니다.
+    세션은 이 생성기 안에서 열고 닫으므로 StreamingResponse와 CLI 모두에서 사용할 수 있습니다.
+
+    :param session_factory: 세션 팩토리
+    :param export_format: 출력 형식 ("ndjson" 또는 "csv")
+    :param columns: 내보낼 컬럼 이름 목록
+    :param is_active: 활성 상태로 필터링 (None이면 전체)
+    :param batch_size: 한 번에 읽고 인코딩할 행 수
+    :return: 인코딩된 문자열 조각을 반환하는 비동기 이터레이터
+    """
+    async with session_factory() as db:
+        db.info[READ_ONLY] = True  # 복제본이 설정되어 있으면 복제본에서 읽음
+        if export_format == "csv":
+            yield _encode_csv([columns])
+
+        async for rows in crud.stream_users(
+            db=db, columns=columns, is_active=is_active, batch_size=batch_size
+        ):
+            if export_format == "csv":
+                yield _encode_csv(rows)
+            else:
+                yield _encode_ndjson(columns, rows)
@@ -1,11 +1,24 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, Integer, String
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
+from src.core.config import settings
 from src.db.base import Base
+from src.db.ids import generate_id
+from src.db.types import BinaryUUID, SecondsDateTime
+from src.users.schemas import normalize_username
+
+
+def _new_user_id() -> str:
+    return generate_id(settings.USER_ID_STRATEGY)
+
+
+def _default_username_normalized(context) -> str:
+    # 값을 직접 지정하지 않은 INSERT에서도 username으로부터 채웁니다.
+    return normalize_username(context.get_current_parameters()["username"])
 
 
 class User(Base):
@@ -15,23 +28,53 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    # 서버 기본값/onupdate 값을 flush 시 RETURNING으로 함께 받아옵니다.
+    # RETURNING을 지원하지 않는 DB에서는 SQLAlchemy가 flush 직후 SELECT로 대신 조회합니다.
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # 사용자 목록의 커서 페이지네이션 (created_at DESC, id DESC) 정렬/범위 조회용
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
+    # API와 토큰의 sub 클레임에서는 저장 방식과 관계없이 36자 UUID 문자열로 다룹니다.
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        BinaryUUID() if settings.USER_ID_STORAGE == "binary" else String(36),
+        primary_key=True,
+        default=_new_user_id,
     )
     email: Mapped[str] = mapped_column(
         String(255), unique=True, index=True, nullable=False
     )
-    username: Mapped[str] = mapped_column(
-        String(50), unique=True, index=True, nullable=False
+    # 표시용 사용자명 (입력한 대소문자 유지)
+    username: Mapped[str] = mapped_column(String(50), nullable=False)
+    # 대소문자를 구분하지 않는 중복 검사/조회용 (schemas.normalize_username 값)
+    # 조회 시 func.lower(username)을 쓰면 인덱스를 타지 못하므로 정규화한 값을 따로 저장합니다.
+    # 접두사 검색은 (접두사, 마지막 글자 + 1) 범위로 조회하므로 코드 포인트 순으로 정렬되어야 합니다.
+    # MySQL 기본 콜레이션(utf8mb4_0900_ai_ci)은 ':'를 숫자보다, '{'를 문자보다 앞에 두어
+    # 'z', '9'로 끝나는 접두사의 범위가 비게 되므로 바이너리 콜레이션을 지정합니다.
+    username_normalized: Mapped[str] = mapped_column(
+        String(50).with_variant(mysql.VARCHAR(50, collation="utf8mb4_bin"), "mysql"),
+        unique=True,
+        index=True,
+        nullable=False,
+        default=_default_username_normalized,
     )
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     profile_image_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean(), default=True)
     is_admin: Mapped[bool] = mapped_column(Boolean(), default=False)
+    # 토큰의 ver 클레임과 비교하며, 증가시키면 발급된 모든 토큰이 무효화됩니다.
+    token_version: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        SecondsDateTime, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        SecondsDateTime, server_default=func.now(), onupdate=func.now()
+    )
+    # 사용자가 마지막으로 쓰기 요청을 수행한 시각 (복제본이 설정된 경우에만 기록)
+    # 인증 시 주 DB에서 읽어 이 시각 이후 유지 시간 동안의 조회를 주 DB로 보냅니다.
+    last_write_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
     )
@@ -14,8 +14,10 @@ class User(Base):
     profile_image_path: Mapped[str | None]
     is_active: Mapped[bool]
     is_admin: Mapped[bool]
+    token_version: Mapped[int]
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime]
+    last_write_at: Mapped[datetime | None]
 
     # Pyre에게 __init__ 메서드가 어떤 키워드 인수든 받을 수 있다고 알려줍니다.
     def __init__(self, **kwargs: Any) -> None: ...
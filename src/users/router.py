@@ -1,11 +1,18 @@
-from typing import Annotated, Sequence
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.auth.dependencies import get_current_active_user
-from src.db.session import get_async_db
-from src.users import models, schemas, service
+from src.auth.dependencies import (
+    get_current_active_user,
+    require_admin,
+    require_self_or_admin,
+)
+from src.common.schemas import PaginatedResponse
+from src.core.config import settings
+from src.db.session import get_async_db, get_async_read_db, get_session_factory
+from src.users import bulk_import, export, models, schemas, service
 from src.users.dependencies import get_user_by_id_or_404
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -46,6 +53,7 @@ async def create_user(
 
 @router.get(
     "/me",
+    dependencies=[Depends(get_async_read_db)],
     response_model=schemas.UserProfile,
     status_code=status.HTTP_200_OK,
     summary="내 프로필 조회",
@@ -60,16 +68,161 @@ async def get_my_profile(
     return current_user
 
 
+@router.post(
+    "/import",
+    response_model=schemas.BulkImportReport,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 일괄 가입",
+    description="요청 본문의 NDJSON 또는 CSV(첫 줄은 헤더)를 읽어 사용자를 일괄 가입시킵니다. 실패한 행은 리포트에 포함됩니다. 본문이 최대 크기를 넘으면 413을 반환하고, 최대 행 수를 넘으면 그때까지의 결과를 truncated와 함께 반환합니다. 관리자만 사용할 수 있습니다.",
+)
+async def handle_import_users(
+    current_user: Annotated[models.User, Depends(require_admin)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    request: Request,
+    import_format: Annotated[
+        bulk_import.ImportFormat,
+        Query(alias="format", description="입력 형식 (ndjson 또는 csv)"),
+    ] = "ndjson",
+) -> schemas.BulkImportReport:
+    """
+    요청 본문을 스트리밍으로 읽어 사용자를 일괄 가입시킵니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param request: 본문을 스트리밍으로 읽기 위한 요청 객체
+    :param import_format: 입력 형식
+    :return: 가입 결과 리포트
+    """
+    # 가입은 묶음 단위로 커밋되므로 크기 제한은 본문을 읽기 전에 확인합니다.
+    # 본문이 Content-Length를 넘지 않는 것은 ASGI 서버가 보장합니다.
+    content_length = request.headers.get("content-length", "")
+    if not content_length.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_411_LENGTH_REQUIRED,
+            detail="Content-Length 헤더가 필요합니다.",
+        )
+    if int(content_length) > settings.BULK_IMPORT_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"요청 본문은 최대 {settings.BULK_IMPORT_MAX_BYTES:,}바이트까지 허용됩니다.",
+        )
+
+    return await bulk_import.import_users(
+        db=db,
+        lines=bulk_import.iter_text_lines(request.stream()),
+        import_format=import_format,
+        max_rows=settings.BULK_IMPORT_MAX_ROWS,
+    )
+
+
+# 정적 경로는 "/{user_id}"보다 먼저 등록해야 사용자 ID로 해석되지 않습니다.
+@router.get(
+    "/counts",
+    dependencies=[Depends(get_async_read_db)],
+    response_model=schemas.UserCounts,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 수 조회",
+    description="전체/활성/비활성/관리자 사용자 수를 조회합니다. 기본적으로 주기적으로 갱신되는 값을 반환합니다.",
+)
+async def handle_get_user_counts(
+    current_user: Annotated[models.User, Depends(require_admin)],
+    db: Annotated[AsyncSession, Depends(get_async_read_db)],
+    exact: bool = Query(False, description="DB에서 다시 센 정확한 값 조회 여부"),
+) -> schemas.UserCounts:
+    """
+    활성/관리자 구분별 사용자 수를 조회합니다.
+
+    :param db: 읽기 전용 비동기 데이터베이스 세션
+    :param exact: True이면 DB에서 다시 센 값을 반환
+    :return: 구분별 사용자 수
+    """
+    return await service.get_user_counts(db=db, current_user=current_user, exact=exact)
+
+
+@router.get(
+    "/search",
+    dependencies=[Depends(get_async_read_db)],
+    response_model=list[schemas.UserSearchResult],
+    status_code=status.HTTP_200_OK,
+    summary="사용자 이름 검색",
+    description="사용자 이름이 접두사로 시작하는 활성 사용자를 사용자 이름 순으로 조회합니다. 대소문자를 구분하지 않으며, 멘션/회원 찾기 자동 완성에 사용합니다.",
+)
+async def handle_search_users(
+    current_user: Annotated[models.User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_async_read_db)],
+    prefix: str = Query(
+        ..., min_length=1, max_length=50, description="사용자 이름 접두사"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="조회할 최대 사용자 수"),
+) -> list[schemas.UserSearchResult]:
+    """
+    사용자 이름이 접두사로 시작하는 활성 사용자를 검색합니다.
+
+    :param db: 읽기 전용 비동기 데이터베이스 세션
+    :param prefix: 사용자 이름 접두사
+    :param limit: 조회할 최대 사용자 수 (기본값: 10, 최소 1, 최대 50)
+    :return: 검색 결과 목록
+    """
+    return await service.search_users(db=db, prefix=prefix, limit=limit)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="사용자 목록 내보내기",
+    description="모든 사용자를 NDJSON 또는 CSV로 스트리밍합니다. 관리자만 사용할 수 있습니다.",
+)
+async def handle_export_users(
+    current_user: Annotated[models.User, Depends(require_admin)],
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_session_factory)
+    ],
+    export_format: Annotated[
+        export.ExportFormat,
+        Query(alias="format", description="출력 형식 (ndjson 또는 csv)"),
+    ] = "ndjson",
+    columns: str | None = Query(
+        None, description="쉼표로 구분한 컬럼 목록 (생략 시 전체)"
+    ),
+    is_active: bool | None = Query(None, description="활성 상태로 필터링"),
+) -> StreamingResponse:
+    """
+    모든 사용자를 NDJSON 또는 CSV로 스트리밍합니다.
+    행을 묶음 단위로 읽어 바로 내보내므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    :param session_factory: 응답 생성기 안에서 세션을 열기 위한 팩토리
+    :param export_format: 출력 형식
+    :param columns: 쉼표로 구분한 컬럼 목록
+    :param is_active: 활성 상태로 필터링 (생략 시 전체)
+    :return: 스트리밍 응답
+    """
+    selected = export.parse_export_columns(columns)
+    return StreamingResponse(
+        export.export_users(
+            session_factory=session_factory,
+            export_format=export_format,
+            columns=selected,
+            is_active=is_active,
+        ),
+        media_type=export.MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{export_format}"'
+        },
+    )
+
+
 @router.get(
     "/{user_id}",
+    dependencies=[Depends(get_async_read_db)],
     response_model=schemas.UserRead,
     status_code=status.HTTP_200_OK,
     summary="사용자 조회",
     description="사용자 ID로 사용자를 조회합니다. 성공 시 사용자 정보를 반환합니다.",
 )
 async def handle_get_user(
+    # 권한 의존성을 db_user보다 먼저 선언해야 권한이 없을 때 대상 사용자를 조회하지 않습니다.
+    current_user: Annotated[models.User, Depends(require_admin)],
     db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
 ) -> models.User:
     """
     사용자 ID로 사용자를 조회합니다. 성공 시 사용자 정보를 반환합니다.
@@ -77,10 +230,6 @@ async def handle_get_user(
     :param db_user: 사용자 모델 (의존성 주입을 통해 조회)
     :return: 조회된 사용자 모델
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다."
-        )
     return db_user
 
 
@@ -92,10 +241,10 @@ async def handle_get_user(
     description="사용자 ID로 사용자의 정보를 수정합니다. 성공 시 수정된 사용자 정보를 반환합니다.",
 )
 async def handle_update_user(
+    current_user: Annotated[models.User, Depends(require_self_or_admin)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
     db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
     user_update: schemas.UserUpdate,
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
 ) -> models.User:
     """
     사용자 ID로 사용자의 정보를 수정합니다. 성공 시 수정된 사용자 정보를 반환합니다.
@@ -122,9 +271,9 @@ async def handle_update_user(
     description="사용자 ID로 사용자를 비활성화합니다. 성공 시 비활성화된 사용자 정보를 반환합니다.",
 )
 async def handle_deactivate_user(
+    current_user: Annotated[models.User, Depends(require_self_or_admin)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
     db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
 ) -> models.User:
     """
     사용자 ID로 사용자를 비활성화합니다. 성공 시 비활성화된 사용자 정보를 반환합니다.
@@ -147,9 +296,9 @@ async def handle_deactivate_user(
     description="사용자 ID로 사용자를 삭제합니다. 성공 시 204 No Content 응답을 반환합니다.",
 )
 async def handle_delete_user(
+    current_user: Annotated[models.User, Depends(require_admin)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
     db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
 ) -> None:
     """
     사용자 ID로 사용자를 삭제합니다. 성공 시 204 No Content 응답을 반환합니다.
@@ -171,10 +320,10 @@ async def handle_delete_user(
     description="사용자 ID로 사용자의 관리자 권한을 업데이트합니다. 성공 시 업데이트된 사용자 정보를 반환합니다.",
 )
 async def handle_update_admin_status(
+    current_user: Annotated[models.User, Depends(require_admin)],
     db: Annotated[AsyncSession, Depends(get_async_db)],
     db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
     admin_update: schemas.UserUpdateAdmin,
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
 ) -> models.User:
     """
     사용자 ID로 사용자의 관리자 권한을 업데이트합니다. 성공 시 업데이트된 사용자 정보를 반환합니다.
@@ -185,10 +334,6 @@ async def handle_update_admin_status(
     :param current_user: 현재 로그인한 사용자 모델 (권한 확인용)
     :return: 업데이트된 사용자 모델
     """
-    if not current_user.is_admin:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 필요합니다."
-        )
     updated_user = await service.update_admin_status(
         db=db,
         db_user=db_user,
@@ -198,28 +343,59 @@ async def handle_update_admin_status(
     return updated_user
 
 
+@router.post(
+    "/{user_id}/revoke-tokens",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="모든 기기에서 로그아웃",
+    description="사용자 ID로 해당 사용자에게 발급된 모든 토큰을 무효화합니다. 본인 또는 관리자만 가능합니다.",
+)
+async def handle_revoke_all_tokens(
+    current_user: Annotated[models.User, Depends(require_self_or_admin)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    db_user: Annotated[models.User, Depends(get_user_by_id_or_404)],
+) -> None:
+    """
+    사용자 ID로 해당 사용자에게 발급된 모든 토큰을 무효화합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param db_user: 토큰을 무효화할 사용자 모델 (의존성 주입을 통해 조회)
+    :param current_user: 현재 로그인한 사용자 모델 (권한 확인용)
+    :return: None
+    """
+    await service.revoke_all_tokens(db=db, db_user=db_user, current_user=current_user)
+    return None
+
+
 @router.get(
     "/",
-    response_model=list[schemas.UserRead],
+    dependencies=[Depends(get_async_read_db)],
+    response_model=PaginatedResponse[schemas.UserRead],
     status_code=status.HTTP_200_OK,
     summary="모든 사용자 조회",
-    description="모든 사용자를 조회합니다. 성공 시 사용자 목록을 반환합니다.",
+    description="모든 사용자를 최신 가입 순으로 조회합니다. 응답의 next_cursor를 cursor로 전달하면 다음 페이지를 조회합니다.",
 )
 async def handle_get_all_users(
-    db: Annotated[AsyncSession, Depends(get_async_db)],
-    current_user: Annotated[models.User, Depends(get_current_active_user)],
-    skip: int = Query(0, ge=0, description="건너뛸 사용자 수"),
+    current_user: Annotated[models.User, Depends(require_admin)],
+    db: Annotated[AsyncSession, Depends(get_async_read_db)],
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
     limit: int = Query(100, ge=1, le=100, description="조회할 최대 사용자 수"),
-) -> Sequence[models.User]:
+    exact_total: bool = Query(
+        False, description="전체 사용자 수를 DB에서 다시 셀지 여부"
+    ),
+) -> PaginatedResponse[schemas.UserRead]:
     """
-    모든 사용자를 조회합니다. 성공 시 사용자 목록을 반환합니다.
+    모든 사용자를 최신 가입 순으로 조회합니다. 성공 시 사용자 목록과 다음 페이지 커서를 반환합니다.
 
-    :param db: 비동기 데이터베이스 세션
-    :param skip: 건너뛸 사용자 수 (기본값: 0)
+    :param db: 읽기 전용 비동기 데이터베이스 세션
+    :param cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
     :param limit: 조회할 최대 사용자 수 (기본값: 100, 최소 1, 최대 100)
-    :return: 사용자 모델 리스트
+    :param exact_total: True이면 전체 사용자 수를 DB에서 다시 셈
+    :return: 사용자 목록, 다음 페이지 커서, 전체 사용자 수
     """
-    users = await service.get_all_users(
-        db=db, current_user=current_user, skip=skip, limit=limit
+    return await service.get_all_users(
+        db=db,
+        current_user=current_user,
+        cursor=cursor,
+        limit=limit,
+        exact_total=exact_total,
     )
-    return users
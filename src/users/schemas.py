@@ -12,6 +12,22 @@ from pydantic import (
 from src.common.schemas import AppBaseModel
 
 
+def normalize_email(value: str) -> str:
+    """
+    이메일 정규화 함수
+    저장과 조회 모두 같은 값을 사용하도록 앞뒤 공백을 제거하고 소문자로 변환
+    """
+    return value.strip().lower()
+
+
+def normalize_username(value: str) -> str:
+    """
+    사용자명 정규화 함수
+    표시용 사용자명은 대소문자를 유지하고, 중복 검사와 조회에는 소문자 값을 사용
+    """
+    return value.lower()
+
+
 def validate_password(value: str) -> str:
     """
     비밀번호 유효성 검사 함수
@@ -51,6 +67,11 @@ class UserBase(AppBaseModel):
         ],
     )
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email_field(cls, value: str) -> str:
+        return normalize_email(value)
+
 
 class UserCreate(UserBase):
     """
@@ -179,6 +200,15 @@ class UserProfile(BaseModel):
     )
 
 
+class UserSearchResult(UserProfile):
+    """
+    사용자 이름 검색(멘션, 회원 찾기) 결과를 표현하는 모델
+    공개 프로필 정보에 멘션 대상 지정을 위한 사용자 ID를 더함
+    """
+
+    id: str = Field(..., description="사용자 고유 ID")
+
+
 class UserInDB(UserRead):
     """
     내부 데이터베이스에서 사용자 정보를 읽기 위한 스키마
@@ -203,3 +233,50 @@ class UserUpdateAdmin(AppBaseModel):
         description="사용자의 관리자 권한 상태",
         examples=[True, False],
     )
+
+
+class UserCounts(BaseModel):
+    """
+    사용자 수를 활성/관리자 구분별로 표현하는 모델
+    """
+
+    total: int = Field(..., description="전체 사용자 수", examples=[1200])
+    active: int = Field(..., description="활성 사용자 수", examples=[1100])
+    inactive: int = Field(..., description="비활성 사용자 수", examples=[100])
+    admins: int = Field(..., description="관리자 수", examples=[3])
+
+
+class BulkImportError(BaseModel):
+    """
+    일괄 가입에서 실패한 행 하나를 표현하는 모델
+    """
+
+    line: int = Field(..., description="입력 파일의 줄 번호 (1부터 시작)", examples=[3])
+    email: str | None = Field(None, description="행의 이메일 (있는 경우)")
+    error: str = Field(..., description="실패 사유")
+
+
+class BulkImportReport(BaseModel):
+    """
+    사용자 일괄 가입 결과를 표현하는 모델
+    """
+
+    total_rows: int = Field(..., description="읽은 데이터 행 수", examples=[10000])
+    imported: int = Field(..., description="가입된 사용자 수", examples=[9980])
+    failed: int = Field(..., description="실패한 행 수", examples=[20])
+    batches: int = Field(..., description="INSERT를 나누어 실행한 횟수", examples=[20])
+    elapsed_seconds: float = Field(..., description="소요 시간 (초)", examples=[41.2])
+    rows_per_second: float = Field(
+        ..., description="초당 가입 처리량", examples=[242.2]
+    )
+    errors: list[BulkImportError] = Field(
+        default_factory=list, description="실패한 행과 사유"
+    )
+    truncated: bool = Field(
+        False, description="최대 행 수에 도달해 나머지 입력을 읽지 않았는지 여부"
+    )
+    resume_line: int | None = Field(
+        None,
+        description="읽지 않은 첫 줄 번호 (truncated일 때, 이 줄부터 다시 보내면 됨)",
+        examples=[None],
+    )
@@ -1,10 +1,14 @@
-from typing import Sequence
+from datetime import datetime
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import hash_password
+from src.common.pagination import decode_cursor, encode_cursor
+from src.common.schemas import PaginatedResponse
+from src.core.security import hash_password_async
+from src.db.ids import canonical_uuid, is_uuid
 from src.users import crud, models, schemas
+from src.users.counts import user_counts
 
 
 async def create_user(db: AsyncSession, user_in: schemas.UserCreate) -> models.User:
@@ -19,7 +23,7 @@ async def create_user(db: AsyncSession, user_in: schemas.UserCreate) -> models.U
     # CRUD 계층에서 중복 확인을 처리합니다.
 
     # 비밀번호 해싱
-    hashed_password = hash_password(user_in.password)
+    hashed_password = await hash_password_async(user_in.password)
 
     # 사용자 생성
     created_user = await crud.create_user(
@@ -30,17 +34,71 @@ async def create_user(db: AsyncSession, user_in: schemas.UserCreate) -> models.U
 
 
 async def get_all_users(
-    db: AsyncSession, current_user: models.User, skip: int = 0, limit: int = 100
-) -> Sequence[models.User]:
+    db: AsyncSession,
+    current_user: models.User,
+    cursor: str | None = None,
+    limit: int = 100,
+    exact_total: bool = False,
+) -> PaginatedResponse[schemas.UserRead]:
     """
-    모든 사용자를 조회합니다.
+    모든 사용자를 최신 가입 순으로 커서 페이지네이션하여 조회합니다.
+    전체 사용자 수는 매번 COUNT(*)를 실행하지 않고 사용자 수 카운터에서 가져옵니다.
 
     :param db: 비동기 데이터베이스 세션
     :param current_user: 요청을 보낸 사용자 모델
-    :param skip: 건너뛸 사용자 수
+    :param cursor: 이전 응답의 next_cursor (첫 페이지는 None)
     :param limit: 조회할 최대 사용자 수
+    :param exact_total: True이면 전체 사용자 수를 DB에서 다시 셈
+    :raises HTTPException: 관리자가 아닌 경우 403, 커서가 유효하지 않은 경우 400 예외 발생
+    :return: 사용자 목록과 다음 페이지 커서
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
+
+    after = None
+    if cursor is not None:
+        try:
+            created_at, user_id = decode_cursor(cursor)
+            # 바이너리 ID 저장 시 UUID가 아닌 값은 쿼리 실행 중 바인딩에서 실패하므로 미리 거부합니다.
+            if not is_uuid(user_id):
+                raise ValueError("커서의 사용자 ID가 UUID 형식이 아닙니다.")
+            after = (datetime.fromisoformat(created_at), canonical_uuid(user_id))
+        except (ValueError, TypeError) as err:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다.",
+            ) from err
+
+    # 한 건을 더 읽어 다음 페이지가 있는지 확인합니다.
+    users = await crud.get_users_by_cursor(db=db, after=after, limit=limit + 1)
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        last = users[-1]
+        next_cursor = encode_cursor([last.created_at.isoformat(), last.id])
+
+    counts = await user_counts.get(db, exact=exact_total)
+    return PaginatedResponse[schemas.UserRead](
+        items=[schemas.UserRead.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+        total=counts.total,
+    )
+
+
+async def get_user_counts(
+    db: AsyncSession, current_user: models.User, exact: bool = False
+) -> schemas.UserCounts:
+    """
+    활성/관리자 구분별 사용자 수를 조회합니다.
+
+    :param db: 비동기 데이터베이스 세션
+    :param current_user: 요청을 보낸 사용자 모델
+    :param exact: True이면 캐시와 관계없이 DB에서 다시 셈
     :raises HTTPException: 관리자가 아닌 경우 403 예외 발생
-    :return: 사용자 모델 리스트
+    :return: 구분별 사용자 수
     """
     if not current_user.is_admin:
         raise HTTPException(
@@ -48,8 +106,22 @@ async def get_all_users(
             detail="관리자 권한이 필요합니다.",
         )
 
-    users = await crud.get_users(db=db, skip=skip, limit=limit)
-    return users
+    return await user_counts.get(db, exact=exact)
+
+
+async def search_users(
+    db: AsyncSession, prefix: str, limit: int = 10
+) -> list[schemas.UserSearchResult]:
+    """
+    사용자 이름이 접두사로 시작하는 활성 사용자를 검색합니다 (대소문자 무관).
+
+    :param db: 비동기 데이터베이스 세션
+    :param prefix: 사용자 이름 접두사
+    :param limit: 조회할 최대 사용자 수
+    :return: 사용자 이름 순으로 정렬된 검색 결과
+    """
+    users = await crud.search_users_by_prefix(db=db, prefix=prefix, limit=limit)
+    return [schemas.UserSearchResult.model_validate(user) for user in users]
 
 
 async def get_user_profile(db_user: models.User) -> models.User:
@@ -186,8 +258,31 @@ async def update_password(
             detail="비밀번호 수정 권한이 없습니다.",
         )
 
-    hashed_password = hash_password(new_password)
+    hashed_password = await hash_password_async(new_password)
     updated_user = await crud.update_password(
         db=db, db_user=db_user, hashed_password=hashed_password
     )
     return updated_user
+
+
+async def revoke_all_tokens(
+    db: AsyncSession,
+    db_user: models.User,
+    current_user: models.User,
+) -> models.User:
+    """
+    사용자에게 발급된 모든 토큰을 무효화합니다 (모든 기기에서 로그아웃).
+
+    :param db: 비동기 데이터베이스 세션
+    :param db_user: 데이터베이스에서 조회된 사용자 모델
+    :param current_user: 요청을 보낸 사용자 모델
+    :raises HTTPException: 본인이 아니거나 관리자가 아닐 경우 403 예외 발생
+    :return: 업데이트된 사용자 모델
+    """
+    if db_user.id != current_user.id and not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="다른 사용자의 토큰을 폐기할 권한이 없습니다.",
+        )
+
+    return await crud.bump_token_version(db=db, db_user=db_user)
@@ -1,28 +1,127 @@
-# 테스트 DB 설정 후에 주석 해제하여 통합 테스트를 실행할 수 있습니다.
-# from datetime import datetime, timezone
+import uuid
+from datetime import datetime, timedelta, timezone
 
-# import pytest
-# from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-# from src.auth import crud
+from src.auth import crud, service
+from src.auth.models import TokenBlocklist
 
 
-# @pytest.mark.asyncio
-# async def test_add_and_check_token_blocklist_integration(test_db: AsyncSession):
-#     """
-#     토큰 블락리스트 추가/확인 통합 테스트 (실제 DB 사용)
-#     """
-#     # Arrange
-#     jti = "integration_test_jti"
-#     expires_at = datetime.now(timezone.utc)
+@pytest.mark.asyncio
+async def test_add_and_check_token_blocklist_integration(db_session: AsyncSession):
+    """
+    토큰 블락리스트 추가/확인 통합 테스트 (실제 DB 사용)
+    """
+    # Arrange
+    jti = str(uuid.uuid4())
+    expires_at = datetime.now(timezone.utc)
 
-#     # Act - 토큰 블락리스트에 추가
-#     await crud.add_token_to_blocklist(db=test_db, jti=jti, expires_at=expires_at)
+    # Act - 토큰 블락리스트에 추가
+    await crud.add_token_to_blocklist(db=db_session, jti=jti, expires_at=expires_at)
 
-#     # Assert - 토큰이 블락리스트에 있는지 확인
-#     is_blocked = await crud.is_token_blocked(db=test_db, jti=jti)
-#     assert is_blocked is True
+    # Assert - 토큰이 블락리스트에 있는지 확인
+    is_blocked = await crud.is_token_blocked(db=db_session, jti=jti)
+    assert is_blocked is True
 
-#     # 없는 토큰은 블락되지 않음
-#     is_not_blocked = await crud.is_token_blocked(db=test_db, jti="nonexistent_jti")
-#     assert is_not_blocked is False
+    # 없는 토큰은 블락되지 않음
+    is_not_blocked = await crud.is_token_blocked(db=db_session, jti=str(uuid.uuid4()))
+    assert is_not_blocked is False
+
+
+@pytest.mark.asyncio
+async def test_token_blocklist_stores_compact_jti(db_session: AsyncSession):
+    """
+    jti가 16바이트로 저장되고 문자열로 다시 읽히는지 테스트
+    """
+    # Arrange
+    jti = str(uuid.uuid4())
+    await crud.add_token_to_blocklist(
+        db=db_session, jti=jti, expires_at=datetime.now(timezone.utc)
+    )
+
+    # Act
+    stored_length = await db_session.scalar(
+        select(func.length(TokenBlocklist.__table__.c.jti))
+    )
+    loaded_jti = await db_session.scalar(select(TokenBlocklist.jti))
+
+    # Assert
+    assert stored_length == 16
+    assert loaded_jti == jti
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_tokens_in_chunks(db_session: AsyncSession):
+    """
+    만료된 항목만 청크 단위로 삭제되는지 테스트
+    """
+    # Arrange
+    now = datetime.now(timezone.utc)
+    expired = [str(uuid.uuid4()) for _ in range(5)]
+    active = str(uuid.uuid4())
+    for jti in expired:
+        await crud.add_token_to_blocklist(
+            db=db_session, jti=jti, expires_at=now - timedelta(hours=1)
+        )
+    await crud.add_token_to_blocklist(
+        db=db_session, jti=active, expires_at=now + timedelta(hours=1)
+    )
+
+    # Act
+    purged, chunks = await crud.purge_expired_tokens(
+        db=db_session, before=now, chunk_size=2
+    )
+
+    # Assert
+    assert purged == 5
+    assert chunks == 3
+    assert await crud.is_token_blocked(db=db_session, jti=active) is True
+    assert await crud.is_token_blocked(db=db_session, jti=expired[0]) is False
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_blocklist_report(db_session: AsyncSession):
+    """
+    정리 결과 리포트에 삭제 건수와 소요 시간이 포함되는지 테스트
+    """
+    # Arrange
+    await crud.add_token_to_blocklist(
+        db=db_session,
+        jti=str(uuid.uuid4()),
+        expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+    )
+
+    # Act
+    report = await service.purge_expired_blocklist(db=db_session)
+
+    # Assert
+    assert report.purged == 1
+    assert report.chunks == 1
+    assert report.elapsed_seconds >= 0
+
+
+@pytest.mark.asyncio
+async def test_add_tokens_to_blocklist_single_round_trip(
+    db_session: AsyncSession, mocker
+):
+    """
+    여러 jti를 한 번의 INSERT와 한 번의 커밋으로 추가하는지 테스트
+    """
+    # Arrange
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    jtis = [str(uuid.uuid4()) for _ in range(2)]
+    execute_spy = mocker.spy(db_session, "execute")
+    commit_spy = mocker.spy(db_session, "commit")
+
+    # Act
+    await crud.add_tokens_to_blocklist(
+        db=db_session, entries=[(jti, expires_at) for jti in jtis]
+    )
+
+    # Assert
+    assert execute_spy.call_count == 1
+    assert commit_spy.call_count == 1
+    for jti in jtis:
+        assert await crud.is_token_blocked(db=db_session, jti=jti) is True
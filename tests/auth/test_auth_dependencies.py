@@ -0,0 +1,199 @@
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from jose import jwt
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import crud as auth_crud
+from src.auth import dependencies, service
+from src.auth.schemas import TokenClaims
+from src.core.config import settings
+from src.users import crud
+from src.users.dependencies import UserLoader
+from src.users.models import User
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_success(db_session: AsyncSession, user_fixture: User):
+    """
+    유효한 액세스 토큰으로 현재 사용자를 조회하는 테스트
+    """
+    # Arrange
+    token = service.create_access_token(data=service.build_token_data(user_fixture))
+
+    # Act
+    current_user = await dependencies.get_current_user(
+        claims=await dependencies.get_access_token_claims(token),
+        db=db_session,
+        loader=UserLoader(db_session),
+    )
+
+    # Assert
+    assert current_user.id == user_fixture.id
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_stale_token_version(
+    db_session: AsyncSession, user_fixture: User
+):
+    """
+    토큰 버전이 올라간 뒤에는 기존 토큰이 거부되는지 테스트
+    """
+    # Arrange
+    token = service.create_access_token(data=service.build_token_data(user_fixture))
+    await crud.bump_token_version(db=db_session, db_user=user_fixture)
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await dependencies.get_current_user(
+            claims=await dependencies.get_access_token_claims(token),
+            db=db_session,
+            loader=UserLoader(db_session),
+        )
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_rejects_token_with_non_uuid_jti(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    서명은 유효하지만 jti가 UUID가 아닌 토큰은 500이 아니라 401로 거부되는지 테스트
+    """
+    # Arrange
+    claims = service.build_token_data(user_fixture)
+    claims.update({"exp": 4_102_444_800, "jti": "not-a-uuid"})  # 2100-01-01
+    token = jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    # Assert
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_refresh_route_decodes_refresh_token_once(
+    async_client: AsyncClient, user_fixture: User, mocker
+):
+    """
+    리프레시 요청에서 리프레시 토큰이 한 번만 디코딩되는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(dependencies.settings, "TOKEN_CLAIMS_CACHE_ENABLED", False)
+    refresh_token = service.create_refresh_token(
+        data=service.build_token_data(user_fixture)
+    )
+    decode_spy = mocker.spy(dependencies.jwt, "decode")
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/auth/refresh", headers={"X-Refresh-Token": refresh_token}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert decode_spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_route_blocks_both_tokens(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User
+):
+    """
+    로그아웃 시 액세스/리프레시 토큰이 모두 블락리스트에 추가되는지 테스트
+    """
+    # Arrange
+    token_data = service.build_token_data(user_fixture)
+    access_token = service.create_access_token(data=token_data)
+    refresh_token = service.create_refresh_token(data=token_data)
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/auth/logout",
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "X-Refresh-Token": refresh_token,
+        },
+    )
+
+    # Assert
+    assert response.status_code == 204
+    for token, kind in ((access_token, "access"), (refresh_token, "refresh")):
+        jti = dependencies.decode_token(token, kind)["jti"]
+        assert await auth_crud.is_token_blocked(db_session, jti=jti) is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_with_same_token_rejects_second(
+    async_client: AsyncClient, user_fixture: User, mocker
+):
+    """
+    같은 리프레시 토큰으로 동시에 갱신해 두 요청 모두 폐기 확인을 통과해도,
+    나중에 폐기하는 요청은 500 대신 401을 받는지 테스트
+    """
+    # Arrange - 두 요청이 모두 폐기 확인을 통과한 상황
+    mocker.patch.object(auth_crud, "is_token_blocked", return_value=False)
+    refresh_token = service.create_refresh_token(
+        data=service.build_token_data(user_fixture)
+    )
+
+    # Act
+    responses = [
+        await async_client.post(
+            "/api/v1/auth/refresh", headers={"X-Refresh-Token": refresh_token}
+        )
+        for _ in range(2)
+    ]
+
+    # Assert
+    assert [response.status_code for response in responses] == [200, 401]
+
+
+@pytest.mark.asyncio
+async def test_logout_route_skips_already_revoked_token(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User
+):
+    """
+    액세스 토큰이 이미 폐기되어 있어도 로그아웃이 성공하고 리프레시 토큰은 폐기되는지 테스트
+    """
+    # Arrange
+    token_data = service.build_token_data(user_fixture)
+    access_token = service.create_access_token(data=token_data)
+    refresh_token = service.create_refresh_token(data=token_data)
+    access_claims = dependencies.decode_token(access_token, "access")
+    await service.revoke_tokens(
+        db=db_session, claims=[TokenClaims.model_validate(access_claims)]
+    )
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/auth/logout",
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "X-Refresh-Token": refresh_token,
+        },
+    )
+
+    # Assert
+    assert response.status_code == 204
+    refresh_jti = dependencies.decode_token(refresh_token, "refresh")["jti"]
+    assert await auth_crud.is_token_blocked(db_session, jti=refresh_jti) is True
+
+
+@pytest.mark.asyncio
+async def test_logout_route_ignores_invalid_tokens(async_client: AsyncClient):
+    """
+    유효하지 않은 토큰으로 로그아웃해도 에러 없이 처리되는지 테스트
+    """
+    # Act
+    response = await async_client.post(
+        "/api/v1/auth/logout",
+        headers={"Authorization": "Bearer invalid", "X-Refresh-Token": "invalid"},
+    )
+
+    # Assert
+    assert response.status_code == 204
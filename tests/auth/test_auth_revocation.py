@@ -0,0 +1,201 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import crud, service
+from src.auth.models import TokenBlocklist
+from src.auth.revocation import BloomFilter, RevocationCache
+
+
+def test_bloom_filter_membership():
+    """
+    블룸 필터는 추가한 항목을 항상 포함해야 합니다 (거짓 음성 없음)
+    """
+    # Arrange
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [str(uuid.uuid4()) for _ in range(1000)]
+
+    # Act
+    for item in items:
+        bloom.add(item)
+
+    # Assert
+    assert all(item in bloom for item in items)
+    false_positives = sum(str(uuid.uuid4()) in bloom for _ in range(1000))
+    assert false_positives < 50
+
+
+def test_revocation_cache_rebuild_keeps_pending_adds():
+    """
+    다시 읽는 도중 추가된 jti가 새 필터에도 남아있는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.01)
+    assert cache.might_contain("anything") is True  # 로드 전에는 항상 DB 조회
+
+    # Act
+    cache.begin_reload()
+    cache.add("added-during-reload")
+    cache.rebuild([("from-db", datetime.now(timezone.utc))], synced_at=0.0)
+
+    # Assert
+    assert cache.might_contain("from-db") is True
+    assert cache.might_contain("added-during-reload") is True
+    assert cache.metrics()["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_is_token_blocked_with_revocation_cache(db_session: AsyncSession, mocker):
+    """
+    폐기 캐시 사용 시 필터에 없는 jti는 DB를 조회하지 않는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.001)
+    mocker.patch("src.auth.crud.revocation_cache", cache)
+    mocker.patch("src.auth.service.revocation_cache", cache)
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_ENABLED", True)
+    # 동기화 허용 지연 안에서는 필터에 없는 jti를 DB 조회 없이 통과시킵니다.
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_SYNC_SECONDS", 60.0)
+
+    blocked_jti = str(uuid.uuid4())
+    await crud.add_token_to_blocklist(
+        db=db_session,
+        jti=blocked_jti,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+    await service.refresh_revocation_cache(db=db_session)
+    execute_spy = mocker.spy(db_session, "execute")
+
+    # Act
+    is_blocked = await crud.is_token_blocked(db=db_session, jti=blocked_jti)
+    is_not_blocked = await crud.is_token_blocked(db=db_session, jti=str(uuid.uuid4()))
+
+    # Assert
+    assert is_blocked is True
+    assert is_not_blocked is False
+    assert execute_spy.call_count == 1  # 필터에 걸린 jti만 DB 조회
+
+    metrics = cache.metrics()
+    assert metrics["filter_hits"] == 1
+    assert metrics["filter_misses"] == 1
+    assert metrics["lookups"] == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_revocation_cache_skips_expired(db_session: AsyncSession, mocker):
+    """
+    만료된 블락리스트 항목은 필터를 다시 만들 때 제외되는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.001)
+    mocker.patch("src.auth.service.revocation_cache", cache)
+
+    expired_jti = str(uuid.uuid4())
+    await crud.add_token_to_blocklist(
+        db=db_session,
+        jti=expired_jti,
+        expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+
+    # Act
+    await service.refresh_revocation_cache(db=db_session)
+
+    # Assert
+    assert cache.might_contain(expired_jti) is False
+    assert cache.metrics()["size"] == 0
+
+
+async def _block_from_other_worker(db: AsyncSession, jti: str) -> None:
+    # 다른 워커가 폐기한 것처럼 이 프로세스의 캐시를 거치지 않고 DB에만 추가합니다.
+    await db.execute(
+        insert(TokenBlocklist).values(
+            jti=jti, expires_at=datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+    )
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_is_token_blocked_sees_revocations_from_other_workers(
+    db_session: AsyncSession, mocker
+):
+    """
+    다른 워커가 폐기한 jti도 필터 재생성을 기다리지 않고 바로 폐기된 것으로 판단하는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.001)
+    mocker.patch("src.auth.crud.revocation_cache", cache)
+    mocker.patch("src.auth.service.revocation_cache", cache)
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_ENABLED", True)
+    # 허용 지연을 0으로 두어 필터 미스마다 동기화하도록 합니다.
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_SYNC_SECONDS", 0.0)
+    await service.refresh_revocation_cache(db=db_session)
+
+    jti = str(uuid.uuid4())
+    assert await crud.is_token_blocked(db=db_session, jti=jti) is False
+
+    # Act
+    await _block_from_other_worker(db_session, jti)
+    is_blocked = await crud.is_token_blocked(db=db_session, jti=jti)
+
+    # Assert
+    assert is_blocked is True
+    assert cache.metrics()["syncs"] == 2
+    assert cache.watermark is not None
+
+
+@pytest.mark.asyncio
+async def test_sync_revocation_cache_shares_one_query(db_session: AsyncSession, mocker):
+    """
+    동시에 들어온 요청들이 동기화 조회 하나를 함께 사용하고,
+    요청 시작 전에 끝난 동기화는 재사용하지 않는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.001)
+    mocker.patch("src.auth.crud.revocation_cache", cache)
+    mocker.patch("src.auth.service.revocation_cache", cache)
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_SYNC_SECONDS", 0.0)
+    await service.refresh_revocation_cache(db=db_session)
+    get_spy = mocker.spy(crud, "get_blocked_jtis_since")
+    requested_at = time.perf_counter()
+
+    # Act
+    await asyncio.gather(
+        *(crud.sync_revocation_cache(db_session, requested_at) for _ in range(5))
+    )
+    await crud.sync_revocation_cache(db_session, time.perf_counter())
+
+    # Assert
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_misses_within_sync_window_skip_db(
+    db_session: AsyncSession, mocker, query_budget
+):
+    """
+    기본 허용 지연 안에서는 필터 미스가 반복되어도 SQL 문을 실행하지 않는지 테스트
+    """
+    # Arrange
+    cache = RevocationCache(capacity=100, error_rate=0.001)
+    mocker.patch("src.auth.crud.revocation_cache", cache)
+    mocker.patch("src.auth.service.revocation_cache", cache)
+    mocker.patch.object(crud.settings, "TOKEN_REVOCATION_CACHE_ENABLED", True)
+    assert crud.settings.TOKEN_REVOCATION_CACHE_SYNC_SECONDS > 0
+    await service.refresh_revocation_cache(db=db_session)
+
+    # Act
+    with query_budget(0):
+        results = [
+            await crud.is_token_blocked(db=db_session, jti=str(uuid.uuid4()))
+            for _ in range(20)
+        ]
+
+    # Assert
+    assert results == [False] * 20
+    assert cache.metrics()["syncs"] == 0  # 필터를 만든 뒤 추가 동기화 없음
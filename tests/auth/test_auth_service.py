@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from time import time
 from unittest.mock import AsyncMock
@@ -6,7 +7,7 @@ import pytest
 from fastapi import HTTPException
 from jose import jwt
 
-from src.auth import service
+from src.auth import schemas, service
 from src.core.config import settings
 from src.core.security import hash_password
 from src.users import models as user_models
@@ -29,7 +30,7 @@ async def test_authenticate_user_success(mocker):
         "src.users.crud.get_user_by_email",
         return_value=test_user,
     )
-    mocker.patch("src.auth.service.verify_password", return_value=True)
+    mocker.patch("src.auth.service.verify_password_async", return_value=True)
 
     # Act
     authenticated_user = await service.authenticate_user(
@@ -55,7 +56,7 @@ async def test_authenticate_user_failure_wrong_password(mocker):
     )
 
     mocker.patch("src.users.crud.get_user_by_email", return_value=test_user)
-    mocker.patch("src.auth.service.verify_password", return_value=False)
+    mocker.patch("src.auth.service.verify_password_async", return_value=False)
 
     # Act
     authenticated_user = await service.authenticate_user(
@@ -80,7 +81,7 @@ async def test_authenticate_user_failure_inactive_user(mocker):
     )
 
     mocker.patch("src.users.crud.get_user_by_email", return_value=test_user)
-    mocker.patch("src.auth.service.verify_password", return_value=True)
+    mocker.patch("src.auth.service.verify_password_async", return_value=True)
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc_info:
@@ -293,3 +294,32 @@ async def test_logout_user_already_blocked(mocker):
 
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail == "이미 블락리스트에 있습니다."
+
+
+@pytest.mark.asyncio
+async def test_revoke_tokens(mocker):
+    """
+    여러 토큰 폐기 시 블락리스트 일괄 추가가 한 번만 호출되는지 테스트
+    """
+    # Arrange
+    mock_db = AsyncMock()
+    exp = int(time()) + 3600
+    access_jti, refresh_jti = str(uuid.uuid4()), str(uuid.uuid4())
+    claims = [
+        schemas.TokenClaims(sub="uuid", jti=access_jti, exp=exp),
+        schemas.TokenClaims(sub="uuid", jti=refresh_jti, exp=exp),
+    ]
+    mock_add_tokens = mocker.patch(
+        "src.auth.crud.add_tokens_to_blocklist", return_value=None
+    )
+
+    # Act
+    await service.revoke_tokens(db=mock_db, claims=claims)
+
+    # Assert
+    expires_at = datetime.fromtimestamp(exp, tz=timezone.utc)
+    mock_add_tokens.assert_called_once_with(
+        db=mock_db,
+        entries=[(access_jti, expires_at), (refresh_jti, expires_at)],
+        skip_revoked=False,
+    )
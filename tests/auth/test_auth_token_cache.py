@@ -0,0 +1,84 @@
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import dependencies, service
+from src.auth.token_cache import VerifiedClaimsCache
+from src.users.dependencies import UserLoader
+from src.users.models import User
+
+
+def test_claims_cache_hit_and_invalidate():
+    """
+    캐시 적중 및 로그아웃 시 제거 테스트
+    """
+    # Arrange
+    cache = VerifiedClaimsCache(max_size=10, ttl_seconds=60)
+    claims = {"sub": "uuid", "exp": time.time() + 60}
+
+    # Act
+    cache.set("token", "access", claims)
+
+    # Assert
+    assert cache.get("token", "access") == claims
+    assert cache.get("token", "refresh") is None  # 종류가 다르면 다른 항목
+    cache.invalidate("token")
+    assert cache.get("token", "access") is None
+    assert cache.metrics() == {"size": 0, "hits": 1, "misses": 2}
+
+
+def test_claims_cache_expires_at_token_exp():
+    """
+    토큰의 exp가 TTL보다 이르면 exp에 만료되는지 테스트
+    """
+    # Arrange
+    cache = VerifiedClaimsCache(max_size=10, ttl_seconds=60)
+
+    # Act
+    cache.set("token", "access", {"sub": "uuid", "exp": time.time() - 1})
+
+    # Assert
+    assert cache.get("token", "access") is None
+
+
+def test_claims_cache_evicts_least_recently_used():
+    """
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 테스트
+    """
+    # Arrange
+    cache = VerifiedClaimsCache(max_size=2, ttl_seconds=60)
+    cache.set("a", "access", {"sub": "a"})
+    cache.set("b", "access", {"sub": "b"})
+    cache.get("a", "access")
+
+    # Act
+    cache.set("c", "access", {"sub": "c"})
+
+    # Assert
+    assert cache.get("a", "access") is not None
+    assert cache.get("b", "access") is None
+    assert cache.get("c", "access") is not None
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_decodes_token_once(
+    db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    같은 토큰으로 반복 인증 시 jwt.decode가 한 번만 호출되는지 테스트
+    """
+    # Arrange
+    token = service.create_access_token(data=service.build_token_data(user_fixture))
+    decode_spy = mocker.spy(dependencies.jwt, "decode")
+
+    # Act
+    for _ in range(3):
+        await dependencies.get_current_user(
+            claims=await dependencies.get_access_token_claims(token),
+            db=db_session,
+            loader=UserLoader(db_session),
+        )
+
+    # Assert
+    assert decode_spy.call_count == 1
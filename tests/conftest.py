@@ -1,4 +1,5 @@
-from typing import AsyncGenerator, Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, ContextManager, Generator
 
 import pytest
 import pytest_asyncio
@@ -7,8 +8,10 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import StaticPool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.auth import service as auth_service
 from src.db.base import Base
-from src.db.session import get_async_db
+from src.db.instrumentation import QueryStats, track_queries
+from src.db.session import get_async_db, get_session_factory
 
 # pytest를 위한 애플리케이션 및 설정 관련 모듈
 from src.main import app
@@ -79,6 +82,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
 
     # get_async_db 의존성 오버라이드
     app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_session_factory] = lambda: TestAsyncSessionLocal
 
     # 테스트 세션을 사용하여 테스트 실행
     # 인메모리 데이터베이스를 사용하므로 테스트 후 자동으로 롤백됩니다.
@@ -87,6 +91,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     finally:
         await async_session.close()
         app.dependency_overrides.pop(get_async_db, None)
+        app.dependency_overrides.pop(get_session_factory, None)
 
 
 # User 객체를 생성하는 fixture
@@ -107,3 +112,51 @@ async def user_fixture(db_session: AsyncSession) -> User:
     )
 
     return created_user
+
+
+def auth_headers(user: User) -> dict[str, str]:
+    """
+    사용자의 액세스 토큰을 담은 Authorization 헤더를 만듭니다.
+    """
+    token = auth_service.create_access_token(data=auth_service.build_token_data(user))
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def create_users(db: AsyncSession, usernames: list[str]) -> list[User]:
+    """
+    사용자 이름 목록으로 테스트용 사용자를 차례로 생성합니다 (이메일은 사용자 이름으로 만듦).
+    """
+    users = []
+    for username in usernames:
+        user_in = UserCreate(
+            email=f"{username.lower()}@example.com",
+            username=username,
+            password="password123",
+        )
+        users.append(
+            await create_user(db=db, user_in=user_in, hashed_password="hashed")
+        )
+    return users
+
+
+# 쿼리 예산 검사 fixture
+@pytest.fixture
+def query_budget() -> Callable[[int], ContextManager[QueryStats]]:
+    """
+    블록 안에서 실행한 SQL 문 수가 예산을 넘으면 실패시키는 컨텍스트 매니저를 제공합니다.
+
+    사용 예:
+        with query_budget(2):
+            await async_client.get("/api/v1/users/me", headers=headers)
+    """
+
+    @contextmanager
+    def budget(max_statements: int) -> Generator[QueryStats, None, None]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_statements, (
+            f"SQL 문 {stats.count}개를 실행했습니다 (예산 {max_statements}개):\n"
+            + "\n".join(stats.statements)
+        )
+
+    return budget
@@ -1,4 +1,5 @@
 import pytest
+from fastapi import HTTPException
 
 from src.core import security
 
@@ -32,3 +33,68 @@ async def test_verify_password():
     # Act & Assert
     assert security.verify_password(plain_password, hashed_password) is True
     assert security.verify_password("wrongpassword", hashed_password) is False
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_async():
+    """
+    워커 풀을 사용하는 비동기 해싱/검증 테스트
+    """
+    # Arrange
+    plain_password = "mysecretpassword"
+
+    # Act
+    hashed_password = await security.hash_password_async(plain_password)
+
+    # Assert
+    assert hashed_password != plain_password
+    assert await security.verify_password_async(plain_password, hashed_password)
+    assert not await security.verify_password_async("wrongpassword", hashed_password)
+
+    metrics = security.get_hashing_metrics()
+    assert metrics["completed"] >= 3
+    assert metrics["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async_rejects_when_queue_full(mocker):
+    """
+    대기열이 가득 찬 경우 503 에러로 요청을 거절하는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(security.settings, "PASSWORD_HASH_MAX_WORKERS", 0)
+    mocker.patch.object(security.settings, "PASSWORD_HASH_MAX_QUEUE", 0)
+    rejected_before = security.get_hashing_metrics()["rejected"]
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await security.hash_password_async("mysecretpassword")
+
+    assert exc_info.value.status_code == 503
+    assert security.get_hashing_metrics()["rejected"] == rejected_before + 1
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async_timeout(mocker):
+    """
+    제한 시간을 초과한 경우 503 에러가 발생하는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(security.settings, "PASSWORD_HASH_TIMEOUT_SECONDS", 0.0001)
+    timeouts_before = security.get_hashing_metrics()["timeouts"]
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await security.hash_password_async("mysecretpassword")
+
+    assert exc_info.value.status_code == 503
+    assert security.get_hashing_metrics()["timeouts"] == timeouts_before + 1
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async_empty_password():
+    """
+    빈 비밀번호는 워커 풀에서도 ValueError가 전파되는지 테스트
+    """
+    with pytest.raises(ValueError):
+        await security.hash_password_async("")
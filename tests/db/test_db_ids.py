@@ -0,0 +1,77 @@
+import time
+import uuid
+
+from src.db.ids import canonical_uuid, generate_id, is_uuid, uuid7
+from src.db.types import BinaryUUID
+
+
+def test_uuid7_is_time_ordered():
+    """
+    연속으로 만든 UUIDv7이 문자열과 바이너리 모두 생성 순서대로 정렬되는지 테스트
+    """
+    # Arrange
+    before_ms = time.time_ns() // 1_000_000
+
+    # Act
+    ids = [uuid7() for _ in range(5000)]
+
+    # Assert
+    assert all(value.version == 7 for value in ids)
+    assert all(value.variant == uuid.RFC_4122 for value in ids)
+    assert [str(value) for value in ids] == sorted(str(value) for value in ids)
+    assert [value.bytes for value in ids] == sorted(value.bytes for value in ids)
+    assert ids[0].int >> 80 >= before_ms
+
+
+def test_uuid7_with_timestamp():
+    """
+    지정한 시각이 UUIDv7의 앞 48비트에 들어가는지 테스트
+    """
+    # Act
+    value = uuid7(unix_ms=1_700_000_000_000)
+
+    # Assert
+    assert value.int >> 80 == 1_700_000_000_000
+    assert value.version == 7
+
+
+def test_generate_id_round_trips_through_binary_storage():
+    """
+    전략별로 만든 ID가 바이너리 저장 후에도 같은 문자열로 복원되는지 테스트
+    """
+    # Arrange
+    column_type = BinaryUUID()
+
+    for strategy, version in (("uuid4", 4), ("uuid7", 7)):
+        # Act
+        user_id = generate_id(strategy)
+        stored = column_type.process_bind_param(user_id, dialect=None)
+        restored = column_type.process_result_value(stored, dialect=None)
+
+        # Assert
+        assert uuid.UUID(user_id).version == version
+        assert len(stored) == 16
+        assert restored == user_id
+
+
+def test_is_uuid():
+    """
+    UUID 형식이 아닌 값을 걸러내는지 테스트
+    """
+    # Assert
+    assert is_uuid(str(uuid.uuid4()))
+    assert not is_uuid("nonexistent-id")
+    assert not is_uuid("")
+
+
+def test_canonical_uuid():
+    """
+    대문자/하이픈 없는 UUID는 표준 형식으로 바꾸고, UUID가 아닌 값은 그대로 두는지 테스트
+    """
+    # Arrange
+    value = str(uuid.uuid4())
+
+    # Assert
+    assert canonical_uuid(value.upper()) == value
+    assert canonical_uuid(value.replace("-", "")) == value
+    assert canonical_uuid("nonexistent-id") == "nonexistent-id"
@@ -0,0 +1,82 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.db.instrumentation import current_route, track_queries
+from src.users.models import User
+from tests.conftest import auth_headers
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements(db_session: AsyncSession):
+    """
+    블록 안의 SQL 문 수와 가장 느린 문을 집계하고, 바깥 집계에도 더하는지 테스트
+    """
+    # Act
+    with track_queries() as outer:
+        await db_session.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            await db_session.execute(select(User))
+    await db_session.execute(text("SELECT 2"))  # 블록 밖의 문은 집계하지 않음
+
+    # Assert
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.total_seconds >= inner.total_seconds > 0
+    assert outer.slowest_statement in outer.statements
+    assert "FROM users" in inner.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_get_me_query_budget(
+    async_client: AsyncClient, user_fixture: User, query_budget, mocker
+):
+    """
+    GET /users/me가 SQL 문 2개 이내로 처리되고, 디버그 모드에서 헤더로 노출되는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(settings, "DEBUG_MODE", True)
+
+    # Act
+    with query_budget(2) as stats:
+        response = await async_client.get(
+            "/api/v1/users/me", headers=auth_headers(user_fixture)
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["X-DB-Queries"] == str(stats.count)
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(db_session: AsyncSession, query_budget):
+    """
+    예산을 넘으면 실행한 SQL 문과 함께 실패하는지 테스트
+    """
+    # Act & Assert
+    with pytest.raises(AssertionError, match="예산 1개"):
+        with query_budget(1):
+            await db_session.execute(text("SELECT 1"))
+            await db_session.execute(text("SELECT 2"))
+
+
+@pytest.mark.asyncio
+async def test_request_stats_do_not_leak_into_next_request(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    같은 컨텍스트에서 처리한 요청의 집계가 요청이 끝난 뒤 남지 않아,
+    다음 요청이나 요청 밖의 SQL 문이 이전 요청의 집계에 더해지지 않는지 테스트
+    """
+    # Act
+    await async_client.get("/api/v1/users/me", headers=auth_headers(user_fixture))
+    await async_client.get("/api/v1/users/me", headers=auth_headers(user_fixture))
+    with track_queries() as stats:
+        pass
+
+    # Assert
+    assert current_route() is None
+    assert stats.parent is None
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import text
+
+from src.db.base import _engine_options, engine
+from src.db.pool import InstrumentedAsyncQueuePool, get_pool_metrics
+
+
+def test_engine_options_skip_sqlite_memory():
+    """
+    SQLite 인메모리 DB에는 풀 옵션을 적용하지 않는지 테스트
+    """
+    # Act
+    memory_options = _engine_options("sqlite+aiosqlite:///:memory:")
+    mysql_options = _engine_options("mysql+asyncmy://user:pw@localhost/db")
+
+    # Assert
+    assert "poolclass" not in memory_options
+    assert mysql_options["poolclass"] is InstrumentedAsyncQueuePool
+    assert mysql_options["pool_pre_ping"] is True
+
+
+def test_engine_options_for_mysql_drivers():
+    """
+    비동기 MySQL 드라이버에는 charset을 지정하고, 동기 드라이버 URL은 거부하는지 테스트
+    """
+    # Act
+    asyncmy_options = _engine_options("mysql+asyncmy://user:pw@localhost/db")
+    aiomysql_options = _engine_options(
+        "mysql+aiomysql://user:pw@localhost/db?charset=utf8"
+    )
+
+    # Assert
+    assert asyncmy_options["connect_args"] == {"charset": "utf8mb4"}
+    assert "connect_args" not in aiomysql_options  # URL의 charset을 그대로 사용
+    for url in (
+        "mysql+pymysql://user:pw@localhost/db",
+        "mysql://user:pw@localhost/db",
+    ):
+        with pytest.raises(ValueError, match="비동기 엔진에 사용할 수 없습니다"):
+            _engine_options(url)
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_checkouts():
+    """
+    커넥션 체크아웃/체크인과 대기 시간이 지표에 집계되는지 테스트
+    """
+    # Arrange
+    before = get_pool_metrics()
+
+    # Act
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        during = get_pool_metrics()
+    after = get_pool_metrics()
+
+    # Assert
+    assert during["checked_out"] == before["checked_out"] + 1
+    assert after["checkouts"] == before["checkouts"] + 1
+    assert after["checkins"] == before["checkins"] + 1
+    assert sum(after["wait_histogram"].values()) == before["checkouts"] + 1
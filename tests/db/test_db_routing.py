@@ -0,0 +1,271 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.auth import dependencies, service
+from src.core.config import settings
+from src.db import routing
+from src.db.base import Base
+from src.db.routing import READ_ONLY, RoutingSession
+from src.users import crud as users_crud
+from src.users.dependencies import UserLoader
+from src.users.models import User
+from tests.conftest import TestAsyncSessionLocal, auth_headers
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest_asyncio.fixture
+async def routed_sessions(tmp_path) -> AsyncGenerator[async_sessionmaker, None]:
+    """
+    주 DB와 복제본을 서로 다른 SQLite 파일로 만들고, 같은 ID의 사용자를
+    이름만 다르게 넣어 어느 쪽에서 읽었는지 구분할 수 있게 합니다.
+    """
+    engines = {}
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(
+                User(
+                    id=USER_ID,
+                    email=f"{name}@example.com",
+                    username=name,
+                    hashed_password="x",
+                )
+            )
+            await session.commit()
+        engines[name] = engine
+
+    yield async_sessionmaker(
+        bind=engines["primary"],
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replica_bind=engines["replica"].sync_engine,
+        expire_on_commit=False,
+    )
+
+    for engine in engines.values():
+        await engine.dispose()
+
+
+async def _read_username(session_factory: async_sessionmaker, read_only: bool) -> str:
+    async with session_factory() as session:
+        if read_only:
+            session.info[READ_ONLY] = True
+        user = await session.get(User, USER_ID)
+        return user.username
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_uses_replica(routed_sessions: async_sessionmaker):
+    """
+    읽기 전용 세션은 복제본에서, 일반 세션은 주 DB에서 읽는지 테스트
+    """
+    # Arrange
+    before = routing.get_routing_metrics()
+
+    # Act
+    read_only_name = await _read_username(routed_sessions, read_only=True)
+    default_name = await _read_username(routed_sessions, read_only=False)
+
+    # Assert
+    assert read_only_name == "replica"
+    assert default_name == "primary"
+    after = routing.get_routing_metrics()
+    assert after["replica"] == before["replica"] + 1
+    assert after["primary"] == before["primary"] + 1
+
+
+@pytest.mark.asyncio
+async def test_recent_write_sticks_to_primary(routed_sessions: async_sessionmaker):
+    """
+    쓰기 직후 유지 시간 안의 사용자 요청은 읽기 전용 세션도 주 DB에서 읽는지 테스트
+    """
+    # Arrange - 이전 요청에서 쓰기를 수행한 사용자가 인증된 상황
+    before = routing.get_routing_metrics()
+
+    # Act
+    with routing.request_context() as state:
+        routing.identify_user(USER_ID, datetime.now(timezone.utc))
+        username = await _read_username(routed_sessions, read_only=True)
+
+    # Assert
+    assert username == "primary"
+    assert state.routes == ["primary"]
+    assert routing.get_routing_metrics()["sticky"] == before["sticky"] + 1
+    assert routing.current_state() is None  # 요청이 끝나면 상태가 남지 않음
+
+
+@pytest.mark.asyncio
+async def test_old_write_reads_from_replica(routed_sessions: async_sessionmaker):
+    """
+    유지 시간이 지난 쓰기는 복제본 조회를 막지 않는지 테스트
+    """
+    # Arrange
+    last_write_at = datetime.now(timezone.utc) - timedelta(
+        seconds=settings.DB_READ_YOUR_WRITES_SECONDS + 1
+    )
+
+    # Act
+    with routing.request_context():
+        routing.identify_user(USER_ID, last_write_at.replace(tzinfo=None))
+        username = await _read_username(routed_sessions, read_only=True)
+
+    # Assert
+    assert username == "replica"
+
+
+@pytest.mark.asyncio
+async def test_primary_reads_bypass_replica(routed_sessions: async_sessionmaker):
+    """
+    인증 조회처럼 primary_reads 블록 안의 조회는 읽기 전용 세션이라도 주 DB에서 읽는지 테스트
+    """
+    # Act
+    with routing.primary_reads():
+        username = await _read_username(routed_sessions, read_only=True)
+    after_block = await _read_username(routed_sessions, read_only=True)
+
+    # Assert
+    assert username == "primary"
+    assert after_block == "replica"
+
+
+@pytest.mark.asyncio
+async def test_write_in_request_sticks_to_primary(routed_sessions: async_sessionmaker):
+    """
+    같은 요청에서 쓰기를 수행한 뒤의 읽기는 주 DB에서 수행되는지 테스트
+    """
+    # Arrange
+    with routing.request_context() as state:
+        async with routed_sessions() as session:
+            user = await session.get(User, USER_ID)
+            user.username = "renamed"
+            await session.commit()
+
+        # Act
+        username = await _read_username(routed_sessions, read_only=True)
+
+    # Assert
+    assert state.wrote is True
+    assert username == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_authenticated_write_records_last_write(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    인증된 사용자가 쓰기를 수행하면 서버에 쓰기 시각이 기록되고,
+    다음 요청의 인증 단계에서 주 DB 유지가 적용되는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(settings, "DATABASE_REPLICA_URL", "sqlite+aiosqlite:///r.db")
+    mocker.patch("src.main.AsyncSessionLocal", TestAsyncSessionLocal)
+    started_at = time.time()
+
+    # Act
+    write_response = await async_client.patch(
+        f"/api/v1/users/{user_fixture.id}",
+        json={"username": "renamed"},
+        headers=auth_headers(user_fixture),
+    )
+    db_session.expunge_all()
+    with routing.request_context() as state:
+        await dependencies.get_current_user(
+            claims=await dependencies.get_access_token_claims(
+                auth_headers(user_fixture)["Authorization"].removeprefix("Bearer ")
+            ),
+            db=db_session,
+            loader=UserLoader(db_session),
+        )
+
+    # Assert
+    assert write_response.status_code == 200
+    assert "set-cookie" not in write_response.headers
+    assert state.user_id == user_fixture.id
+    assert state.sticky is True
+    assert state.primary_until >= started_at + settings.DB_READ_YOUR_WRITES_SECONDS - 1
+
+
+@pytest.mark.asyncio
+async def test_recent_write_record_is_not_repeated(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    유지 시간의 절반 안에 다시 쓰기를 수행하면 쓰기 시각을 다시 기록하지 않는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(settings, "DATABASE_REPLICA_URL", "sqlite+aiosqlite:///r.db")
+    mocker.patch("src.main.AsyncSessionLocal", TestAsyncSessionLocal)
+    record_spy = mocker.spy(users_crud, "record_write")
+
+    # Act
+    for username in ("renamed1", "renamed2"):
+        response = await async_client.patch(
+            f"/api/v1/users/{user_fixture.id}",
+            json={"username": username},
+            headers=auth_headers(user_fixture),
+        )
+        assert response.status_code == 200
+        db_session.expunge_all()  # 다음 요청의 인증에서 기록된 값을 다시 읽도록 함
+
+    # Assert
+    assert record_spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_record_write_skips_cache_invalidation_for_missing_user(
+    db_session: AsyncSession, mocker
+):
+    """
+    갱신된 행이 없으면 사용자 캐시를 무효화하지 않는지 테스트
+    """
+    # Arrange
+    invalidate = mocker.patch.object(users_crud.user_cache, "invalidate")
+
+    # Act
+    updated = await users_crud.record_write(db_session, USER_ID)
+
+    # Assert
+    assert updated is False
+    invalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_auth_lookup_reads_primary_on_read_only_session(
+    routed_sessions: async_sessionmaker,
+):
+    """
+    조회 전용 라우트에서도 인증 단계의 사용자/토큰 버전 조회는 주 DB에서 수행되는지 테스트
+    """
+    # Arrange - 주 DB에서만 토큰 버전이 올라가고 아직 복제되지 않은 상황
+    async with routed_sessions() as session:
+        user = await session.get(User, USER_ID)
+        user.token_version = 1
+        await session.commit()
+        token = service.create_access_token(data=service.build_token_data(user))
+
+    # Act
+    async with routed_sessions() as session:
+        session.info[READ_ONLY] = True
+        with routing.request_context() as state:
+            current_user = await dependencies.get_current_user(
+                claims=await dependencies.get_access_token_claims(token),
+                db=session,
+                loader=UserLoader(session),
+            )
+
+    # Assert
+    assert current_user.username == "primary"
+    assert state.routes and set(state.routes) == {"primary"}
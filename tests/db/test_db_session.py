@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import session as db_session_module
+from src.db.session import get_async_db, get_async_read_db
+from src.users.models import User
+from tests.conftest import TestAsyncSessionLocal
+
+
+@pytest.fixture
+def session_factory(mocker):
+    """
+    get_async_db가 테스트 DB 세션을 생성하도록 교체합니다.
+    """
+    mocker.patch.object(db_session_module, "AsyncSessionLocal", TestAsyncSessionLocal)
+
+
+async def _finish(generator) -> None:
+    with pytest.raises(StopAsyncIteration):
+        await anext(generator)
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_skips_commit_for_reads(session_factory, mocker):
+    """
+    조회만 수행한 요청은 커밋하지 않는지 테스트
+    """
+    # Arrange
+    generator = get_async_db()
+    session = await anext(generator)
+    commit_spy = mocker.spy(session, "commit")
+
+    # Act
+    await session.execute(text("SELECT 1"))
+    await _finish(generator)
+
+    # Assert
+    assert commit_spy.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_async_db_commits_pending_writes(session_factory, mocker):
+    """
+    flush 후 커밋되지 않은 변경 사항이 있으면 커밋하는지 테스트
+    """
+    # Arrange
+    generator = get_async_db()
+    session = await anext(generator)
+    commit_spy = mocker.spy(session, "commit")
+
+    # Act
+    session.add(
+        User(email="pending@example.com", username="pending", hashed_password="x")
+    )
+    await session.flush()
+    await _finish(generator)
+
+    # Assert
+    assert commit_spy.call_count == 1
+    assert "flushed" not in session.info
+
+
+@pytest.mark.asyncio
+async def test_get_async_read_db_rejects_flush(db_session: AsyncSession):
+    """
+    읽기 전용 세션에서 flush하면 예외가 발생하고, 요청이 끝나면 해제되는지 테스트
+    """
+    # Arrange
+    generator = get_async_read_db(db=db_session)
+    session = await anext(generator)
+    session.add(User(email="ro@example.com", username="readonly", hashed_password="x"))
+
+    # Act / Assert
+    with pytest.raises(InvalidRequestError):
+        await session.flush()
+    await session.rollback()
+    await _finish(generator)
+    assert "read_only" not in db_session.info
@@ -0,0 +1,84 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.db.slow_queries import (
+    clear_slow_queries,
+    get_slow_queries,
+    instrument_slow_queries,
+    parameter_shape,
+    wait_for_explains,
+)
+from src.users.models import User
+from tests.conftest import auth_headers, test_engine
+
+
+def test_parameter_shape_hides_values():
+    """
+    바인딩 값 대신 타입만 남기는지 테스트
+    """
+    # Act & Assert
+    assert parameter_shape(("a@example.com", 1)) == ["str", "int"]
+    assert parameter_shape({"email": "a@example.com"}) == {"email": "str"}
+    assert parameter_shape([("a", 1), ("b", 2)], executemany=True) == {
+        "rows": 2,
+        "row": ["str", "int"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_recorded_with_route_and_plan(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    임계값을 넘은 쿼리를 요청 경로, 파라미터 형태, 실행 계획과 함께 기록하고
+    관리자가 조회할 수 있는지 테스트
+    """
+    # Arrange
+    user_fixture.is_admin = True
+    await db_session.commit()
+    instrument_slow_queries(test_engine)
+    clear_slow_queries()
+    mocker.patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 1e-6)
+    mocker.patch.object(settings, "SLOW_QUERY_EXPLAIN", True)
+
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/me", headers=auth_headers(user_fixture)
+    )
+    await wait_for_explains()
+    mocker.patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+    slow_response = await async_client.get(
+        "/internal/slow-queries", headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert slow_response.status_code == 200
+    records = slow_response.json()["records"]
+    assert records == get_slow_queries()
+    # 사용자는 세션에 이미 있으므로 토큰 폐기 여부 조회만 실행됩니다.
+    blocklist_select = next(
+        record for record in records if "FROM token_blocklist" in record["statement"]
+    )
+    assert blocklist_select["route"] == "GET /api/v1/users/me"
+    assert len(blocklist_select["parameters"]) == 1
+    assert blocklist_select["duration_ms"] > 0
+    assert any("token_blocklist" in " ".join(row) for row in blocklist_select["plan"])
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_forbidden_for_non_admin(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    관리자가 아닌 사용자는 느린 쿼리 기록을 조회할 수 없는지 테스트
+    """
+    # Act
+    response = await async_client.get(
+        "/internal/slow-queries", headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 403
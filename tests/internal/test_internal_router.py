@@ -0,0 +1,52 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.users.models import User
+from tests.conftest import auth_headers
+
+
+@pytest.mark.asyncio
+async def test_internal_metrics_for_admin(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User
+):
+    """
+    관리자는 내부 지표를 조회할 수 있는지 테스트
+    """
+    # Arrange
+    user_fixture.is_admin = True
+    await db_session.commit()
+
+    # Act
+    response = await async_client.get(
+        "/internal/metrics", headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {
+        "db_pool",
+        "db_routing",
+        "password_hashing",
+        "token_revocation_cache",
+        "token_claims_cache",
+        "user_cache",
+    }
+    assert "wait_histogram" in body["db_pool"]
+
+
+@pytest.mark.asyncio
+async def test_internal_metrics_forbidden_for_non_admin(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    관리자가 아닌 사용자는 내부 지표를 조회할 수 없는지 테스트
+    """
+    # Act
+    response = await async_client.get(
+        "/internal/metrics", headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 403
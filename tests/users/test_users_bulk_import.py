@@ -0,0 +1,201 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import verify_password
+from src.users import bulk_import, crud
+from src.users.models import User
+from tests.conftest import auth_headers
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _row(name: str, **overrides) -> str:
+    row = {
+        "email": f"{name}@example.com",
+        "username": name,
+        "password": "password123",
+    }
+    row.update(overrides)
+    return json.dumps(row)
+
+
+@pytest.mark.asyncio
+async def test_import_users_reports_failed_rows(
+    db_session: AsyncSession, user_fixture: User
+):
+    """
+    잘못된 행과 중복 행은 리포트에 남기고 나머지 행은 묶음 단위로 가입시키는지 테스트
+    """
+    # Arrange
+    lines = [
+        _row("bulk1"),
+        _row("bulk2"),
+        "{not json",
+        _row("bulk3", password="short"),
+        _row("bulk1", email="other@example.com"),  # 파일 안에서 중복된 사용자 이름
+        _row("bulk4", email=user_fixture.email),  # 이미 가입된 이메일
+        _row("bulk5"),
+    ]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report = await bulk_import.import_users(
+            db=db_session,
+            lines=_aiter(lines),
+            import_format="ndjson",
+            batch_size=2,
+            executor=executor,
+        )
+
+    # Assert
+    assert report.total_rows == 7
+    assert report.imported == 3
+    assert report.failed == 4
+    assert report.batches == 2
+    assert [error.line for error in report.errors] == [3, 4, 5, 6]
+    assert report.errors[2].error == bulk_import.DUPLICATE_IN_FILE
+    assert report.errors[3].error == bulk_import.DUPLICATE_IN_DB
+
+    imported = await crud.get_user_by_email(db=db_session, email="bulk5@example.com")
+    assert verify_password("password123", imported.hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_iter_text_lines_splits_across_chunks():
+    """
+    줄과 멀티바이트 문자가 조각 경계에 걸쳐 있어도 올바르게 나누는지 테스트
+    """
+    # Arrange
+    data = "첫째 줄\r\n둘째 줄\n셋째".encode()
+    chunks = [data[:4], data[4:13], data[13:]]
+
+    # Act
+    lines = [line async for line in bulk_import.iter_text_lines(_aiter(chunks))]
+
+    # Assert
+    assert lines == ["첫째 줄", "둘째 줄", "셋째"]
+
+
+@pytest.mark.asyncio
+async def test_import_users_endpoint_csv(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    관리자가 CSV 본문으로 사용자를 일괄 가입시킬 수 있는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(
+        bulk_import, "get_bulk_hashing_executor", return_value=ThreadPoolExecutor(2)
+    )
+    user_fixture.is_admin = True
+    await db_session.commit()
+    body = (
+        "email,username,password,profile_image_path\n"
+        "csv1@example.com,csv1,password123,\n"
+        "csv2@example.com,csv2,password123,https://example.com/a.png\n"
+    )
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/users/import",
+        params={"format": "csv"},
+        content=body.encode(),
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["failed"] == 0
+    assert report["rows_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_import_users_endpoint_rejects_oversized_body(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    요청 본문이 최대 크기를 넘으면 아무 행도 가입시키지 않고 413을 반환하는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(bulk_import.settings, "BULK_IMPORT_MAX_BYTES", 10)
+    user_fixture.is_admin = True
+    await db_session.commit()
+    body = "\n".join(_row(f"big{i}") for i in range(3))
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/users/import",
+        content=body.encode(),
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 413
+    assert await crud.get_user_by_email(db=db_session, email="big0@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_import_users_endpoint_requires_content_length(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User
+):
+    """
+    Content-Length 없이 전송된 본문은 크기를 미리 알 수 없으므로 411을 반환하는지 테스트
+    """
+    # Arrange
+    user_fixture.is_admin = True
+    await db_session.commit()
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/users/import",
+        content=_aiter([_row("chunked").encode()]),
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 411
+
+
+@pytest.mark.asyncio
+async def test_import_users_endpoint_stops_at_row_limit(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    최대 행 수를 넘으면 읽기를 멈추고, 이미 가입된 행과 다시 보낼 줄 번호를 리포트로 반환하는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(
+        bulk_import, "get_bulk_hashing_executor", return_value=ThreadPoolExecutor(2)
+    )
+    mocker.patch.object(bulk_import.settings, "BULK_IMPORT_MAX_ROWS", 2)
+    mocker.patch.object(bulk_import.settings, "BULK_IMPORT_BATCH_SIZE", 1)
+    user_fixture.is_admin = True
+    await db_session.commit()
+    body = "\n".join(_row(f"limit{i}") for i in range(3))
+
+    # Act
+    response = await async_client.post(
+        "/api/v1/users/import",
+        content=body.encode(),
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["total_rows"] == 2
+    assert report["truncated"] is True
+    assert report["resume_line"] == 3
+    assert (
+        await crud.get_user_by_email(db=db_session, email="limit2@example.com") is None
+    )
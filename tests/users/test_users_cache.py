@@ -0,0 +1,118 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.users import crud
+from src.users.cache import InMemoryUserCacheBackend, UserCache
+from src.users.models import User
+from src.users.schemas import UserUpdate
+
+
+@pytest.fixture
+def user_cache(mocker) -> UserCache:
+    """
+    테스트마다 비어 있는 사용자 캐시를 사용하도록 교체합니다.
+    """
+    cache = UserCache(backend=InMemoryUserCacheBackend(max_size=100), ttl_seconds=60)
+    mocker.patch("src.users.crud.user_cache", cache)
+    mocker.patch.object(crud.settings, "USER_CACHE_ENABLED", True)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_get_user_served_from_cache(
+    db_session: AsyncSession, user_fixture: User, user_cache: UserCache, mocker
+):
+    """
+    첫 조회 이후에는 DB를 조회하지 않고 캐시에서 사용자를 반환하는지 테스트
+    """
+    # Arrange
+    db_session.expunge_all()
+    execute_spy = mocker.spy(db_session, "execute")
+    get_spy = mocker.spy(db_session, "get")
+
+    # Act
+    first = await crud.get_user(db=db_session, user_id=user_fixture.id)
+    db_session.expunge_all()
+    second = await crud.get_user(db=db_session, user_id=user_fixture.id)
+    third = await crud.get_user(db=db_session, user_id=user_fixture.id)
+
+    # Assert
+    assert first.id == second.id == user_fixture.id
+    assert second is third  # 같은 세션에서는 같은 인스턴스
+    assert second.username == user_fixture.username
+    assert get_spy.call_count == 1
+    assert execute_spy.call_count == 0
+
+    metrics = user_cache.metrics()
+    assert metrics["hits"] == 2
+    assert metrics["misses"] == 1
+    assert metrics["hit_ratio"] == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_password_hash(
+    db_session: AsyncSession, user_fixture: User, user_cache: UserCache
+):
+    """
+    캐시 스냅샷에 비밀번호 해시가 포함되지 않고, 로그인용 이메일 조회는 캐시를 거치지 않는지 테스트
+    """
+    # Arrange
+    await crud.get_user(db=db_session, user_id=user_fixture.id)
+
+    # Act
+    snapshot = await user_cache.backend.get(f"user:id:{user_fixture.id}")
+    by_email = await crud.get_user_by_email(db=db_session, email=user_fixture.email)
+
+    # Assert
+    assert snapshot["username"] == user_fixture.username
+    assert "hashed_password" not in snapshot
+    assert by_email.hashed_password == user_fixture.hashed_password
+    assert user_cache.metrics()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_cache(
+    db_session: AsyncSession, user_fixture: User, user_cache: UserCache
+):
+    """
+    사용자 정보를 수정하면 캐시가 무효화되어 수정된 값이 조회되는지 테스트
+    """
+    # Arrange
+    await crud.get_user(db=db_session, user_id=user_fixture.id)
+
+    # Act
+    await crud.update_user(
+        db=db_session,
+        db_user=user_fixture,
+        user_update=UserUpdate(username="renamed"),
+    )
+    db_session.expunge_all()
+    loaded = await crud.get_user(db=db_session, user_id=user_fixture.id)
+
+    # Assert
+    assert loaded.username == "renamed"
+    assert user_cache.metrics()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_result_read_before_invalidation(
+    db_session: AsyncSession, user_fixture: User, user_cache: UserCache
+):
+    """
+    조회 도중 다른 워커가 같은 저장소로 무효화하면 수정 전에 읽은 행을 캐시에 저장하지 않는지 테스트
+    """
+    # Arrange - 수정 전에 조회를 시작한 상황
+    version = await user_cache.version(user_fixture.id)
+    stale_user = await db_session.get(User, user_fixture.id)
+    other_worker = UserCache(backend=user_cache.backend, ttl_seconds=60)
+    await other_worker.invalidate(user_fixture.id)
+
+    # Act - 조회 결과를 늦게 저장하려고 시도
+    await user_cache.set(stale_user, version)
+
+    # Assert
+    assert await user_cache.get_by_id(db_session, user_fixture.id) is None
+
+    # 무효화 이후에 읽은 버전으로는 저장됨
+    await user_cache.set(stale_user, await user_cache.version(user_fixture.id))
+    assert await user_cache.get_by_id(db_session, user_fixture.id) is stale_user
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.users import crud
+from src.users.counts import UserCountCache
+from src.users.models import User
+from src.users.schemas import UserCreate
+
+
+async def _create(db: AsyncSession, name: str) -> User:
+    user_in = UserCreate(
+        email=f"{name}@example.com", username=name, password="password123"
+    )
+    return await crud.create_user(db=db, user_in=user_in, hashed_password="hashed")
+
+
+@pytest.mark.asyncio
+async def test_counter_follows_writes_without_recount(db_session: AsyncSession, mocker):
+    """
+    생성/비활성화/관리자 변경/삭제 시 카운터가 DB를 다시 세지 않고 맞게 증감하는지 테스트
+    """
+    # Arrange
+    counts = UserCountCache(ttl_seconds=3600)
+    mocker.patch("src.users.crud.user_counts", counts)
+    first = await _create(db_session, "count1")
+    await counts.get(db_session)  # 최초 한 번은 DB에서 셈
+
+    # Act
+    second = await _create(db_session, "count2")
+    third = await _create(db_session, "count3")
+    await crud.deactivate_user(db=db_session, db_user=second)
+    await crud.update_admin_status(db=db_session, db_user=third, is_admin=True)
+    await crud.delete_user(db=db_session, db_user=first)
+    cached = await counts.get(db_session)
+
+    # Assert
+    assert counts.refreshes == 1
+    assert cached.model_dump() == {"total": 2, "active": 1, "inactive": 1, "admins": 1}
+    assert await counts.get(db_session, exact=True) == cached
+    assert counts.refreshes == 2
+
+
+@pytest.mark.asyncio
+async def test_counter_recounts_after_ttl(db_session: AsyncSession):
+    """
+    TTL이 지나면 다른 워커에서 일어난 변경도 반영되도록 다시 세는지 테스트
+    """
+    # Arrange - crud가 갱신하지 않는 카운터 (다른 워커의 카운터와 같은 상황)
+    counts = UserCountCache(ttl_seconds=0)
+    await _create(db_session, "ttl1")
+    before = await counts.get(db_session)
+
+    # Act
+    await _create(db_session, "ttl2")
+    after = await counts.get(db_session)
+
+    # Assert
+    assert (before.total, after.total) == (1, 2)
+    assert counts.refreshes == 2
@@ -1,7 +1,9 @@
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.db.instrumentation import track_queries
 from src.users import crud
 from src.users.models import User
 from src.users.schemas import UserCreate, UserUpdate
@@ -300,6 +302,7 @@ async def test_deactivate_user(db_session: AsyncSession, user_fixture: User):
 
     # Assert
     assert deactivated.is_active is False
+    assert deactivated.token_version == 1
 
 
 @pytest.mark.asyncio
@@ -327,3 +330,171 @@ async def test_update_password(db_session: AsyncSession, user_fixture: User):
 
     # Assert
     assert updated.hashed_password == new_hashed
+    assert updated.token_version == 1
+
+
+@pytest.mark.asyncio
+async def test_bump_token_version(db_session: AsyncSession, user_fixture: User):
+    """
+    토큰 버전 증가 테스트
+    """
+    # Act
+    updated = await crud.bump_token_version(db=db_session, db_user=user_fixture)
+
+    # Assert
+    assert updated.token_version == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_fetch_server_defaults_with_returning(db_session: AsyncSession):
+    """
+    생성/수정 시 별도의 SELECT 없이 RETURNING으로 서버 생성 값을 받아오는지 테스트
+    """
+    # Arrange
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind.sync_engine, "before_cursor_execute", record)
+    user_in = UserCreate(
+        email="returning@example.com", username="returning", password="password123"
+    )
+
+    # Act
+    try:
+        created_user = await crud.create_user(
+            db=db_session, user_in=user_in, hashed_password="hashed_password"
+        )
+        await crud.update_admin_status(
+            db=db_session, db_user=created_user, is_admin=True
+        )
+    finally:
+        event.remove(db_session.bind.sync_engine, "before_cursor_execute", record)
+
+    # Assert
+    assert [statement.split()[0] for statement in statements] == ["INSERT", "UPDATE"]
+    assert all("RETURNING" in statement for statement in statements)
+    assert "is_admin=" in statements[1] and "username" not in statements[1]
+    assert created_user.created_at is not None
+    assert created_user.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_cursor(db_session: AsyncSession):
+    """
+    키셋 페이지네이션으로 모든 사용자를 중복/누락 없이 최신순으로 조회하는지 테스트
+    (같은 초에 생성된 사용자는 id로 순서를 정함)
+    """
+    # Arrange
+    created_ids = []
+    for i in range(5):
+        user_in = UserCreate(
+            email=f"cursor{i}@example.com",
+            username=f"cursor{i}",
+            password="password123",
+        )
+        created = await crud.create_user(
+            db=db_session, user_in=user_in, hashed_password="hashed_password"
+        )
+        created_ids.append(created.id)
+
+    # Act
+    pages = []
+    after = None
+    while True:
+        page = await crud.get_users_by_cursor(db=db_session, after=after, limit=2)
+        if not page:
+            break
+        pages.append([user.id for user in page])
+        after = (page[-1].created_at, page[-1].id)
+
+    # Assert
+    seen = [user_id for page in pages for user_id in page]
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert sorted(seen) == sorted(created_ids)
+    assert seen == sorted(seen, reverse=True)  # 같은 초라면 id 내림차순
+
+
+def test_user_schema_normalizes_email():
+    """
+    이메일을 공백 제거 후 소문자로 정규화하는지 테스트
+    """
+    # Act
+    user_in = UserCreate(
+        email="  Test@Example.COM ",
+        username="TestUser",
+        password="password123",
+    )
+
+    # Assert
+    assert user_in.email == "test@example.com"
+    assert user_in.username == "TestUser"  # 표시용 사용자명은 그대로 유지
+
+
+@pytest.mark.asyncio
+async def test_lookups_ignore_case(db_session: AsyncSession, user_fixture: User):
+    """
+    이메일/사용자 이름 조회가 대소문자를 구분하지 않는지 테스트
+    """
+    # Act
+    by_email = await crud.get_user_by_email(db=db_session, email="TEST@example.com")
+    by_username = await crud.get_user_by_username(db=db_session, username="TestUser")
+
+    # Assert
+    assert by_email is not None and by_email.id == user_fixture.id
+    assert by_username is not None and by_username.id == user_fixture.id
+
+
+@pytest.mark.asyncio
+async def test_create_user_duplicate_username_ignores_case(
+    db_session: AsyncSession, user_fixture: User
+):
+    """
+    대소문자만 다른 사용자 이름으로 사용자 생성 시 409를 반환하는지 테스트
+    """
+    # Arrange
+    user_in = UserCreate(
+        email="other@example.com",
+        username=user_fixture.username.upper(),
+        password="password123",
+    )
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await crud.create_user(
+            db=db_session, user_in=user_in, hashed_password="hashed_password"
+        )
+
+    assert exc_info.value.status_code == 409
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("lookup", "value", "index_name"),
+    [
+        (crud.get_user_by_email, "TEST@example.com", "ix_users_email"),
+        (crud.get_user_by_username, "TestUser", "ix_users_username_normalized"),
+    ],
+)
+async def test_lookups_use_index(
+    db_session: AsyncSession, user_fixture: User, lookup, value, index_name
+):
+    """
+    대소문자를 구분하지 않는 조회가 전체 테이블 스캔 없이 인덱스를 사용하는지 테스트
+    """
+    # Arrange
+    db_session.expunge_all()  # 식별자 맵이 아니라 실제 SELECT로 조회하도록 합니다.
+    with track_queries() as stats:
+        await lookup(db_session, value)
+    statement = stats.statements[-1]
+    param = value.lower()
+
+    # Act
+    conn = await db_session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", (param,))
+    plan = " ".join(str(row[-1]) for row in result)
+
+    # Assert
+    assert index_name in plan
+    assert "SCAN users" not in plan
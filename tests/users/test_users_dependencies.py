@@ -0,0 +1,113 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.users import crud
+from src.users.dependencies import UserLoader
+from src.users.models import User
+from tests.conftest import auth_headers
+
+
+@pytest.mark.asyncio
+async def test_user_loader_returns_loaded_user(
+    db_session: AsyncSession, user_fixture: User, mocker
+):
+    """
+    같은 ID로 두 번 조회하면 두 번째는 DB 조회 없이 같은 객체를 반환하는지 테스트
+    """
+    # Arrange
+    loader = UserLoader(db_session)
+    get_user_spy = mocker.spy(crud, "get_user")
+
+    # Act
+    first = await loader.get(user_fixture.id)
+    second = await loader.get(user_fixture.id)
+    missing = await loader.get("nonexistent-id")
+
+    # Assert
+    assert first is second
+    assert missing is None
+    assert loader.select_count == 2
+    assert get_user_spy.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        ("GET", "/api/v1/users/me"),
+        ("PATCH", "/api/v1/users/{user_id}"),
+    ],
+)
+async def test_routes_select_current_user_once(
+    async_client: AsyncClient, user_fixture: User, mocker, method: str, path: str
+):
+    """
+    본인을 대상으로 하는 요청에서 사용자 조회가 한 번만 일어나는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(settings, "DEBUG_MODE", True)
+
+    # Act
+    response = await async_client.request(
+        method,
+        path.format(user_id=user_fixture.id),
+        headers=auth_headers(user_fixture),
+        json={} if method == "PATCH" else None,
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["X-User-Selects"] == "1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        ("GET", "/api/v1/users/nonexistent-id"),
+        ("DELETE", "/api/v1/users/nonexistent-id"),
+        ("PATCH", "/api/v1/users/other-user-id/deactivate"),
+    ],
+)
+async def test_routes_authorize_before_loading_target(
+    async_client: AsyncClient, user_fixture: User, mocker, method: str, path: str
+):
+    """
+    권한이 없는 요청은 대상 사용자를 조회하지 않고 403을 반환하는지 테스트
+    """
+    # Arrange
+    mocker.patch.object(settings, "DEBUG_MODE", True)
+    get_user_spy = mocker.spy(crud, "get_user")
+
+    # Act
+    response = await async_client.request(
+        method, path, headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 403
+    assert response.headers["X-User-Selects"] == "1"
+    get_user_spy.assert_called_once()
+    assert get_user_spy.call_args.kwargs["user_id"] == user_fixture.id
+
+
+@pytest.mark.asyncio
+async def test_self_route_accepts_non_canonical_own_id(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    본인 ID를 대문자로 보내도 본인으로 인정되어 수정할 수 있는지 테스트
+    """
+    # Act
+    response = await async_client.patch(
+        f"/api/v1/users/{user_fixture.id.upper()}",
+        json={"username": "renamed"},
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()["id"] == user_fixture.id
+    assert response.json()["username"] == "renamed"
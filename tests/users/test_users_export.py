@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.users import crud, export
+from src.users.models import User
+from tests.conftest import TestAsyncSessionLocal, auth_headers, create_users
+
+
+@pytest.fixture
+async def admin_headers(db_session: AsyncSession, user_fixture: User) -> dict:
+    user_fixture.is_admin = True
+    await db_session.commit()
+    return auth_headers(user_fixture)
+
+
+@pytest.mark.asyncio
+async def test_export_users_ndjson(
+    async_client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+):
+    """
+    선택한 컬럼만 활성 사용자에 대해 NDJSON으로 내보내는지 테스트
+    """
+    # Arrange
+    users = await create_users(db_session, [f"export{i}" for i in range(3)])
+    await crud.deactivate_user(db=db_session, db_user=users[0])
+
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/export",
+        params={"columns": "id,email", "is_active": "true"},
+        headers=admin_headers,
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 3  # 관리자 1명 + 활성 사용자 2명
+    assert all(set(line) == {"id", "email"} for line in lines)
+    assert users[0].id not in {line["id"] for line in lines}
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv(
+    async_client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+):
+    """
+    CSV 형식으로 헤더와 함께 내보내는지 테스트
+    """
+    # Arrange
+    await create_users(db_session, [f"export{i}" for i in range(2)])
+
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/export",
+        params={"format": "csv", "columns": "username,created_at"},
+        headers=admin_headers,
+    )
+
+    # Assert
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["username", "created_at"]
+    assert len(rows) == 4
+    assert "hashed_password" not in response.text
+
+
+@pytest.mark.asyncio
+async def test_export_users_rejects_unknown_column(
+    async_client: AsyncClient, admin_headers: dict
+):
+    """
+    내보낼 수 없는 컬럼을 요청하면 400을 반환하는지 테스트
+    """
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/export",
+        params={"columns": "id,hashed_password"},
+        headers=admin_headers,
+    )
+
+    # Assert
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_users_forbidden_for_non_admin(
+    async_client: AsyncClient, user_fixture: User
+):
+    """
+    관리자가 아닌 사용자는 내보내기를 할 수 없는지 테스트
+    """
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/export", headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_users_streams_in_batches(db_session: AsyncSession):
+    """
+    batch_size개 행씩 나누어 인코딩해 반환하는지 테스트
+    """
+    # Arrange
+    await create_users(db_session, [f"export{i}" for i in range(5)])
+
+    # Act
+    chunks = [
+        chunk
+        async for chunk in export.export_users(
+            session_factory=TestAsyncSessionLocal,
+            export_format="ndjson",
+            columns=["id"],
+            batch_size=2,
+        )
+    ]
+
+    # Assert
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
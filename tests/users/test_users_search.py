@@ -0,0 +1,152 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from src.db.instrumentation import track_queries
+from src.users import crud
+from src.users.models import User
+from tests.conftest import auth_headers, create_users
+
+
+@pytest.mark.asyncio
+async def test_search_users_by_prefix(db_session: AsyncSession):
+    """
+    접두사로 시작하는 활성 사용자만 대소문자 구분 없이 사용자 이름 순으로 조회하는지 테스트
+    """
+    # Arrange
+    users = await create_users(
+        db_session, ["anna_k", "Annabel", "anne", "ann_inactive", "bob", "amy"]
+    )
+    users[3].is_active = False
+    await db_session.commit()
+
+    # Act
+    found = await crud.search_users_by_prefix(db=db_session, prefix="ANN", limit=10)
+    limited = await crud.search_users_by_prefix(db=db_session, prefix="ann", limit=2)
+
+    # Assert
+    assert [user.username for user in found] == ["anna_k", "Annabel", "anne"]
+    assert [user.username for user in limited] == ["anna_k", "Annabel"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        ("liz", ["liz", "liz_b", "lizzy"]),
+        ("user9", ["user9", "user99"]),
+        ("bob_", ["bob_1", "bob_x"]),
+    ],
+)
+async def test_search_users_by_prefix_boundary_characters(
+    db_session: AsyncSession, prefix: str, expected: list[str]
+):
+    """
+    'z', '9', '_'처럼 다음 글자가 구두점인 문자로 끝나는 접두사도 검색되는지 테스트
+    """
+    # Arrange
+    await create_users(
+        db_session,
+        ["liz", "liz_b", "lizzy", "lia", "user9", "user99", "user8", "bob_1", "bob_x"]
+        + ["bobby"],
+    )
+
+    # Act
+    found = await crud.search_users_by_prefix(db=db_session, prefix=prefix, limit=10)
+
+    # Assert
+    assert [user.username for user in found] == expected
+
+
+def test_username_normalized_uses_binary_collation_on_mysql():
+    """
+    MySQL에서 username_normalized 컬럼이 코드 포인트 순으로 비교되는 바이너리 콜레이션인지 테스트
+    """
+    # Act
+    ddl = str(CreateTable(User.__table__).compile(dialect=mysql.dialect()))
+
+    # Assert
+    column = next(line for line in ddl.splitlines() if "username_normalized" in line)
+    assert "COLLATE utf8mb4_bin" in column
+
+
+@pytest.mark.asyncio
+async def test_search_users_uses_index_range(
+    db_session: AsyncSession, user_fixture: User
+):
+    """
+    접두사 검색이 전체 테이블 스캔 없이 username_normalized 인덱스 범위 조회를 사용하는지 테스트
+    """
+    # Arrange
+    with track_queries() as stats:
+        await crud.search_users_by_prefix(db=db_session, prefix="test", limit=10)
+    statement = stats.statements[-1]
+
+    # Act
+    conn = await db_session.connection()
+    result = await conn.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", ("test", "tesu", 10, 0)
+    )
+    plan = " ".join(str(row[-1]) for row in result)
+
+    # Assert
+    assert "ix_users_username_normalized" in plan
+    assert "username_normalized>? AND username_normalized<?" in plan
+    assert "SCAN users" not in plan
+
+
+@pytest.mark.asyncio
+async def test_search_users_endpoint(
+    async_client: AsyncClient, db_session: AsyncSession, user_fixture: User
+):
+    """
+    로그인한 사용자가 검색 API로 공개 프로필 정보만 조회하는지 테스트
+    """
+    # Arrange
+    await create_users(db_session, ["tester2", "other"])
+
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/search",
+        params={"prefix": "Test", "limit": 5},
+        headers=auth_headers(user_fixture),
+    )
+
+    # Assert
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["username"] for item in body] == ["tester2", "testuser"]
+    assert set(body[0]) == {"id", "username", "profile_image_path"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params", [{}, {"prefix": ""}, {"prefix": "a", "limit": 51}, {"prefix": "a" * 51}]
+)
+async def test_search_users_endpoint_validates_query(
+    async_client: AsyncClient, user_fixture: User, params: dict
+):
+    """
+    접두사가 없거나 비어 있거나 너무 길 때, limit이 범위를 벗어날 때 422를 반환하는지 테스트
+    """
+    # Act
+    response = await async_client.get(
+        "/api/v1/users/search", params=params, headers=auth_headers(user_fixture)
+    )
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_users_endpoint_requires_login(async_client: AsyncClient):
+    """
+    로그인하지 않은 사용자는 검색할 수 없는지 테스트
+    """
+    # Act
+    response = await async_client.get("/api/v1/users/search", params={"prefix": "a"})
+
+    # Assert
+    assert response.status_code == 401
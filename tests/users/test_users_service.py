@@ -1,9 +1,14 @@
+import uuid
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import Column, DateTime, MetaData, Table, create_engine, select, tuple_
 
+from src.common.pagination import encode_cursor
 from src.core.security import hash_password, verify_password
+from src.db.types import BinaryUUID
 from src.users import models, schemas, service
 
 
@@ -300,3 +305,144 @@ async def test_update_password_failure():
 
     assert exc_info.value.status_code == 403
     assert exc_info.value.detail == "비밀번호 수정 권한이 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_tokens_success(mocker):
+    """
+    모든 토큰 폐기 성공 테스트
+    """
+    # Arrange
+    mock_db = AsyncMock()
+    db_user = models.User(id="uuid", token_version=0)
+    mock_bump = mocker.patch(
+        "src.users.crud.bump_token_version",
+        return_value=models.User(id="uuid", token_version=1),
+    )
+
+    # Act
+    result = await service.revoke_all_tokens(
+        db=mock_db, db_user=db_user, current_user=db_user
+    )
+
+    # Assert
+    mock_bump.assert_called_once_with(db=mock_db, db_user=db_user)
+    assert result.token_version == 1
+
+
+@pytest.mark.asyncio
+async def test_revoke_all_tokens_failure():
+    """
+    다른 사용자의 토큰 폐기 실패 테스트
+    """
+    # Arrange
+    mock_db = AsyncMock()
+    db_user = models.User(id="uuid")
+    current_user = models.User(id="uuid_diff", is_admin=False)
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await service.revoke_all_tokens(
+            db=mock_db, db_user=db_user, current_user=current_user
+        )
+
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "다른 사용자의 토큰을 폐기할 권한이 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_returns_next_cursor(mocker):
+    """
+    다음 페이지가 있으면 마지막 사용자로 next_cursor를 만들고, 이를 다시 키로 해석하는지 테스트
+    """
+    # Arrange
+    mock_db = AsyncMock()
+    admin = models.User(id="admin", is_admin=True)
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    ids = {i: str(uuid.UUID(int=i)) for i in (3, 2, 1)}
+    users = [
+        models.User(
+            id=ids[i],
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            is_active=True,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        for i in (3, 2, 1)
+    ]
+    mock_crud = mocker.patch("src.users.crud.get_users_by_cursor", return_value=users)
+    mocker.patch(
+        "src.users.service.user_counts.get",
+        return_value=schemas.UserCounts(total=3, active=3, inactive=0, admins=0),
+    )
+
+    # Act
+    first_page = await service.get_all_users(db=mock_db, current_user=admin, limit=2)
+    await service.get_all_users(
+        db=mock_db, current_user=admin, cursor=first_page.next_cursor, limit=2
+    )
+
+    # Assert
+    assert [user.id for user in first_page.items] == [ids[3], ids[2]]
+    assert first_page.total == 3
+    assert mock_crud.call_args_list[0].kwargs["limit"] == 3  # 다음 페이지 확인용 1건
+    assert mock_crud.call_args_list[1].kwargs["after"] == (created_at, ids[2])
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_invalid_cursor():
+    """
+    유효하지 않은 커서로 조회하면 400 예외가 발생하는지 테스트
+    """
+    # Arrange
+    admin = models.User(id="admin", is_admin=True)
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_all_users(
+            db=AsyncMock(), current_user=admin, cursor="not-a-cursor"
+        )
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_rejects_non_uuid_cursor_with_binary_ids(mocker):
+    """
+    ID를 바이너리로 저장할 때 UUID가 아닌 ID를 담은 커서가 바인딩 오류(500) 대신 400으로 거부되는지 테스트
+    """
+    # Arrange - 바이너리 ID 컬럼에 커서 조건을 그대로 바인딩하는 crud
+    table = Table(
+        "users",
+        MetaData(),
+        Column("id", BinaryUUID(), primary_key=True),
+        Column("created_at", DateTime()),
+    )
+    engine = create_engine("sqlite://")
+    table.metadata.create_all(engine)
+
+    async def get_users_by_cursor(db, after, limit):
+        query = select(table).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(table.c.created_at, table.c.id) < after)
+        with engine.connect() as conn:
+            return conn.execute(query).all()
+
+    mocker.patch("src.users.crud.get_users_by_cursor", get_users_by_cursor)
+    mocker.patch(
+        "src.users.service.user_counts.get",
+        return_value=schemas.UserCounts(total=0, active=0, inactive=0, admins=0),
+    )
+    admin = models.User(id="admin", is_admin=True)
+    created_at = datetime(2024, 1, 1).isoformat()
+    forged = encode_cursor([created_at, "not-a-uuid"])
+    valid = encode_cursor([created_at, str(uuid.UUID(int=1)).upper()])
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_all_users(db=AsyncMock(), current_user=admin, cursor=forged)
+    page = await service.get_all_users(db=AsyncMock(), current_user=admin, cursor=valid)
+
+    # Assert
+    assert exc_info.value.status_code == 400
+    assert page.items == []